@@ -1,11 +1,15 @@
 """
 Event System - Core Infrastructure
 Implements Producer-Consumer pattern with Event Bus.
+Events are dispatched in-line by default, or queued and drained from the
+Qt event loop; bursty event types are coalesced to the latest event.
 """
+import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from enum import Enum
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 class EventType(Enum):
     """All event types in the system."""
@@ -14,12 +18,14 @@ class EventType(Enum):
     MEMBER_UPDATED = "member.updated"
     MEMBER_DELETED = "member.deleted"
     MEMBER_SEARCH = "member.search"
+    MEMBERS_IMPORTED = "member.imported"
     
     # Cycle events
     CYCLE_CREATED = "cycle.created"
     CYCLE_UPDATED = "cycle.updated"
     CYCLE_DELETED = "cycle.deleted"
     CYCLE_STATUS_CHANGED = "cycle.status_changed"
+    CYCLE_ARCHIVED = "cycle.archived"
     
     # Bidding events
     BID_PLACED = "bid.placed"
@@ -29,6 +35,10 @@ class EventType(Enum):
     PAYMENT_MADE = "payment.made"
     COLLECTION_EXECUTED = "collection.executed"
     
+    # Storage events
+    SAVE_COMPLETED = "storage.save_completed"
+    SAVE_FAILED = "storage.save_failed"
+    
     # UI events
     DATA_REFRESH_REQUESTED = "ui.refresh_requested"
     NOTIFICATION_SHOW = "ui.notification_show"
@@ -40,18 +50,52 @@ class Event:
     data: Any = None
     source: str = None
 
+# Coalescing window (ms) for search-as-you-type. Opt-in through set_coalescing:
+# a coalesced event is only dispatched from the Qt event loop.
+SEARCH_COALESCE_MS = 300
+
+@dataclass
+class HandlerStats:
+    """Execution time of one handler for one event type."""
+    event_type: EventType
+    handler: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    errors: int = 0
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+def _handler_name(handler: Callable) -> str:
+    module = getattr(handler, '__module__', None)
+    name = getattr(handler, '__qualname__', None) or repr(handler)
+    return f"{module}.{name}" if module else name
+
 class EventBus(QObject):
     """
     Central Event Bus using Qt Signals.
     Producers emit events, Consumers subscribe to events.
+    In queued mode publish() returns immediately and subscribers run when
+    the Qt event loop drains the queue (or on process_pending()).
     """
     
     # Qt Signal for event emission
     event_emitted = pyqtSignal(object)
     
-    def __init__(self):
+    def __init__(self, queued: bool = False):
         super().__init__()
         self._subscribers = {}
+        self.queued = queued
+        self._queue: Deque[Event] = deque()
+        self._coalesce_ms: Dict[EventType, int] = {}
+        self._coalesced: Dict[EventType, Tuple[float, Event]] = {} # type -> (deadline, latest event)
+        self._stats: Dict[Tuple[EventType, str], HandlerStats] = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(lambda: self.process_pending(force=False))
     
     def subscribe(self, event_type: EventType, handler: Callable[[Event], None]):
         """
@@ -73,27 +117,105 @@ class EventBus(QObject):
             if handler in self._subscribers[event_type]:
                 self._subscribers[event_type].remove(handler)
     
-    def publish(self, event: Event):
+    def set_coalescing(self, event_type: EventType, window_ms: Optional[int]):
+        """Coalesce an event type over `window_ms` (None or 0 dispatches every event)."""
+        if window_ms:
+            self._coalesce_ms[event_type] = window_ms
+        else:
+            self._coalesce_ms.pop(event_type, None)
+
+    def publish(self, event: Event, queued: Optional[bool] = None):
         """
         Publish an event to all subscribers.
         
         Args:
             event: Event to publish
+            queued: Defer dispatch to the event loop (default: the bus mode)
         """
         # Emit Qt signal (for cross-thread safety)
         self.event_emitted.emit(event)
-        
-        # Call subscribers directly (same thread)
-        if event.type in self._subscribers:
-            for handler in self._subscribers[event.type]:
-                try:
-                    handler(event)
-                except Exception as e:
-                    print(f"Error in event handler for {event.type}: {e}")
+
+        window_ms = self._coalesce_ms.get(event.type)
+        if window_ms:
+            # Keep only the latest event; the window starts at the first pending one
+            pending = self._coalesced.get(event.type)
+            deadline = pending[0] if pending else time.monotonic() + window_ms / 1000
+            self._coalesced[event.type] = (deadline, event)
+            self._schedule()
+        elif (self.queued if queued is None else queued):
+            self._queue.append(event)
+            self._schedule()
+        else:
+            # Call subscribers directly (same thread)
+            self._dispatch(event)
+
+    def process_pending(self, force: bool = True) -> int:
+        """
+        Dispatch queued events, and coalesced events whose window has ended
+        (all of them with force). Returns the number of events dispatched.
+        """
+        dispatched = 0
+        while self._queue:
+            self._dispatch(self._queue.popleft())
+            dispatched += 1
+
+        now = time.monotonic()
+        due = [t for t, (deadline, _) in self._coalesced.items() if force or deadline <= now]
+        for event_type in due:
+            _, event = self._coalesced.pop(event_type)
+            self._dispatch(event)
+            dispatched += 1
+
+        self._schedule()
+        return dispatched
+
+    def pending_count(self) -> int:
+        return len(self._queue) + len(self._coalesced)
+
+    def _schedule(self):
+        """Arm the timer for the next queued or coalesced event."""
+        if self._queue:
+            delay_ms = 0
+        elif self._coalesced:
+            next_deadline = min(deadline for deadline, _ in self._coalesced.values())
+            delay_ms = max(0, int((next_deadline - time.monotonic()) * 1000))
+        else:
+            self._timer.stop()
+            return
+        self._timer.start(delay_ms)
+
+    def _dispatch(self, event: Event):
+        """Call every subscriber of the event, timing each handler."""
+        for handler in list(self._subscribers.get(event.type, ())):
+            name = _handler_name(handler)
+            stats = self._stats.get((event.type, name))
+            if stats is None:
+                stats = self._stats[(event.type, name)] = HandlerStats(event.type, name)
+            started = time.perf_counter()
+            try:
+                handler(event)
+            except Exception as e:
+                stats.errors += 1
+                print(f"Error in event handler for {event.type}: {e}")
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats.calls += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+    def get_handler_stats(self) -> List[HandlerStats]:
+        """Per-handler execution times, slowest (by total time) first."""
+        return sorted(self._stats.values(), key=lambda s: s.total_ms, reverse=True)
+
+    def reset_handler_stats(self):
+        self._stats.clear()
     
     def clear_all(self):
-        """Clear all subscribers (for testing)."""
+        """Clear all subscribers, pending events and stats (for testing)."""
         self._subscribers.clear()
+        self._queue.clear()
+        self._coalesced.clear()
+        self._stats.clear()
+        self._timer.stop()
 
 _event_bus = None
 
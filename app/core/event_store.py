@@ -0,0 +1,274 @@
+"""
+Event Store - Consumer
+Event-sourced persistence: every published domain event is appended to a
+JSON-lines log, and AppState is rebuilt by replaying the log over the
+latest snapshot. Saving only appends the events recorded since the last
+save; a snapshot is written every `snapshot_every` events.
+
+The log starts with the full initial state, so it alone replays the
+complete history. State changes must be published as domain events to be
+persisted by this backend.
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from app.core.event_bus import get_event_bus, Event, EventType
+from app.models.app_state import AppState
+from app.models.archive_summary import ArchiveSummary
+from app.models.audit_log import AuditLog
+from app.models.hui_group import HuiGroup
+from app.models.member import Member
+from app.models.transaction import Transaction
+from app.utils.atomic_write import read_json_lines, write_json_atomic
+
+EVENTS_FILE = "data.events"
+EVENTS_SNAPSHOT_FILE = "data.events.snapshot"
+SNAPSHOT_EVERY = 500 # Events between snapshots
+INITIALIZED = "store.initialized" # First record: the full initial state
+
+def _entity(data, key: str):
+    """Events carry either the entity itself or a dict holding it under `key`."""
+    return data[key] if isinstance(data, dict) else data
+
+def _member_dict(member: Member) -> dict:
+    return dict(member.to_dict())
+
+def _group_dict(group: HuiGroup) -> dict:
+    return {**group.to_dict(), 'members': list(group.members)}
+
+# Domain event -> JSON payload, captured when the event is published
+SERIALIZERS: Dict[EventType, Callable[[Event], dict]] = {
+    EventType.MEMBER_CREATED: lambda e: {'member': _member_dict(_entity(e.data, 'member'))},
+    EventType.MEMBER_UPDATED: lambda e: {'member': _member_dict(_entity(e.data, 'member'))},
+    EventType.MEMBER_DELETED: lambda e: {'id': _entity(e.data, 'member').id},
+    EventType.MEMBERS_IMPORTED: lambda e: {'members': [_member_dict(m) for m in e.data['members']]},
+    EventType.CYCLE_CREATED: lambda e: {
+        'group': _group_dict(e.data['group']),
+        'transactions': [t.to_dict() for t in e.data.get('transactions', ())]
+    },
+    EventType.CYCLE_UPDATED: lambda e: {'group': _group_dict(e.data['group'])},
+    EventType.CYCLE_STATUS_CHANGED: lambda e: {'group': _group_dict(e.data['group'])},
+    EventType.CYCLE_DELETED: lambda e: {'id': e.data['group'].id},
+    EventType.CYCLE_ARCHIVED: lambda e: {'id': e.data['group'].id, 'summary': dict(e.data['summary'].to_dict())},
+    EventType.PAYMENT_MADE: lambda e: {
+        'transaction': e.data['transaction'].to_dict(),
+        'auditLog': e.data['auditLog'].to_dict() if e.data.get('auditLog') else None
+    },
+}
+SERIALIZERS[EventType.COLLECTION_EXECUTED] = SERIALIZERS[EventType.PAYMENT_MADE]
+
+class _Replayer:
+    """
+    Applies event records to an AppState. Each record is applied exactly once:
+    callers skip records up to the snapshot's seq, so entity ids are not used
+    to detect duplicates (two records may legitimately carry the same id).
+    """
+
+    def __init__(self, state: AppState):
+        self.state = state
+
+    def apply(self, record: dict):
+        kind, data = record['type'], record['data']
+        if kind in (EventType.MEMBER_CREATED.value, EventType.MEMBER_UPDATED.value):
+            self._upsert(self.state.members, Member.from_dict(data['member']))
+        elif kind == EventType.MEMBER_DELETED.value:
+            self._delete(self.state.members, data['id'])
+        elif kind == EventType.MEMBERS_IMPORTED.value:
+            self._upsert_all(self.state.members, [Member.from_dict(m) for m in data['members']])
+        elif kind in (EventType.CYCLE_CREATED.value, EventType.CYCLE_UPDATED.value,
+                      EventType.CYCLE_STATUS_CHANGED.value):
+            self._upsert(self.state.groups, HuiGroup.from_dict(data['group']))
+            for t in data.get('transactions', ()):
+                self._add_transaction(t)
+        elif kind == EventType.CYCLE_DELETED.value:
+            self._delete(self.state.groups, data['id'])
+        elif kind == EventType.CYCLE_ARCHIVED.value:
+            group_id = data['id']
+            self._delete(self.state.groups, group_id)
+            self.state.transactions[:] = [t for t in self.state.transactions if t.huiGroupId != group_id]
+            self.state.auditLogs[:] = [l for l in self.state.auditLogs if l.huiGroupId != group_id]
+            self.state.history_rewritten()
+            self._upsert(self.state.archives, ArchiveSummary.from_dict(data['summary']))
+        elif kind in (EventType.PAYMENT_MADE.value, EventType.COLLECTION_EXECUTED.value):
+            self._add_transaction(data['transaction'])
+            log = data.get('auditLog')
+            if log:
+                self.state.auditLogs.append(AuditLog.from_dict(log))
+
+    def _add_transaction(self, data: dict):
+        self.state.transactions.append(Transaction.from_dict(data))
+
+    @staticmethod
+    def _upsert(items: list, new_item):
+        for i, item in enumerate(items):
+            if item.id == new_item.id:
+                items[i] = new_item
+                return
+        items.append(new_item)
+
+    @staticmethod
+    def _upsert_all(items: list, new_items: list):
+        """_upsert for a batch, with one index of the list instead of a scan per item."""
+        positions = {item.id: i for i, item in enumerate(items)}
+        for new_item in new_items:
+            i = positions.get(new_item.id)
+            if i is None:
+                positions[new_item.id] = len(items)
+                items.append(new_item)
+            else:
+                items[i] = new_item
+
+    @staticmethod
+    def _delete(items: list, item_id: str):
+        items[:] = [item for item in items if item.id != item_id]
+
+class EventStore:
+    """
+    Append-only domain event log with periodic snapshots.
+    Events are captured on the publishing (UI) thread and written by write(),
+    which may run on the save worker thread.
+    """
+
+    def __init__(self, events_path: str = EVENTS_FILE, snapshot_path: str = EVENTS_SNAPSHOT_FILE,
+                 snapshot_every: int = SNAPSHOT_EVERY):
+        self.events_path = events_path
+        self.snapshot_path = snapshot_path
+        self.snapshot_every = snapshot_every
+        self.seq = 0
+        self.state: Optional[AppState] = None # Live state, snapshotted every `snapshot_every` events
+        self._lock = threading.Lock()
+        self._pending: List[dict] = []
+        self._pending_snapshot: Optional[Tuple[int, AppState]] = None
+        self._since_snapshot = 0
+        self._subscribed = False
+
+    # --- Capturing ---
+
+    def subscribe(self):
+        """Record domain events published on the global bus."""
+        if not self._subscribed:
+            for event_type in SERIALIZERS:
+                get_event_bus().subscribe(event_type, self.record)
+            self._subscribed = True
+
+    def close(self):
+        """Unsubscribe from the event bus."""
+        if self._subscribed:
+            for event_type in SERIALIZERS:
+                get_event_bus().unsubscribe(event_type, self.record)
+            self._subscribed = False
+
+    def record(self, event: Event):
+        """Capture a domain event; it is persisted by the next write()."""
+        data = SERIALIZERS[event.type](event)
+        with self._lock:
+            self.seq += 1
+            self._pending.append({
+                'seq': self.seq,
+                'type': event.type.value,
+                'source': event.source,
+                'timestamp': datetime.now().isoformat(),
+                'data': data
+            })
+            self._since_snapshot += 1
+            if self.state is not None and self._since_snapshot >= self.snapshot_every:
+                # Events are published after the change, so the live state matches seq
+                self._pending_snapshot = (self.seq, self.state.snapshot())
+                self._since_snapshot = 0
+
+    # --- Loading ---
+
+    def load(self, default_factory: Callable[[], AppState]) -> AppState:
+        """Rebuild the state from the latest snapshot and the events after it."""
+        snapshot_seq = 0
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            state = AppState.from_dict(data['state'])
+            snapshot_seq = data['seq']
+        else:
+            state = None
+
+        # Drop a torn last line now, before the next write appends after it
+        records = self.read_records(repair=True)
+        if state is None:
+            if not records:
+                # New store: the initial state is the first record
+                state = default_factory()
+                self._write_records([self._initialized_record(state)])
+            elif records[0]['type'] == INITIALIZED:
+                state = AppState.from_dict(records[0]['data'])
+            else:
+                raise ValueError(f"{self.events_path} does not start with the initial state")
+
+        replayer = _Replayer(state)
+        self.seq = snapshot_seq
+        for record in records:
+            if record['type'] == INITIALIZED or record['seq'] <= snapshot_seq:
+                self.seq = max(self.seq, record['seq'])
+                continue
+            replayer.apply(record)
+            self.seq = record['seq']
+        self._since_snapshot = self.seq - snapshot_seq
+        self.state = state
+        return state
+
+    def read_records(self, repair: bool = False) -> List[dict]:
+        """
+        Every record of the log, in order (the complete history), up to a
+        torn last line. `repair` truncates the file to the intact records.
+        """
+        if not os.path.exists(self.events_path):
+            return []
+        return read_json_lines(self.events_path, repair)
+
+    @staticmethod
+    def replay(records: List[dict], until_seq: Optional[int] = None) -> AppState:
+        """State as of `until_seq` (default: the end), replayed from the initial state."""
+        if not records or records[0]['type'] != INITIALIZED:
+            raise ValueError("Event log does not start with the initial state")
+        state = AppState.from_dict(records[0]['data'])
+        replayer = _Replayer(state)
+        for record in records[1:]:
+            if until_seq is not None and record['seq'] > until_seq:
+                break
+            replayer.apply(record)
+        return state
+
+    # --- Saving ---
+
+    def _initialized_record(self, state: AppState) -> dict:
+        return {'seq': 0, 'type': INITIALIZED, 'source': 'EventStore',
+                'timestamp': datetime.now().isoformat(), 'data': state.to_dict()}
+
+    def _write_records(self, records: List[dict]):
+        lines = [json.dumps(r, ensure_ascii=False) + "\n" for r in records]
+        with open(self.events_path, 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_snapshot(self, seq: int, state: AppState):
+        write_json_atomic(self.snapshot_path, {'seq': seq, 'state': state.to_dict()})
+
+    def write(self) -> int:
+        """Append the captured events (and a due snapshot). Returns the number of events written."""
+        with self._lock:
+            records, self._pending = self._pending, []
+            snapshot, self._pending_snapshot = self._pending_snapshot, None
+        if records:
+            self._write_records(records)
+        if snapshot is not None:
+            self._write_snapshot(*snapshot)
+        return len(records)
+
+    def checkpoint(self, state: AppState):
+        """Write pending events and a snapshot of `state` (call from the thread that owns it)."""
+        self.write()
+        with self._lock:
+            seq = self.seq
+            self._since_snapshot = 0
+            self._pending_snapshot = None
+        self._write_snapshot(seq, state)
@@ -0,0 +1,118 @@
+"""
+Save Worker - Background persistence
+Takes immutable snapshots from the UI thread, coalesces bursts of save
+requests and writes them on a dedicated writer thread.
+"""
+import threading
+import time
+from typing import Callable, Optional
+from PyQt6.QtCore import QObject, pyqtSignal
+from app.core.event_bus import get_event_bus, Event, EventType
+from app.models.app_state import AppState
+
+DEFAULT_DEBOUNCE_MS = 500
+
+class SaveWorker(QObject):
+    """
+    Writer thread for AppState snapshots.
+    Requests arriving within `debounce_ms` of the first unsaved request are
+    coalesced into a single write of the latest snapshot. Completion and
+    failure are published on the event bus (from the UI thread).
+    """
+
+    # Emitted from the writer thread; delivered on the thread owning this object
+    save_finished = pyqtSignal(object)
+
+    def __init__(self, writer: Optional[Callable[[AppState], None]] = None,
+                 debounce_ms: int = DEFAULT_DEBOUNCE_MS):
+        super().__init__()
+        if writer is None:
+            from storage import write_data
+            writer = write_data
+        self.writer = writer
+        self.debounce_ms = debounce_ms
+
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._pending: Optional[AppState] = None
+        self._requests = 0
+        self._deadline = 0.0
+        self._stopping = False
+
+        self.save_finished.connect(self._on_save_finished)
+        self._thread = threading.Thread(target=self._run, name="SaveWorker", daemon=True)
+        self._thread.start()
+
+    def request_save(self, state: AppState):
+        """Queue a save of the current state; returns immediately."""
+        snapshot = state.snapshot()
+        with self._cond:
+            if self._pending is None:
+                self._deadline = time.monotonic() + self.debounce_ms / 1000
+            self._pending = snapshot
+            self._requests += 1
+            self._cond.notify()
+
+    def flush(self):
+        """Write any pending snapshot now, on the calling thread."""
+        with self._cond:
+            snapshot, requests = self._take_pending()
+        if snapshot is not None:
+            self._write(snapshot, requests)
+
+    def stop(self):
+        """
+        Stop the writer thread, then write what is still pending. Joining
+        first ensures a write in progress finishes before the final one, so
+        an older snapshot never lands on disk after a newer one.
+        """
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+
+    def _take_pending(self):
+        snapshot, requests = self._pending, self._requests
+        self._pending, self._requests = None, 0
+        return snapshot, requests
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                # Let a burst of requests collapse into one write
+                while self._pending is not None and not self._stopping:
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._stopping:
+                    return # stop() flushes the pending snapshot
+                snapshot, requests = self._take_pending()
+            if snapshot is not None:
+                self._write(snapshot, requests)
+
+    def _write(self, snapshot: AppState, requests: int):
+        with self._write_lock:
+            started = time.perf_counter()
+            try:
+                self.writer(snapshot)
+            except Exception as e:
+                self.save_finished.emit(Event(
+                    type=EventType.SAVE_FAILED,
+                    data={'error': str(e), 'requests': requests},
+                    source='SaveWorker'
+                ))
+                return
+            self.save_finished.emit(Event(
+                type=EventType.SAVE_COMPLETED,
+                data={'requests': requests, 'duration_ms': (time.perf_counter() - started) * 1000},
+                source='SaveWorker'
+            ))
+
+    def _on_save_finished(self, event: Event):
+        get_event_bus().publish(event)
@@ -1,9 +1,13 @@
 from dataclasses import dataclass, field
 from typing import List
 from app.models.member import Member
+from app.models.member_registry import MemberRegistry
 from app.models.hui_group import HuiGroup
 from app.models.transaction import Transaction
 from app.models.audit_log import AuditLog
+from app.models.archive_summary import ArchiveSummary
+from app.models.ledger_index import LedgerIndex
+from app.models.transaction_store import TransactionStore
 
 @dataclass
 class AppState:
@@ -11,6 +15,57 @@ class AppState:
     groups: List[HuiGroup] = field(default_factory=list)
     transactions: List[Transaction] = field(default_factory=list)
     auditLogs: List[AuditLog] = field(default_factory=list)
+    archives: List[ArchiveSummary] = field(default_factory=list)
+    # Bumped when the history lists are rewritten in place rather than appended to (not persisted)
+    revision: int = field(default=0, repr=False, compare=False)
+    _ledger: LedgerIndex = field(default_factory=LedgerIndex, init=False, repr=False, compare=False)
+    _store: TransactionStore = field(default_factory=TransactionStore, init=False, repr=False, compare=False)
+    _registry: MemberRegistry = field(default_factory=MemberRegistry, init=False, repr=False, compare=False)
+
+    @property
+    def ledger(self) -> LedgerIndex:
+        """Transaction index, caught up with any rows appended to `transactions`."""
+        return self._ledger.sync(self.transactions)
+
+    @property
+    def store(self) -> TransactionStore:
+        """Columnar copy of `transactions` for aggregate queries."""
+        return self._store.sync(self.transactions)
+
+    @property
+    def registry(self) -> MemberRegistry:
+        """Member id/phone lookups, caught up with members appended to `members`."""
+        return self._registry.sync(self.members)
+
+    def add_transaction(self, transaction: Transaction):
+        """Append a transaction and index it."""
+        self.transactions.append(transaction)
+        self._ledger.sync(self.transactions)
+
+    def history_rewritten(self):
+        """
+        Call after editing `transactions`/`auditLogs` other than by appending
+        (e.g. archiving): indexes rebuild and storage rewrites instead of
+        appending the rows past the last saved count.
+        """
+        self.revision += 1
+        self._ledger.invalidate()
+        self._store.invalidate()
+
+    def snapshot(self) -> 'AppState':
+        """
+        Copy that can be handed to another thread.
+        Members and groups are copied; transactions and audit logs are
+        append-only, so only the lists are copied (lazy sections stay encoded).
+        """
+        return AppState(
+            members=[Member.from_dict(dict(m.to_dict())) for m in self.members],
+            groups=[HuiGroup.from_dict({**g.to_dict(), 'members': list(g.members)}) for g in self.groups],
+            transactions=self.transactions.copy(),
+            auditLogs=self.auditLogs.copy(),
+            archives=list(self.archives),
+            revision=self.revision
+        )
 
     @classmethod
     def from_dict(cls, data):
@@ -18,7 +73,8 @@ class AppState:
             members=[Member.from_dict(m) for m in data.get('members', [])],
             groups=[HuiGroup.from_dict(g) for g in data.get('groups', [])],
             transactions=[Transaction.from_dict(t) for t in data.get('transactions', [])],
-            auditLogs=[AuditLog.from_dict(l) for l in data.get('auditLogs', [])]
+            auditLogs=[AuditLog.from_dict(l) for l in data.get('auditLogs', [])],
+            archives=[ArchiveSummary.from_dict(a) for a in data.get('archives', [])]
         )
 
     def to_dict(self):
@@ -26,5 +82,6 @@ class AppState:
             'members': [m.to_dict() for m in self.members],
             'groups': [g.to_dict() for g in self.groups],
             'transactions': [t.to_dict() for t in self.transactions],
-            'auditLogs': [l.to_dict() for l in self.auditLogs]
+            'auditLogs': [l.to_dict() for l in self.auditLogs],
+            'archives': [a.to_dict() for a in self.archives]
         }
@@ -0,0 +1,37 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+from app.models.money import Money, to_money
+
+@dataclass
+class ArchiveSummary:
+    id: str # Archived HuiGroup id
+    name: str
+    type: str # HuiType value
+    amountPerShare: Money
+    archivedAt: str
+    segmentFile: str # Archive segment holding the group, its transactions and audit logs
+    members: List[str] = field(default_factory=list) # Slot member IDs, for statement lookups
+    transactionCount: int = 0
+    auditLogCount: int = 0
+    totalContributed: Money = 0 # Sum of CONTRIBUTE amounts
+    totalCollected: Money = 0 # Sum of COLLECT payouts (netAmount, else amount)
+    totalCommission: Money = 0 # Commission earned over all collected periods
+    memberDebts: Dict[str, Money] = field(default_factory=dict) # Debt still owed per member when archived
+
+    def __post_init__(self):
+        self.amountPerShare = to_money(self.amountPerShare)
+        self.totalContributed = to_money(self.totalContributed)
+        self.totalCollected = to_money(self.totalCollected)
+        self.totalCommission = to_money(self.totalCommission)
+        self.memberDebts = {m: to_money(d) for m, d in (self.memberDebts or {}).items()}
+
+    @property
+    def totalBadDebt(self) -> Money:
+        return sum(self.memberDebts.values())
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def to_dict(self):
+        return self.__dict__
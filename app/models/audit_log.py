@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class AuditLog:
     id: str
     timestamp: str
@@ -13,10 +13,24 @@ class AuditLog:
     resultCalculated: dict
     ai_context: Optional[dict] = None
     aiAnalysis: Optional[str] = None
+    huiGroupId: Optional[str] = None
 
     @classmethod
     def from_dict(cls, data):
         return cls(**data)
 
     def to_dict(self):
-        return self.__dict__
+        # Slotted: no instance __dict__, build a fresh one
+        return {
+            'id': self.id,
+            'timestamp': self.timestamp,
+            'action': self.action,
+            'userId': self.userId,
+            'scenario': self.scenario,
+            'stateBefore': self.stateBefore,
+            'inputParameters': self.inputParameters,
+            'resultCalculated': self.resultCalculated,
+            'ai_context': self.ai_context,
+            'aiAnalysis': self.aiAnalysis,
+            'huiGroupId': self.huiGroupId,
+        }
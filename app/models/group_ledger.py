@@ -0,0 +1,98 @@
+"""
+Group Ledger
+Materialized per-period table of one HuiGroup: winner and bid, COLLECTs and
+what each member paid in every period. Updated one transaction at a time,
+so finance lookups for a period are O(1) and a contribution plan is O(members).
+"""
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.models.money import Money
+from app.models.transaction import Transaction
+
+class PeriodEntry:
+    """One row of the per-period table."""
+    __slots__ = ('period', 'winner', 'collects', 'paid')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.winner: Optional[Transaction] = None # First COLLECT recorded for the period
+        self.collects: List[Transaction] = []
+        self.paid: Dict[str, Money] = defaultdict(int) # member -> CONTRIBUTE total
+
+    @property
+    def bid(self) -> Money:
+        return (self.winner.bidAmount or 0) if self.winner else 0
+
+class GroupLedger:
+    """
+    Per-period table of a single group.
+    `version` increases with every transaction added, so caches derived from
+    the table can tell whether it changed.
+    """
+
+    def __init__(self, group_id: str):
+        self.group_id = group_id
+        self.version = 0
+        self.transactions: List[Transaction] = []
+        self._periods: Dict[int, PeriodEntry] = {}
+        self._by_key: Dict[Tuple[int, str, str], List[Transaction]] = defaultdict(list)
+        self._collect_periods: List[int] = []
+        self._member_collect_periods: Dict[str, List[int]] = defaultdict(list)
+
+    def add(self, t: Transaction):
+        """Apply one transaction of this group to the table."""
+        self.version += 1
+        self.transactions.append(t)
+        self._by_key[(t.period, t.memberId, t.type)].append(t)
+
+        if t.type == 'CONTRIBUTE':
+            self._entry(t.period).paid[t.memberId] += t.amount
+        elif t.type == 'COLLECT':
+            entry = self._entry(t.period)
+            if entry.winner is None:
+                entry.winner = t
+            entry.collects.append(t)
+            insort(self._collect_periods, t.period)
+            insort(self._member_collect_periods[t.memberId], t.period)
+
+    def _entry(self, period: int) -> PeriodEntry:
+        entry = self._periods.get(period)
+        if entry is None:
+            entry = self._periods[period] = PeriodEntry(period)
+        return entry
+
+    # --- Lookups ---
+
+    def period(self, period: int) -> Optional[PeriodEntry]:
+        """Table row of a period, None if nothing was recorded for it."""
+        return self._periods.get(period)
+
+    def periods(self, first: int, last: int) -> Iterator[PeriodEntry]:
+        """Recorded rows with first <= period <= last, in period order."""
+        for period in sorted(p for p in self._periods if first <= p <= last):
+            yield self._periods[period]
+
+    def find(self, period: int, member_id: str, tx_type: str) -> List[Transaction]:
+        return self._by_key.get((period, member_id, tx_type), [])
+
+    def winner(self, period: int) -> Optional[Transaction]:
+        entry = self._periods.get(period)
+        return entry.winner if entry else None
+
+    def paid(self, period: int, member_id: str) -> Money:
+        entry = self._periods.get(period)
+        return entry.paid.get(member_id, 0) if entry else 0
+
+    def dead_slots(self, before_period: int, member_id: Optional[str] = None) -> int:
+        """
+        Number of COLLECTs strictly before a period.
+        With member_id, counts only that member's collected (dead) slots.
+        """
+        if member_id is None:
+            periods = self._collect_periods
+        else:
+            periods = self._member_collect_periods.get(member_id)
+        if not periods:
+            return 0
+        return bisect_left(periods, before_period)
@@ -1,12 +1,13 @@
 from dataclasses import dataclass
 from typing import List
+from app.models.money import Money, to_money
 
 @dataclass
 class HuiGroup:
     id: str
     name: str
     type: str # HuiType value
-    amountPerShare: float
+    amountPerShare: Money
     commissionRate: float # Value of commission (could be % or absolute)
     totalMembers: int
     startDate: str
@@ -15,10 +16,15 @@ class HuiGroup:
     currentPeriod: int
     commissionType: str = 'PERCENT' # 'PERCENT' or 'FIXED'
     biddingRule: str = 'OPEN_BID' # BiddingRule value
-    minBidStep: float = 10000 # Minimum bid increment
-    maxBidLimit: float = 0 # Maximum bid allowed (0 = no limit)
+    minBidStep: Money = 10000 # Minimum bid increment
+    maxBidLimit: Money = 0 # Maximum bid allowed (0 = no limit)
     totalPeriods: int = 0 # Total expected periods (0 = auto from members)
 
+    def __post_init__(self):
+        self.amountPerShare = to_money(self.amountPerShare)
+        self.minBidStep = to_money(self.minBidStep)
+        self.maxBidLimit = to_money(self.maxBidLimit)
+
     @classmethod
     def from_dict(cls, data):
         return cls(**data)
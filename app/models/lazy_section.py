@@ -0,0 +1,74 @@
+"""
+Lazy Section
+List-like container whose items are decoded from raw bytes on first access.
+"""
+from collections.abc import MutableSequence
+from typing import Callable, Optional
+
+class LazySection(MutableSequence):
+    """
+    Sequence backed by an encoded blob.
+    len() is answered from the stored count; any other access decodes the
+    blob once and afterwards behaves like a plain list.
+    """
+
+    def __init__(self, raw: bytes, count: int, decoder: Callable[[bytes], list]):
+        self._raw = raw
+        self._count = count
+        self._decoder = decoder
+        self._items: Optional[list] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._items is not None
+
+    @property
+    def raw(self) -> Optional[bytes]:
+        """Encoded blob, or None once decoded (items may have changed since)."""
+        return None if self.loaded else self._raw
+
+    def _load(self) -> list:
+        if self._items is None:
+            self._items = self._decoder(self._raw)
+            self._raw = None
+        return self._items
+
+    def copy(self):
+        """Copy without decoding if the section has not been touched yet."""
+        if not self.loaded:
+            return LazySection(self._raw, self._count, self._decoder)
+        return list(self._items)
+
+    def __len__(self):
+        return self._count if self._items is None else len(self._items)
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __setitem__(self, index, value):
+        self._load()[index] = value
+
+    def __delitem__(self, index):
+        del self._load()[index]
+
+    def insert(self, index, value):
+        self._load().insert(index, value)
+
+    def append(self, value):
+        self._load().append(value)
+
+    def extend(self, values):
+        self._load().extend(values)
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazySection)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        if not self.loaded:
+            return f"LazySection(<{self._count} encoded items>)"
+        return f"LazySection({self._items!r})"
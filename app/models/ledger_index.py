@@ -0,0 +1,95 @@
+"""
+Ledger Index
+In-memory index over the transaction history so finance lookups do not
+rescan the whole list for every period and member. Per-group facts live in
+a GroupLedger for each group.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence
+from app.models.group_ledger import GroupLedger
+from app.models.money import Money
+from app.models.transaction import Transaction
+
+class LedgerIndex:
+    """
+    Transactions indexed by group (see GroupLedger) plus cross-group counters.
+    Transactions are treated as append-only: use sync() to pick up new rows.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = ()):
+        self._reset()
+        for t in transactions:
+            self.add(t)
+
+    def _reset(self):
+        self._source = None
+        self._count = 0
+        self._groups: Dict[str, GroupLedger] = {}
+        self._member_collects: Dict[str, int] = defaultdict(int)
+
+    def add(self, t: Transaction):
+        """Index a single transaction."""
+        self._count += 1
+        self.group(t.huiGroupId).add(t)
+        if t.type == 'COLLECT':
+            self._member_collects[t.memberId] += 1
+
+    def sync(self, transactions: Sequence[Transaction]) -> 'LedgerIndex':
+        """
+        Bring the index up to date with a transaction list.
+        Only rows appended since the last sync are indexed; if the list was
+        replaced, shrunk or invalidate()d the index is rebuilt. A list that is
+        rewritten in place (e.g. by archiving) may be as long as before by the
+        next sync, so whoever rewrites it must call invalidate().
+        """
+        if transactions is not self._source or len(transactions) < self._count:
+            self._reset()
+            self._source = transactions
+        for t in transactions[self._count:]:
+            self.add(t)
+        return self
+
+    def invalidate(self):
+        """Rebuild on the next sync (the source list was rewritten in place)."""
+        self._source = None
+
+    def __len__(self):
+        return self._count
+
+    def group(self, group_id: str) -> GroupLedger:
+        """
+        Per-period ledger of a group (empty if it has no transactions yet).
+        The same GroupLedger is returned for an id until the index is rebuilt,
+        so callers can key caches on it.
+        """
+        group = self._groups.get(group_id)
+        if group is None:
+            group = self._groups[group_id] = GroupLedger(group_id)
+        return group
+
+    def find(self, group_id: str, period: int, member_id: str, tx_type: str) -> List[Transaction]:
+        """Transactions matching an exact (group, period, member, type) key."""
+        return self.group(group_id).find(period, member_id, tx_type)
+
+    def group_transactions(self, group_id: str) -> List[Transaction]:
+        """All transactions of a group, in insertion order."""
+        return self.group(group_id).transactions
+
+    def winner(self, group_id: str, period: int) -> Optional[Transaction]:
+        """COLLECT transaction of a period, or None if nobody has collected yet."""
+        return self.group(group_id).winner(period)
+
+    def paid(self, group_id: str, period: int, member_id: str) -> Money:
+        """Total CONTRIBUTE amount a member paid in a period."""
+        return self.group(group_id).paid(period, member_id)
+
+    def dead_slots(self, group_id: str, before_period: int, member_id: Optional[str] = None) -> int:
+        """
+        Number of COLLECTs strictly before a period.
+        With member_id, counts only that member's collected (dead) slots.
+        """
+        return self.group(group_id).dead_slots(before_period, member_id)
+
+    def collected_count(self, member_id: str) -> int:
+        """Number of COLLECTs a member has made across all groups."""
+        return self._member_collects.get(member_id, 0)
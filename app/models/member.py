@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional
 from app.models.enums import MemberStatus
+from app.models.money import Money
 
 @dataclass
 class Member:
@@ -28,3 +29,10 @@ class Member:
     def is_trusted(self) -> bool:
         """Business rule: Check if member is trusted."""
         return self.reputationScore >= 90 and self.status == MemberStatus.TRUSTED.value
+
+@dataclass
+class MemberStats:
+    member_id: str
+    num_groups: int
+    num_collected: int
+    total_debt: Money
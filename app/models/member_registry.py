@@ -0,0 +1,112 @@
+"""
+Member Registry
+Lookup tables over the member list: id -> member and normalized phone ->
+member, so existence and phone-uniqueness checks do not rescan the list.
+"""
+import re
+from typing import Dict, List, Optional
+from app.models.member import Member
+
+_NOT_DIGIT = re.compile(r"\D")
+
+def normalize_phone(phone: Optional[str]) -> str:
+    """Digits only, with the +84 country code folded to 0 ("+84 909-123-456" -> "0909123456")."""
+    digits = _NOT_DIGIT.sub("", phone or "")
+    if digits.startswith("84") and len(digits) == 11:
+        digits = "0" + digits[2:]
+    return digits
+
+class MemberRegistry:
+    """
+    Indexes of a member list. Mutate the list through add/update/remove to
+    keep them in sync; sync() picks up members appended to the list directly
+    and rebuilds if the list was replaced, shrunk or invalidate()d. Call
+    invalidate() after removing members from the list directly: appends
+    before the next sync can hide the removal.
+    """
+
+    def __init__(self, members: Optional[List[Member]] = None):
+        self._reset()
+        if members is not None:
+            self.sync(members)
+
+    def _reset(self):
+        self._source: Optional[List[Member]] = None
+        self._count = 0
+        self._by_id: Dict[str, Member] = {}
+        self._by_phone: Dict[str, Dict[str, Member]] = {} # phone key -> members with it, by id (insertion order)
+        self._phones: Dict[str, str] = {} # member id -> indexed phone key
+
+    def _index(self, member: Member):
+        self._count += 1
+        self._by_id[member.id] = member
+        phone = normalize_phone(member.phone)
+        self._phones[member.id] = phone
+        if phone:
+            self._by_phone.setdefault(phone, {})[member.id] = member
+
+    def _unindex(self, member: Member):
+        self._by_id.pop(member.id, None)
+        phone = self._phones.pop(member.id, "")
+        owners = self._by_phone.get(phone)
+        if owners is not None:
+            owners.pop(member.id, None)
+            if not owners:
+                del self._by_phone[phone]
+
+    def sync(self, members: List[Member]) -> 'MemberRegistry':
+        """Bring the registry up to date with a member list."""
+        if members is not self._source or len(members) < self._count:
+            self._reset()
+            self._source = members
+        for m in members[self._count:]:
+            self._index(m)
+        return self
+
+    def invalidate(self):
+        """Rebuild on the next sync (the member list was edited in place)."""
+        self._source = None
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, member_id: str) -> bool:
+        return member_id in self._by_id
+
+    def get(self, member_id: str) -> Optional[Member]:
+        return self._by_id.get(member_id)
+
+    def by_phone(self, phone: str) -> Optional[Member]:
+        """First member with the same phone number, ignoring formatting."""
+        owners = self._by_phone.get(normalize_phone(phone))
+        return next(iter(owners.values())) if owners else None
+
+    def phone_taken(self, phone: str, exclude: Optional[Member] = None) -> bool:
+        """Whether another member (not `exclude`) already has this phone number."""
+        owners = self._by_phone.get(normalize_phone(phone))
+        if not owners:
+            return False
+        return len(owners) > 1 or exclude is None or exclude.id not in owners
+
+    # --- Mutations (keep the list and the indexes in step) ---
+
+    def add(self, member: Member):
+        """Append a member to the list and index it."""
+        self._source.append(member)
+        self._index(member)
+
+    def update(self, member: Member):
+        """Re-index a member after its fields (e.g. phone) were edited in place."""
+        self._unindex(member)
+        self._count -= 1
+        self._index(member)
+
+    def remove(self, member: Member):
+        """Remove a member from the list and the indexes."""
+        # Identity scan: list.remove would compare every member field by field
+        index = next((i for i, m in enumerate(self._source) if m is member), None)
+        if index is None:
+            raise ValueError(f"Member {member.id} is not in the registry")
+        del self._source[index]
+        self._count -= 1
+        self._unindex(member)
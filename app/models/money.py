@@ -0,0 +1,58 @@
+"""
+Money
+Amounts are whole đồng stored as int: exact like Decimal (see doc/spec.md)
+but with native integer arithmetic in the payout/debt loops.
+"""
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from fractions import Fraction
+from typing import Dict, Tuple, Union
+
+Money = int # Whole đồng
+
+MoneyLike = Union[int, float, str, Decimal, None]
+
+def to_money(value: MoneyLike) -> Money:
+    """
+    Convert a number or user input to whole đồng, rounding half up.
+    Strings may use ',' or spaces as thousands separators.
+    """
+    if type(value) is int:
+        return value
+    if value is None:
+        return 0
+    if isinstance(value, float):
+        if value.is_integer():
+            return int(value)
+        # repr() gives the shortest decimal that round-trips, e.g. 0.1 -> "0.1"
+        value = Decimal(repr(value))
+    elif isinstance(value, str):
+        text = value.replace(',', '').replace(' ', '').strip()
+        try:
+            value = Decimal(text or '0')
+        except InvalidOperation:
+            raise ValueError(f"Invalid money amount: {value!r}") from None
+    elif isinstance(value, int):
+        # bool and int subclasses
+        return int(value)
+    return int(Decimal(value).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+# rate -> exact fraction of the percentage as (numerator, denominator)
+_RATIOS: Dict[Union[int, float, str], Tuple[int, int]] = {}
+
+def _rate_ratio(rate: Union[int, float, str]) -> Tuple[int, int]:
+    """Exact fraction of a percentage as the user typed it (5.5% -> 11/200)."""
+    fraction = Fraction(Decimal(repr(rate) if isinstance(rate, float) else str(rate))) / 100
+    return fraction.numerator, fraction.denominator
+
+def percent_of(amount: Money, rate: Union[int, float, str, None]) -> Money:
+    """`rate` percent of `amount`, exact and rounded half up to whole đồng."""
+    ratio = _RATIOS.get(rate)
+    if ratio is None:
+        if not rate:
+            return 0
+        ratio = _RATIOS[rate] = _rate_ratio(rate)
+    numerator, denominator = ratio
+    quotient, remainder = divmod(abs(amount) * numerator, denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if amount >= 0 else -quotient
@@ -1,22 +1,40 @@
 from dataclasses import dataclass
 from typing import Optional
+from app.models.money import Money, to_money
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     id: str
     huiGroupId: str
     memberId: str
     type: str  # 'CONTRIBUTE', 'COLLECT', 'PENALTY'
-    amount: float
+    amount: Money
     date: str
     period: int
-    bidAmount: Optional[float] = 0
-    netAmount: Optional[float] = 0
+    bidAmount: Optional[Money] = 0
+    netAmount: Optional[Money] = 0
     note: Optional[str] = None
 
+    def __post_init__(self):
+        self.amount = to_money(self.amount)
+        self.bidAmount = to_money(self.bidAmount)
+        self.netAmount = to_money(self.netAmount)
+
     @classmethod
     def from_dict(cls, data):
         return cls(**data)
 
     def to_dict(self):
-        return self.__dict__
+        # Slotted: no instance __dict__, build a fresh one
+        return {
+            'id': self.id,
+            'huiGroupId': self.huiGroupId,
+            'memberId': self.memberId,
+            'type': self.type,
+            'amount': self.amount,
+            'date': self.date,
+            'period': self.period,
+            'bidAmount': self.bidAmount,
+            'netAmount': self.netAmount,
+            'note': self.note,
+        }
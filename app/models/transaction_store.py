@@ -0,0 +1,210 @@
+"""
+Transaction Store
+Columnar copy of the transaction history for aggregate queries (dashboard,
+reports). Group/member IDs and types are dictionary-encoded to integer codes
+and numeric fields live in NumPy arrays, so group-by sums are a single
+np.bincount instead of a Python loop over every row.
+"""
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from app.models.money import Money
+from app.models.transaction import Transaction
+
+TX_TYPES = ('CONTRIBUTE', 'COLLECT', 'PENALTY')
+NUMERIC_COLUMNS = ('amount', 'bidAmount', 'netAmount', 'payout')
+GROUP_BY = ('group', 'member', 'period', 'type')
+INITIAL_CAPACITY = 1024
+
+class _Codes:
+    """Dictionary encoding of string values to dense integer codes."""
+
+    def __init__(self, values: Sequence[str] = ()):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+        for value in values:
+            self.encode(value)
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __len__(self):
+        return len(self.values)
+
+class TransactionStore:
+    """
+    Column arrays mirroring a transaction list.
+    Like LedgerIndex, rows are treated as append-only: sync() encodes only the
+    tail and rebuilds if the list was replaced or shrunk.
+    """
+
+    def __init__(self, transactions: Sequence[Transaction] = ()):
+        self._reset()
+        self._append(transactions)
+
+    def _reset(self):
+        self._source = None
+        self._count = 0
+        self._groups = _Codes()
+        self._members = _Codes()
+        self._types = _Codes(TX_TYPES)
+        self._columns = self._allocate(INITIAL_CAPACITY)
+
+    @staticmethod
+    def _allocate(capacity: int) -> Dict[str, np.ndarray]:
+        return {
+            'group': np.zeros(capacity, dtype=np.int32),
+            'member': np.zeros(capacity, dtype=np.int32),
+            'type': np.zeros(capacity, dtype=np.int16),
+            'period': np.zeros(capacity, dtype=np.int32),
+            'amount': np.zeros(capacity, dtype=np.int64),
+            'bidAmount': np.zeros(capacity, dtype=np.int64),
+            'netAmount': np.zeros(capacity, dtype=np.int64),
+        }
+
+    def _reserve(self, rows: int):
+        capacity = len(self._columns['amount'])
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        grown = self._allocate(capacity)
+        for name, column in self._columns.items():
+            grown[name][:self._count] = column[:self._count]
+        self._columns = grown
+
+    def _append(self, transactions: Sequence[Transaction]):
+        n = len(transactions)
+        if not n:
+            return
+        self._reserve(self._count + n)
+        rows = slice(self._count, self._count + n)
+        cols = self._columns
+        group, member, tx_type = self._groups.encode, self._members.encode, self._types.encode
+        cols['group'][rows] = [group(t.huiGroupId) for t in transactions]
+        cols['member'][rows] = [member(t.memberId) for t in transactions]
+        cols['type'][rows] = [tx_type(t.type) for t in transactions]
+        cols['period'][rows] = [t.period for t in transactions]
+        cols['amount'][rows] = [t.amount for t in transactions]
+        cols['bidAmount'][rows] = [t.bidAmount for t in transactions]
+        cols['netAmount'][rows] = [t.netAmount for t in transactions]
+        self._count += n
+
+    def sync(self, transactions: Sequence[Transaction]) -> 'TransactionStore':
+        """Bring the store up to date with a transaction list (see LedgerIndex.sync)."""
+        if transactions is not self._source or len(transactions) < self._count:
+            self._reset()
+            self._source = transactions
+        self._append(transactions[self._count:])
+        return self
+
+    def invalidate(self):
+        """Rebuild on the next sync (the source list was rewritten in place)."""
+        self._source = None
+
+    def __len__(self):
+        return self._count
+
+    # --- Columns ---
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Read-only view of a column.
+        'payout' is netAmount, falling back to amount when no net was recorded
+        (the same rule the dashboard has always used for COLLECT rows).
+        """
+        if name == 'payout':
+            net = self._columns['netAmount'][:self._count]
+            return np.where(net != 0, net, self._columns['amount'][:self._count])
+        view = self._columns[name][:self._count]
+        view.flags.writeable = False
+        return view
+
+    def _mask(self, tx_type: Optional[str], group_id: Optional[str], member_id: Optional[str]) -> Optional[np.ndarray]:
+        """Boolean row filter, None when nothing is filtered, False when a filter matches no rows."""
+        mask = None
+        for name, codes, value in (('type', self._types, tx_type),
+                                   ('group', self._groups, group_id),
+                                   ('member', self._members, member_id)):
+            if value is None:
+                continue
+            code = codes.codes.get(value)
+            if code is None:
+                return False
+            match = self._columns[name][:self._count] == code
+            mask = match if mask is None else mask & match
+        return mask
+
+    # --- Row selection (positions in the source transaction list) ---
+
+    def rows(self, tx_type: Optional[str] = None, group_id: Optional[str] = None,
+             member_id: Optional[str] = None) -> np.ndarray:
+        """Positions of the rows matching the filters, in insertion order."""
+        mask = self._mask(tx_type, group_id, member_id)
+        if mask is False:
+            return np.zeros(0, dtype=np.intp)
+        return np.arange(self._count) if mask is None else np.flatnonzero(mask)
+
+    def rows_by(self, by: str, tx_type: Optional[str] = None) -> Iterator[Tuple[str, np.ndarray]]:
+        """
+        (key, row positions) for each group or member, from one stable sort
+        instead of a filter pass per key. Rows keep insertion order within a key.
+        """
+        if by not in ('group', 'member'):
+            raise ValueError(f"Cannot split rows by {by!r}, expected 'group' or 'member'")
+        rows = self.rows(tx_type)
+        if not len(rows):
+            return
+        keys = self._columns[by][:self._count][rows]
+        order = np.argsort(keys, kind='stable')
+        rows, keys = rows[order], keys[order]
+        bounds = np.flatnonzero(np.diff(keys)) + 1
+        labels = self._groups.values if by == 'group' else self._members.values
+        for start, end in zip(np.r_[0, bounds], np.r_[bounds, len(rows)]):
+            yield labels[keys[start]], rows[start:end]
+
+    # --- Aggregations ---
+
+    def total(self, column: str = 'amount', tx_type: Optional[str] = None,
+              group_id: Optional[str] = None, member_id: Optional[str] = None) -> Money:
+        """Sum of a numeric column over the rows matching the filters."""
+        mask = self._mask(tx_type, group_id, member_id)
+        if mask is False:
+            return 0
+        values = self.column(column)
+        return int(values.sum() if mask is None else values[mask].sum())
+
+    def sum_by(self, by: str, column: str = 'amount', tx_type: Optional[str] = None,
+               group_id: Optional[str] = None, member_id: Optional[str] = None) -> Dict:
+        """
+        Group-by sum of a numeric column.
+        `by` is one of 'group', 'member', 'period', 'type'; keys are the
+        decoded IDs / periods / type names that occur in the filtered rows.
+        """
+        if by not in GROUP_BY:
+            raise ValueError(f"Cannot group by {by!r}, expected one of {GROUP_BY}")
+        if column not in NUMERIC_COLUMNS:
+            raise ValueError(f"Cannot sum column {column!r}, expected one of {NUMERIC_COLUMNS}")
+        mask = self._mask(tx_type, group_id, member_id)
+        if mask is False:
+            return {}
+
+        keys = self._columns[by][:self._count]
+        values = self.column(column)
+        if mask is not None:
+            keys, values = keys[mask], values[mask]
+        if not len(keys):
+            return {}
+
+        # float64 weights are exact for totals below 2**53 đồng
+        sums = np.bincount(keys, weights=values)
+        counts = np.bincount(keys)
+        present = np.flatnonzero(counts)
+        labels = {'group': self._groups.values, 'member': self._members.values,
+                  'type': self._types.values}.get(by)
+        if labels is None:
+            return {int(k): int(sums[k]) for k in present}
+        return {labels[k]: int(sums[k]) for k in present}
@@ -0,0 +1,112 @@
+"""
+Debt Cache - Consumer
+Keeps member debt per (member, group) and recomputes only the cells
+invalidated by transaction and cycle events.
+"""
+from typing import Dict, List, Optional, Tuple
+from app.core.event_bus import get_event_bus, Event, EventType
+from app.models.archive_summary import ArchiveSummary
+from app.models.hui_group import HuiGroup
+from app.models.ledger_index import LedgerIndex
+from app.models.money import Money
+from services.archive_service import ArchiveService
+from services.finance_service import FinanceService
+
+class DebtCache:
+    """
+    Lazily computed debt per (member, group), or in bulk through warm().
+    Subscribes to PAYMENT_MADE, COLLECTION_EXECUTED and CYCLE_* events and
+    drops only the affected entries. Member totals include the debt left in
+    archived groups (read from their summaries).
+    """
+
+    GROUP_EVENTS = (
+        EventType.COLLECTION_EXECUTED,
+        EventType.CYCLE_CREATED,
+        EventType.CYCLE_UPDATED,
+        EventType.CYCLE_DELETED,
+        EventType.CYCLE_STATUS_CHANGED,
+        EventType.CYCLE_ARCHIVED,
+    )
+
+    def __init__(self, groups: List[HuiGroup], transactions, archives: Optional[List[ArchiveSummary]] = None):
+        self.groups = groups
+        self.transactions = transactions
+        self.archives = archives if archives is not None else []
+        self._ledger = LedgerIndex()
+        self._debts: Dict[Tuple[str, str], Money] = {}
+        self._subscribe_to_events()
+
+    def _subscribe_to_events(self):
+        """Subscribe to events that change debts (Consumer)."""
+        get_event_bus().subscribe(EventType.PAYMENT_MADE, self._on_payment_made)
+        for event_type in self.GROUP_EVENTS:
+            get_event_bus().subscribe(event_type, self._on_group_changed)
+
+    def close(self):
+        """Unsubscribe from the event bus."""
+        get_event_bus().unsubscribe(EventType.PAYMENT_MADE, self._on_payment_made)
+        for event_type in self.GROUP_EVENTS:
+            get_event_bus().unsubscribe(event_type, self._on_group_changed)
+
+    @property
+    def ledger(self) -> LedgerIndex:
+        """Transaction index the cached debts are computed from."""
+        return self._ledger.sync(self.transactions)
+
+    def _on_payment_made(self, event: Event):
+        """A payment only changes the payer's debt in that group."""
+        tx = event.data['transaction']
+        self.invalidate(member_id=tx.memberId, group_id=tx.huiGroupId)
+
+    def _on_group_changed(self, event: Event):
+        """Collections and cycle edits can change every member's debt in the group."""
+        if event.type == EventType.CYCLE_ARCHIVED:
+            # Archiving rewrote the transaction list in place
+            self._ledger.invalidate()
+        self.invalidate(group_id=event.data['group'].id)
+
+    def invalidate(self, member_id: Optional[str] = None, group_id: Optional[str] = None):
+        """Drop cached entries matching the given member and/or group (all if neither)."""
+        if member_id is not None and group_id is not None:
+            self._debts.pop((member_id, group_id), None)
+            return
+        stale = [key for key in self._debts
+                 if (member_id is None or key[0] == member_id)
+                 and (group_id is None or key[1] == group_id)]
+        for key in stale:
+            del self._debts[key]
+
+    def warm(self):
+        """Fill every missing entry, computing all affected groups in one batch."""
+        stale = [g for g in self.groups
+                 if any((member_id, g.id) not in self._debts for member_id in g.members)]
+        if not stale:
+            return
+        debts = FinanceService.compute_all_debts(stale, self.ledger)
+        for group in stale:
+            for member_id in group.members:
+                self._debts[(member_id, group.id)] = debts.get(member_id, group.id)
+
+    def get(self, member_id: str, group: HuiGroup) -> Money:
+        """Debt of a member in one group."""
+        key = (member_id, group.id)
+        debt = self._debts.get(key)
+        if debt is None:
+            debt = FinanceService.get_member_total_debt(member_id, [group], self.ledger)
+            self._debts[key] = debt
+        return debt
+
+    def member_totals(self) -> Dict[str, Money]:
+        """Debt of every member across all their groups (live and archived), from one warm() batch."""
+        self.warm()
+        totals = ArchiveService.archived_member_debts(self.archives)
+        for group in self.groups:
+            for member_id in set(group.members):
+                totals[member_id] = totals.get(member_id, 0) + self._debts[(member_id, group.id)]
+        return totals
+
+    def get_member_total_debt(self, member_id: str) -> Money:
+        """Debt of a member across all groups they hold slots in, archived ones included."""
+        archived = sum(a.memberDebts.get(member_id, 0) for a in self.archives)
+        return archived + sum(self.get(member_id, g) for g in self.groups if member_id in g.members)
@@ -0,0 +1,147 @@
+"""
+Member Importer
+Streams member rows from an .xlsx (openpyxl read-only mode) or CSV file in
+chunks and validates them against the member registry, so large sheets are
+never loaded whole. The accepted rows are created in one batch with
+MembersService.bulk_create, which publishes a single MEMBERS_IMPORTED event.
+"""
+import csv
+import os
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+from openpyxl import load_workbook
+from app.models.enums import MemberStatus
+from app.models.member_registry import MemberRegistry, normalize_phone
+from app.services.member_search_index import normalize
+
+CHUNK_SIZE = 1000 # Rows validated per chunk
+
+# Member field -> accepted header names (accent-stripped, lowercase)
+COLUMN_ALIASES = {
+    'name': ("ten", "ho ten", "ho va ten", "name"),
+    'phone': ("sdt", "so dien thoai", "dien thoai", "phone"),
+    'address': ("dia chi", "address"),
+    'zalo': ("zalo",),
+    'note': ("ghi chu", "note"),
+    'status': ("trang thai", "status"),
+}
+_HEADERS = {alias: key for key, aliases in COLUMN_ALIASES.items() for alias in aliases}
+_STATUSES = {normalize(s.value): s.value for s in MemberStatus}
+
+@dataclass
+class SkippedRow:
+    row: int # 1-based row number in the file (header is row 1)
+    reason: str
+
+@dataclass
+class ImportResult:
+    rows: List[Dict[str, str]] = field(default_factory=list) # Valid rows, for MembersService.bulk_create
+    skipped: List[SkippedRow] = field(default_factory=list)
+    total: int = 0 # Data rows read
+
+def iter_rows(path: str) -> Iterator[Sequence]:
+    """Rows of the first sheet of an .xlsx file, or of a CSV file, one at a time."""
+    if os.path.splitext(path)[1].lower() in ('.xlsx', '.xlsm'):
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+    else:
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            try:
+                dialect = csv.Sniffer().sniff(f.read(4096), delimiters=",;\t")
+            except csv.Error:
+                dialect = csv.excel
+            f.seek(0)
+            yield from csv.reader(f, dialect)
+
+def iter_chunks(rows: Iterable, size: int) -> Iterator[list]:
+    it = iter(rows)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+def _phone_text(value) -> str:
+    """Spreadsheets store phone numbers as numbers, dropping the leading 0."""
+    text = _text(value)
+    if isinstance(value, (int, float)) and len(text) == 9:
+        text = "0" + text
+    return text
+
+class MemberImporter:
+    """Reads and validates member rows; creates nothing itself."""
+
+    def __init__(self, registry: MemberRegistry, chunk_size: int = CHUNK_SIZE):
+        self.registry = registry
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def map_header(header: Sequence) -> Dict[str, int]:
+        """Member field -> column index, from the header row."""
+        columns = {}
+        for i, title in enumerate(header):
+            key = _HEADERS.get(" ".join(normalize(_text(title)).split()))
+            if key is not None and key not in columns:
+                columns[key] = i
+        missing = [key for key in ('name', 'phone') if key not in columns]
+        if missing:
+            raise ValueError(f"Thiếu cột bắt buộc: {', '.join(missing)}")
+        return columns
+
+    def read(self, path: str, progress: Optional[Callable[[int], None]] = None) -> ImportResult:
+        """Validate every row of a file. `progress` is called with the number of rows read after each chunk."""
+        rows = iter_rows(path)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError("Tệp không có dữ liệu")
+        columns = self.map_header(header)
+
+        result = ImportResult()
+        seen = set() # Normalized phones accepted so far in this file
+        row_number = 1
+        for chunk in iter_chunks(rows, self.chunk_size):
+            for values in chunk:
+                row_number += 1
+                if not any(_text(v) for v in values):
+                    continue
+                result.total += 1
+                row = {key: (_phone_text if key == 'phone' else _text)(values[i]) if i < len(values) else ""
+                       for key, i in columns.items()}
+                reason = self._validate(row, seen)
+                if reason:
+                    result.skipped.append(SkippedRow(row_number, reason))
+                else:
+                    seen.add(normalize_phone(row['phone']))
+                    result.rows.append(row)
+            if progress:
+                progress(result.total)
+        return result
+
+    def _validate(self, row: Dict[str, str], seen: set) -> Optional[str]:
+        """Reason to skip a row, or None. Fills in a normalized status."""
+        if not row['name'] or not row['phone']:
+            return "Thiếu tên hoặc số điện thoại"
+        phone = normalize_phone(row['phone'])
+        if phone in seen:
+            return f"Số điện thoại {row['phone']} bị trùng trong tệp"
+        if self.registry.phone_taken(phone):
+            return f"Số điện thoại {row['phone']} đã tồn tại"
+        status = row.get('status')
+        if status:
+            if normalize(status) not in _STATUSES:
+                return f"Trạng thái không hợp lệ: {status}"
+            row['status'] = _STATUSES[normalize(status)]
+        else:
+            row['status'] = MemberStatus.NORMAL.value
+        return None
@@ -0,0 +1,179 @@
+"""
+Member Search Index - Consumer
+Inverted index over member name, phone, zalo and address. Text is stored
+accent-stripped ("Nguyễn" -> "nguyen", "đ" -> "d"), words match by prefix
+and phone/zalo fragments of 3+ characters match anywhere through trigrams.
+Kept up to date by MEMBER_CREATED/UPDATED/DELETED and MEMBERS_IMPORTED events.
+"""
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set
+from app.core.event_bus import get_event_bus, Event, EventType
+from app.models.member import Member
+
+_WORD = re.compile(r"\w+")
+_NOT_DIGIT = re.compile(r"\D")
+_D_STROKE = str.maketrans({'đ': 'd', 'Đ': 'd'})
+_MARKS = re.compile("[\u0300-\u036f]") # Combining diacritics left by NFD
+
+def normalize(text: Optional[str]) -> str:
+    """Lowercase and strip Vietnamese diacritics ("Đỗ Thị Hằng" -> "do thi hang")."""
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize('NFD', text.translate(_D_STROKE))
+    return _MARKS.sub("", decomposed).lower()
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class MemberSearchIndex:
+    """
+    Word-prefix and phone-trigram index of members, keyed by member id.
+    A query matches a member when every word of the query is a prefix of one
+    of its words or (3+ characters) a fragment of its phone or zalo.
+    """
+
+    EVENTS = (EventType.MEMBER_CREATED, EventType.MEMBER_UPDATED, EventType.MEMBER_DELETED,
+              EventType.MEMBERS_IMPORTED)
+
+    def __init__(self, members: Iterable[Member] = (), subscribe: bool = True):
+        # Postings hold integer slots (insertion order), so results sort cheaply
+        self._slots: Dict[str, int] = {} # member id -> slot
+        self._members: Dict[int, Member] = {}
+        self._next = 0
+        self._words: Dict[str, Set[int]] = {} # word -> slots
+        self._sorted_words: List[str] = [] # For prefix ranges
+        self._grams: Dict[str, Set[int]] = {} # trigram -> slots
+        self._entries: Dict[int, tuple] = {} # slot -> (words, fragments) as indexed
+        for member in members:
+            self._index(member, sort_words=False)
+        self._sorted_words = sorted(self._words)
+        self._subscribed = False
+        if subscribe:
+            self._subscribe_to_events()
+
+    def _subscribe_to_events(self):
+        """Subscribe to member events (Consumer)."""
+        for event_type in self.EVENTS:
+            get_event_bus().subscribe(event_type, self._on_member_event)
+        self._subscribed = True
+
+    def close(self):
+        """Unsubscribe from the event bus."""
+        if self._subscribed:
+            for event_type in self.EVENTS:
+                get_event_bus().unsubscribe(event_type, self._on_member_event)
+            self._subscribed = False
+
+    def _on_member_event(self, event: Event):
+        if event.type == EventType.MEMBERS_IMPORTED:
+            for member in event.data['members']:
+                self._index(member, sort_words=False)
+            self._sorted_words = sorted(self._words)
+            return
+        member = event.data['member'] if isinstance(event.data, dict) else event.data
+        if event.type == EventType.MEMBER_DELETED:
+            self.remove(member)
+        else:
+            self.add(member)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    # --- Updates ---
+
+    def add(self, member: Member):
+        """Index a member, replacing what was indexed for its id before."""
+        self._index(member, sort_words=True)
+
+    update = add
+
+    def _index(self, member: Member, sort_words: bool):
+        slot = self._slots.get(member.id)
+        if slot is None:
+            slot = self._slots[member.id] = self._next
+            self._next += 1
+        else:
+            self._unindex(slot)
+        self._members[slot] = member
+
+        words = set(_WORD.findall(normalize(" ".join(
+            filter(None, (member.name, member.phone, member.zalo, member.address))))))
+        fragments = {f for f in (_NOT_DIGIT.sub("", member.phone or ""),
+                                 "".join(_WORD.findall(normalize(member.zalo)))) if f}
+        for word in words:
+            ids = self._words.get(word)
+            if ids is None:
+                ids = self._words[word] = set()
+                if sort_words:
+                    insort(self._sorted_words, word)
+            ids.add(slot)
+        for fragment in fragments:
+            for gram in trigrams(fragment):
+                self._grams.setdefault(gram, set()).add(slot)
+        self._entries[slot] = (words, fragments)
+
+    def remove(self, member: Member):
+        """Drop a member from the index (no-op if it is not indexed)."""
+        slot = self._slots.pop(member.id, None)
+        if slot is not None:
+            self._unindex(slot)
+            del self._members[slot]
+
+    def _unindex(self, slot: int):
+        words, fragments = self._entries.pop(slot)
+        for word in words:
+            ids = self._words[word]
+            ids.discard(slot)
+            if not ids:
+                del self._words[word]
+                del self._sorted_words[bisect_left(self._sorted_words, word)]
+        for fragment in fragments:
+            for gram in trigrams(fragment):
+                ids = self._grams[gram]
+                ids.discard(slot)
+                if not ids:
+                    del self._grams[gram]
+
+    # --- Queries ---
+
+    def _prefix_ids(self, prefix: str) -> Set[int]:
+        ids: Set[int] = set()
+        i = bisect_left(self._sorted_words, prefix)
+        while i < len(self._sorted_words) and self._sorted_words[i].startswith(prefix):
+            ids |= self._words[self._sorted_words[i]]
+            i += 1
+        return ids
+
+    def _fragment_ids(self, fragment: str) -> Set[int]:
+        """Members whose phone or zalo contains `fragment` (3+ characters)."""
+        postings = sorted((self._grams.get(g, set()) for g in trigrams(fragment)), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return {slot for slot in candidates if any(fragment in f for f in self._entries[slot][1])}
+
+    def _term_ids(self, term: str) -> Set[int]:
+        ids = self._prefix_ids(term)
+        if len(term) >= 3:
+            ids |= self._fragment_ids(term)
+        return ids
+
+    def search(self, query: str) -> List[Member]:
+        """Members matching every word of `query`, in insertion order (all for a blank query)."""
+        normalized = normalize(query)
+        terms = _WORD.findall(normalized)
+        if not terms:
+            return list(self._members.values())
+
+        compact = "".join(terms)
+        if compact.isdigit() and len(terms) > 1:
+            # "0909 123 456": a phone number typed with separators
+            terms = [compact]
+
+        result: Optional[Set[int]] = None
+        for term in sorted(set(terms), key=len, reverse=True): # Most selective first
+            ids = self._term_ids(term)
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        return [self._members[slot] for slot in sorted(result)]
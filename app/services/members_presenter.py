@@ -3,9 +3,12 @@ Members Module - Presenter
 Business logic coordinator between Model and View.
 No direct UI code, only data manipulation and service calls.
 """
-from typing import List, Callable
+from typing import Dict, List, Callable, Optional
 from app.models.member import Member, MemberStats, MemberStatus
-from services.finance_service import FinanceService
+from app.models.ledger_index import LedgerIndex
+from app.models.member_registry import MemberRegistry
+from app.services.member_search_index import MemberSearchIndex
+from services.finance_service import FinanceService, PortfolioDebts
 
 class MembersPresenter:
     """
@@ -17,8 +20,15 @@ class MembersPresenter:
         self.members = members
         self.groups = groups
         self.transactions = transactions
+        self._registry = MemberRegistry()
+        self.search_index = MemberSearchIndex(members, subscribe=False) # Updated by the methods below
         self._view = None
     
+    @property
+    def registry(self) -> MemberRegistry:
+        """id/phone lookups over `members`."""
+        return self._registry.sync(self.members)
+
     def attach_view(self, view):
         """Attach the view to this presenter."""
         self._view = view
@@ -29,30 +39,32 @@ class MembersPresenter:
     
     def search_members(self, query: str) -> List[Member]:
         """
-        Search members by name or phone.
-        Business logic: case-insensitive search.
+        Search members by name, phone, zalo or address.
+        Business logic: case- and accent-insensitive search.
         """
-        query_lower = query.lower()
-        return [
-            m for m in self.members
-            if query_lower in m.name.lower() or query_lower in m.phone
-        ]
+        return self.search_index.search(query)
     
-    def get_member_stats(self, member_id: str) -> MemberStats:
+    def get_member_stats(self, member_id: str, ledger: Optional[LedgerIndex] = None,
+                         debts: Optional[PortfolioDebts] = None) -> MemberStats:
         """
         Calculate statistics for a member.
         Business logic: aggregates data from multiple sources.
+        Pass a prebuilt ledger/debts (see get_all_member_stats) to avoid recomputing them.
         """
+        if ledger is None:
+            ledger = LedgerIndex(self.transactions)
+        
         # Count groups
         groups_in = [g for g in self.groups if member_id in g.members]
         num_groups = len(groups_in)
         
         # Count collections
-        collected = [t for t in self.transactions if t.memberId == member_id and t.type == 'COLLECT']
-        num_collected = len(collected)
+        num_collected = ledger.collected_count(member_id)
         
         # Calculate debt
-        total_debt = FinanceService.get_member_total_debt(member_id, self.groups, self.transactions)
+        if debts is None:
+            debts = FinanceService.compute_all_debts(groups_in, ledger)
+        total_debt = debts.member_total(member_id)
         
         return MemberStats(
             member_id=member_id,
@@ -61,24 +73,31 @@ class MembersPresenter:
             total_debt=total_debt
         )
     
+    def get_all_member_stats(self) -> Dict[str, MemberStats]:
+        """Statistics of every member from a single ledger and debt computation."""
+        ledger = LedgerIndex(self.transactions)
+        debts = FinanceService.compute_all_debts(self.groups, ledger)
+        return {m.id: self.get_member_stats(m.id, ledger, debts) for m in self.members}
+    
     def create_member(self, name: str, phone: str, address: str, zalo: str, note: str, status: str) -> Member:
         """
         Create a new member.
         Business logic: validation and ID generation.
         """
         import time
+        import uuid
         
         # Validation
         if not name or not phone:
             raise ValueError("Tên và số điện thoại là bắt buộc")
         
         # Check duplicate phone
-        if any(m.phone == phone for m in self.members):
+        if self.registry.phone_taken(phone):
             raise ValueError(f"Số điện thoại {phone} đã tồn tại")
         
         # Create member
         new_member = Member(
-            id=str(int(time.time())),
+            id=uuid.uuid4().hex,
             name=name,
             phone=phone,
             address=address,
@@ -88,7 +107,8 @@ class MembersPresenter:
             status=status
         )
         
-        self.members.append(new_member)
+        self.registry.add(new_member)
+        self.search_index.add(new_member)
         return new_member
     
     def update_member(self, member: Member, name: str, phone: str, address: str, 
@@ -101,7 +121,7 @@ class MembersPresenter:
             raise ValueError("Tên và số điện thoại là bắt buộc")
         
         # Check duplicate phone (excluding current member)
-        if any(m.phone == phone and m.id != member.id for m in self.members):
+        if self.registry.phone_taken(phone, exclude=member):
             raise ValueError(f"Số điện thoại {phone} đã tồn tại")
         
         member.name = name
@@ -110,6 +130,8 @@ class MembersPresenter:
         member.zalo = zalo
         member.note = note
         member.status = status
+        self.registry.update(member)
+        self.search_index.update(member)
     
     def delete_member(self, member: Member) -> bool:
         """
@@ -121,7 +143,8 @@ class MembersPresenter:
         if active_groups:
             raise ValueError(f"Không thể xóa: Thành viên đang tham gia {len(active_groups)} dây hụi")
         
-        self.members.remove(member)
+        self.registry.remove(member)
+        self.search_index.remove(member)
         return True
     
     def get_high_risk_members(self) -> List[Member]:
@@ -2,12 +2,16 @@
 Members Service - Producer
 Emits events when data changes.
 """
-from typing import List
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
 from app.core.event_bus import get_event_bus, Event, EventType
-from app.models.member import Member
+from app.models.member import Member, MemberStats
+from app.models.member_registry import MemberRegistry, normalize_phone
 from app.models.enums import MemberStatus
-from services.finance_service import FinanceService
+from app.services.debt_cache import DebtCache
+from app.services.member_search_index import MemberSearchIndex
 import time
+import uuid
 
 class MembersService:
     """
@@ -15,22 +19,36 @@ class MembersService:
     Emits events for all data changes.
     """
     
-    def __init__(self, members: List[Member], groups, transactions):
+    def __init__(self, members: List[Member], groups, transactions,
+                 registry: Optional[MemberRegistry] = None, archives=None):
         self.members = members
         self.groups = groups
         self.transactions = transactions
+        self._registry = registry if registry is not None else MemberRegistry()
+        self.debt_cache = DebtCache(groups, transactions, archives)
+        self.search_index = MemberSearchIndex(members)
+
+    def close(self):
+        """Unsubscribe the caches from the event bus; call when the service is discarded."""
+        self.debt_cache.close()
+        self.search_index.close()
     
+    @property
+    def registry(self) -> MemberRegistry:
+        """id/phone lookups over `members`."""
+        return self._registry.sync(self.members)
+
     def get_all(self) -> List[Member]:
         """Get all members."""
         return self.members
+
+    def get(self, member_id: str) -> Optional[Member]:
+        """Member by id, or None."""
+        return self.registry.get(member_id)
     
     def search(self, query: str) -> List[Member]:
-        """Search members by name or phone."""
-        query_lower = query.lower()
-        results = [
-            m for m in self.members
-            if query_lower in m.name.lower() or query_lower in m.phone
-        ]
+        """Search members by name, phone, zalo or address (accent-insensitive, see MemberSearchIndex)."""
+        results = self.search_index.search(query)
         
         # Emit search event
         get_event_bus().publish(Event(
@@ -50,12 +68,12 @@ class MembersService:
         if not name or not phone:
             raise ValueError("Tên và số điện thoại là bắt buộc")
         
-        if any(m.phone == phone for m in self.members):
+        if self.registry.phone_taken(phone):
             raise ValueError(f"Số điện thoại {phone} đã tồn tại")
         
         # Create
         new_member = Member(
-            id=str(int(time.time())),
+            id=uuid.uuid4().hex,
             name=name,
             phone=phone,
             address=address,
@@ -65,7 +83,7 @@ class MembersService:
             status=status
         )
         
-        self.members.append(new_member)
+        self.registry.add(new_member)
         
         # Emit event
         get_event_bus().publish(Event(
@@ -76,6 +94,50 @@ class MembersService:
         
         return new_member
     
+    def bulk_create(self, rows: Iterable[dict]) -> List[Member]:
+        """
+        Create many members at once (see MemberImporter).
+        Rows are dicts of name, phone, address, zalo, note and status. All rows
+        are validated before any member is added; emits a single
+        MEMBERS_IMPORTED event instead of one MEMBER_CREATED per member.
+        """
+        rows = list(rows)
+        phones = set()
+        for row in rows:
+            if not row.get('name') or not row.get('phone'):
+                raise ValueError("Tên và số điện thoại là bắt buộc")
+            phone = normalize_phone(row['phone'])
+            if phone in phones or self.registry.phone_taken(phone):
+                raise ValueError(f"Số điện thoại {row['phone']} đã tồn tại")
+            phones.add(phone)
+
+        join_date = str(time.time())
+        created = [
+            Member(
+                id=uuid.uuid4().hex,
+                name=row['name'],
+                phone=row['phone'],
+                address=row.get('address') or "",
+                joinDate=join_date,
+                zalo=row.get('zalo') or None,
+                note=row.get('note') or None,
+                status=row.get('status') or MemberStatus.NORMAL.value
+            )
+            for row in rows
+        ]
+        registry = self.registry
+        for member in created:
+            registry.add(member)
+
+        # Emit one event for the whole batch
+        get_event_bus().publish(Event(
+            type=EventType.MEMBERS_IMPORTED,
+            data={'members': created},
+            source='MembersService'
+        ))
+
+        return created
+    
     def update(self, member: Member, name: str, phone: str, address: str, 
                zalo: str, note: str, status: str):
         """
@@ -85,7 +147,7 @@ class MembersService:
         if not name or not phone:
             raise ValueError("Tên và số điện thoại là bắt buộc")
         
-        if any(m.phone == phone and m.id != member.id for m in self.members):
+        if self.registry.phone_taken(phone, exclude=member):
             raise ValueError(f"Số điện thoại {phone} đã tồn tại")
         
         # Store old values for event
@@ -98,6 +160,7 @@ class MembersService:
         member.zalo = zalo
         member.note = note
         member.status = status
+        self.registry.update(member)
         
         # Emit event
         get_event_bus().publish(Event(
@@ -116,7 +179,7 @@ class MembersService:
         if active_groups:
             raise ValueError(f"Không thể xóa: Thành viên đang tham gia {len(active_groups)} dây hụi")
         
-        self.members.remove(member)
+        self.registry.remove(member)
         
         # Emit event
         get_event_bus().publish(Event(
@@ -126,13 +189,29 @@ class MembersService:
         ))
     
     def get_stats(self, member_id: str):
-        """Get member statistics."""
+        """Get member statistics (debts are computed for all members in one batch)."""
+        self.debt_cache.warm()
         groups_in = [g for g in self.groups if member_id in g.members]
-        collected = [t for t in self.transactions if t.memberId == member_id and t.type == 'COLLECT']
-        total_debt = FinanceService.get_member_total_debt(member_id, self.groups, self.transactions)
+        num_collected = self.debt_cache.ledger.collected_count(member_id)
+        total_debt = self.debt_cache.get_member_total_debt(member_id)
         
         return {
             'num_groups': len(groups_in),
-            'num_collected': len(collected),
+            'num_collected': num_collected,
             'total_debt': total_debt
         }
+
+    def get_all_stats(self) -> Dict[str, MemberStats]:
+        """Statistics of every member in one pass (one debt batch, one scan of the groups)."""
+        debts = self.debt_cache.member_totals()
+        ledger = self.debt_cache.ledger
+        num_groups = Counter(member_id for g in self.groups for member_id in set(g.members))
+        return {
+            m.id: MemberStats(
+                member_id=m.id,
+                num_groups=num_groups[m.id],
+                num_collected=ledger.collected_count(m.id),
+                total_debt=debts.get(m.id, 0)
+            )
+            for m in self.members
+        }
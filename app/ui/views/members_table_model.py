@@ -0,0 +1,105 @@
+"""
+Members Table Model
+Serves the members table from the member list and a precomputed stats map.
+Cells are produced in data() on demand, so the view only materializes the
+rows it shows.
+"""
+from typing import Dict, List, Optional
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+from app.models.member import Member, MemberStats
+
+COLUMNS = ["ID", "Tên", "SĐT", "Địa chỉ", "Số Dây", "C.Hốt", "Tổng Nợ", "Uy Tín", "Trạng thái"]
+COL_GROUPS, COL_COLLECTED, COL_DEBT, COL_REPUTATION, COL_STATUS = 4, 5, 6, 7, 8
+
+CENTER = Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter
+RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+LEFT = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+RED = QColor("#DC2626")
+GREEN = QColor("#059669")
+HIGH_RISK_BACKGROUND = QColor("#FEF2F2")
+
+_NO_STATS = MemberStats(member_id="", num_groups=0, num_collected=0, total_debt=0)
+
+class MembersTableModel(QAbstractTableModel):
+    """Read-only table of members; the Member of a row is available under UserRole."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._members: List[Member] = []
+        self._stats: Dict[str, MemberStats] = {}
+
+    def set_members(self, members: List[Member], stats: Optional[Dict[str, MemberStats]] = None):
+        """Replace the rows (e.g. a new search result); stats are kept unless given."""
+        self.beginResetModel()
+        self._members = list(members)
+        if stats is not None:
+            self._stats = stats
+        self.endResetModel()
+
+    def member_at(self, row: int) -> Optional[Member]:
+        return self._members[row] if 0 <= row < len(self._members) else None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._members)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        member = self._members[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(member, col)
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if col == COL_DEBT:
+                return RIGHT
+            return CENTER if col >= COL_GROUPS else LEFT
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foreground(member, col)
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return HIGH_RISK_BACKGROUND if member.is_high_risk() else None
+        if role == Qt.ItemDataRole.UserRole:
+            return member
+        return None
+
+    def _display(self, member: Member, col: int) -> str:
+        if col == 0:
+            return member.id[:8]
+        if col == 1:
+            return member.name
+        if col == 2:
+            return member.phone
+        if col == 3:
+            return member.address
+        if col == COL_REPUTATION:
+            return str(member.reputationScore)
+        if col == COL_STATUS:
+            return member.status
+        stats = self._stats.get(member.id, _NO_STATS)
+        if col == COL_GROUPS:
+            return str(stats.num_groups)
+        if col == COL_COLLECTED:
+            return str(stats.num_collected)
+        return f"{stats.total_debt:,.0f}"
+
+    def _foreground(self, member: Member, col: int) -> Optional[QColor]:
+        if col == COL_DEBT:
+            return RED if self._stats.get(member.id, _NO_STATS).total_debt > 0 else None
+        if col == COL_REPUTATION:
+            if member.reputationScore >= 90:
+                return GREEN
+            if member.reputationScore < 50:
+                return RED
+        if col == COL_STATUS and member.is_high_risk():
+            return RED
+        return None
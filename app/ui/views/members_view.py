@@ -6,11 +6,32 @@ from PyQt6.QtWidgets import *
 from PyQt6.QtCore import *
 from PyQt6.QtGui import *
 import qtawesome as qta
+import threading
 
 from app.core.event_bus import get_event_bus, Event, EventType
 from app.models.member import Member
 from app.models.enums import MemberStatus
 from app.services.members_service import MembersService
+from app.services.member_importer import MemberImporter
+from app.ui.views.members_table_model import MembersTableModel
+
+class MemberImportRunner(QObject):
+    """Reads and validates an import file on a background thread; signals are delivered on the UI thread."""
+
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def start(self, importer: MemberImporter, path: str):
+        threading.Thread(target=self._run, args=(importer, path), name="MemberImport", daemon=True).start()
+
+    def _run(self, importer: MemberImporter, path: str):
+        try:
+            result = importer.read(path, progress=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(result)
 
 class MembersView(QWidget):
     """
@@ -33,6 +54,7 @@ class MembersView(QWidget):
         get_event_bus().subscribe(EventType.MEMBER_CREATED, self._on_member_created)
         get_event_bus().subscribe(EventType.MEMBER_UPDATED, self._on_member_updated)
         get_event_bus().subscribe(EventType.MEMBER_DELETED, self._on_member_deleted)
+        get_event_bus().subscribe(EventType.MEMBERS_IMPORTED, self._on_members_imported)
         get_event_bus().subscribe(EventType.DATA_REFRESH_REQUESTED, self._on_refresh_requested)
     
     def _on_member_created(self, event: Event):
@@ -53,6 +75,12 @@ class MembersView(QWidget):
         self.refresh()
         self._show_notification(f"Đã xóa thành viên: {event.data.name}")
     
+    def _on_members_imported(self, event: Event):
+        """Handle MEMBERS_IMPORTED event: one save and one refresh for the whole batch."""
+        self.save_callback()
+        self.refresh()
+        self._show_notification(f"Đã nhập {len(event.data['members'])} thành viên")
+    
     def _on_refresh_requested(self, event: Event):
         """Handle DATA_REFRESH_REQUESTED event."""
         if event.data == 'members' or event.data == 'all':
@@ -79,6 +107,10 @@ class MembersView(QWidget):
         btn_add.setIcon(qta.icon('fa5s.user-plus', color='white'))
         btn_add.setProperty("primary", True)
         btn_add.clicked.connect(self.on_add_clicked)
+        self.btn_import = QPushButton(" Nhập Excel/CSV")
+        self.btn_import.setIcon(qta.icon('fa5s.file-import', color='#475569'))
+        self.btn_import.clicked.connect(self.on_import_clicked)
+        header_layout.addWidget(self.btn_import)
         header_layout.addWidget(btn_add)
         
         layout.addLayout(header_layout)
@@ -97,86 +129,87 @@ class MembersView(QWidget):
         search_layout.addWidget(self.search_input)
         layout.addLayout(search_layout)
         
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "ID", "Tên", "SĐT", "Địa chỉ", "Số Dây", "C.Hốt", "Tổng Nợ", "Uy Tín", "Trạng thái"
-        ])
+        # Table (rows are served lazily by the model)
+        self.model = MembersTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.setAlternatingRowColors(True)
         self.table.setShowGrid(False)
         self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Fixed row height: the view never measures rows it does not show
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         self.table.doubleClicked.connect(self.on_row_double_clicked)
         
         layout.addWidget(self.table)
         
+        self.import_runner = MemberImportRunner(self)
+        self.import_runner.progress.connect(self.on_import_progress)
+        self.import_runner.finished.connect(self.on_import_finished)
+        self.import_runner.failed.connect(self.on_import_failed)
+        
         self.refresh()
     
     def refresh(self):
-        """Refresh table data."""
+        """Recompute member stats (one batch) and refresh the table."""
+        self.model.set_members(self._filtered_members(), self.service.get_all_stats())
+
+    def _filtered_members(self):
         query = self.search_input.text() if hasattr(self, 'search_input') else ""
-        
-        # Get data from service
-        members = self.service.search(query) if query else self.service.get_all()
-        
-        self.table.setRowCount(len(members))
-        
-        for row, m in enumerate(members):
-            stats = self.service.get_stats(m.id)
-            self._render_row(row, m, stats)
-    
-    def _render_row(self, row: int, member: Member, stats: dict):
-        """Render a table row."""
-        def item(text, alignment=Qt.AlignmentFlag.AlignLeft):
-            it = QTableWidgetItem(str(text))
-            it.setTextAlignment(alignment | Qt.AlignmentFlag.AlignVCenter)
-            return it
-        
-        self.table.setItem(row, 0, item(member.id[:8]))
-        self.table.setItem(row, 1, item(member.name))
-        self.table.setItem(row, 2, item(member.phone))
-        self.table.setItem(row, 3, item(member.address))
-        self.table.setItem(row, 4, item(stats['num_groups'], Qt.AlignmentFlag.AlignCenter))
-        self.table.setItem(row, 5, item(stats['num_collected'], Qt.AlignmentFlag.AlignCenter))
-        
-        debt_item = item(f"{stats['total_debt']:,.0f}", Qt.AlignmentFlag.AlignRight)
-        if stats['total_debt'] > 0:
-            debt_item.setForeground(QColor("#DC2626"))
-        self.table.setItem(row, 6, debt_item)
-        
-        rep_item = item(member.reputationScore, Qt.AlignmentFlag.AlignCenter)
-        if member.reputationScore >= 90:
-            rep_item.setForeground(QColor("#059669"))
-        elif member.reputationScore < 50:
-            rep_item.setForeground(QColor("#DC2626"))
-        self.table.setItem(row, 7, rep_item)
-        
-        status_item = item(member.status, Qt.AlignmentFlag.AlignCenter)
-        if member.is_high_risk():
-            status_item.setForeground(QColor("#DC2626"))
-            for col in range(self.table.columnCount()):
-                cell = self.table.item(row, col)
-                if cell:
-                    cell.setBackground(QColor("#FEF2F2"))
-        
-        self.table.setItem(row, 8, status_item)
-        self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, member)
+        return self.service.search(query) if query else self.service.get_all()
     
     def on_search_changed(self):
-        """Handle search input change."""
-        self.refresh()
+        """Handle search input change: only the rows change, stats are reused."""
+        self.model.set_members(self._filtered_members())
     
     def on_add_clicked(self):
         """Handle add button click."""
         dialog = MemberDialog(self, None, self.service)
         dialog.exec()
     
+    def on_import_clicked(self):
+        """Pick a file and read it in the background."""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Nhập thành viên", "", "Excel/CSV (*.xlsx *.xlsm *.csv)"
+        )
+        if not path:
+            return
+        self.btn_import.setEnabled(False)
+        self.btn_import.setText(" Đang đọc...")
+        self.import_runner.start(MemberImporter(self.service.registry), path)
+    
+    def on_import_progress(self, rows: int):
+        self.btn_import.setText(f" Đang đọc... {rows:,} dòng")
+    
+    def on_import_finished(self, result):
+        """Create the validated rows in one batch (on the UI thread, which owns the member list)."""
+        self._reset_import_button()
+        try:
+            created = self.service.bulk_create(result.rows)
+        except ValueError as e:
+            QMessageBox.warning(self, "Lỗi", str(e))
+            return
+        message = f"Đã nhập {len(created):,}/{result.total:,} dòng."
+        if result.skipped:
+            lines = [f"Dòng {s.row}: {s.reason}" for s in result.skipped[:10]]
+            if len(result.skipped) > 10:
+                lines.append(f"... và {len(result.skipped) - 10:,} dòng khác")
+            message += f"\nBỏ qua {len(result.skipped):,} dòng:\n" + "\n".join(lines)
+        QMessageBox.information(self, "Nhập thành viên", message)
+    
+    def on_import_failed(self, error: str):
+        self._reset_import_button()
+        QMessageBox.warning(self, "Lỗi", error)
+    
+    def _reset_import_button(self):
+        self.btn_import.setEnabled(True)
+        self.btn_import.setText(" Nhập Excel/CSV")
+    
     def on_row_double_clicked(self, index):
         """Handle row double click."""
-        member = self.table.item(index.row(), 0).data(Qt.ItemDataRole.UserRole)
+        member = self.model.member_at(index.row())
         dialog = MemberDialog(self, member, self.service)
         dialog.exec()
     
@@ -186,6 +219,7 @@ class MembersView(QWidget):
         get_event_bus().unsubscribe(EventType.MEMBER_CREATED, self._on_member_created)
         get_event_bus().unsubscribe(EventType.MEMBER_UPDATED, self._on_member_updated)
         get_event_bus().unsubscribe(EventType.MEMBER_DELETED, self._on_member_deleted)
+        get_event_bus().unsubscribe(EventType.MEMBERS_IMPORTED, self._on_members_imported)
         get_event_bus().unsubscribe(EventType.DATA_REFRESH_REQUESTED, self._on_refresh_requested)
         super().closeEvent(event)
 
@@ -0,0 +1,41 @@
+"""
+Crash-safe file writes, and reads of append-only JSON-lines logs.
+"""
+import json
+import os
+from typing import List
+
+def write_json_atomic(path: str, data, indent=None):
+    """Write JSON to a temp file and rename it over `path` so readers never see a partial file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def read_json_lines(path: str, repair: bool = False) -> List[dict]:
+    """
+    Records of a JSON-lines file up to the first torn line (a crash while
+    appending); everything before it is intact. With `repair`, the file is
+    truncated to that intact prefix, so the next append starts on a fresh
+    line instead of being glued onto the fragment.
+    """
+    records = []
+    intact = 0 # Byte length of the complete lines read so far
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+            intact += len(line)
+        torn = f.seek(0, os.SEEK_END) > intact
+    if repair and torn:
+        with open(path, 'r+b') as f:
+            f.truncate(intact)
+            f.flush()
+            os.fsync(f.fileno())
+    return records
@@ -0,0 +1,43 @@
+"""
+Cashflow projection benchmark: portfolio of random groups over a multi-year horizon.
+
+Usage: python -m benchmarks.bench_cashflow [groups] [years]   (default: 500 groups, 3 years)
+"""
+import datetime
+import random
+import sys
+import time
+from data_models import HuiGroup, HuiType, HuiStatus
+from services.cashflow_service import CashflowService, add_months
+
+DEFAULT_GROUPS = 500
+DEFAULT_YEARS = 3
+
+def make_groups(count, seed=0):
+    rng = random.Random(seed)
+    today = datetime.date.today()
+    groups = []
+    for i in range(count):
+        slots = rng.randint(5, 60)
+        start = today - datetime.timedelta(days=rng.randint(0, 400))
+        groups.append(HuiGroup(
+            id=f"g{i}", name=f"Hui {i}", type=rng.choice(list(HuiType)).value,
+            amountPerShare=rng.choice((500000, 1000000, 2000000)), commissionRate=rng.choice((1, 2, 2.5)),
+            totalMembers=slots, startDate=start.isoformat(), status=HuiStatus.ACTIVE.value,
+            members=[f"m{j}" for j in range(slots)], currentPeriod=rng.randint(1, slots)
+        ))
+    return groups
+
+def main(group_count, years):
+    groups = make_groups(group_count)
+    start = datetime.date.today()
+    end = add_months(start, 12 * years)
+    for bucket in ('month', 'week', 'day'):
+        began = time.perf_counter()
+        projection = CashflowService.project(groups, start=start, end=end, bucket=bucket)
+        elapsed = time.perf_counter() - began
+        print(f"{group_count} groups, {years}y, {bucket:<6} {len(projection):>5} buckets  {elapsed * 1000:8.1f} ms")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_GROUPS,
+         int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_YEARS)
@@ -0,0 +1,63 @@
+"""
+Excel export benchmark: all member statements and group ledgers of a generated
+portfolio, with the peak memory allocated by the export itself.
+
+Usage: python -m benchmarks.bench_export [members] [transactions]   (default: 2000 members, 50000 transactions)
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from data_models import AppState, HuiGroup, HuiType, HuiStatus, Member, Transaction
+from services.export_service import ExportService
+
+DEFAULT_MEMBERS = 2000
+DEFAULT_TRANSACTIONS = 50_000
+SLOTS = 20
+
+def make_state(members, transactions):
+    groups = [
+        HuiGroup(id=f"g{i}", name=f"Hui {i}", type=HuiType.MONTHLY.value, amountPerShare=1000000,
+                 commissionRate=2, totalMembers=SLOTS, startDate="2024-01-01", status=HuiStatus.ACTIVE.value,
+                 members=[f"m{(i * SLOTS + j) % members}" for j in range(SLOTS)], currentPeriod=SLOTS)
+        for i in range(max(1, members // SLOTS))
+    ]
+    txs = []
+    for i in range(transactions):
+        group = groups[i % len(groups)]
+        period = i // len(groups) % SLOTS + 1
+        txs.append(Transaction(id=f"t{i}", huiGroupId=group.id, memberId=group.members[i % SLOTS],
+                               type='CONTRIBUTE', amount=900000, date="2024-06-01", period=period))
+    state = AppState(
+        members=[Member(id=f"m{i}", name=f"Thành viên {i}", phone=f"09{i:08d}", address="", joinDate="")
+                 for i in range(members)],
+        groups=groups, transactions=txs
+    )
+    # Build the indexes the app keeps warm
+    state.store.sync(state.transactions)
+    state.registry.sync(state.members)
+    return state
+
+def main(members, transactions):
+    state = make_state(members, transactions)
+    print(f"{members:,} members, {transactions:,} transactions")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, export in (("statements", ExportService.export_member_statements),
+                             ("ledgers", ExportService.export_group_ledgers)):
+            path = os.path.join(tmp, f"{name}.xlsx")
+            start = time.perf_counter()
+            rows = export(state, path)
+            elapsed = time.perf_counter() - start
+
+            # Separate pass: tracing slows openpyxl's XML writer down several times
+            tracemalloc.start()
+            export(state, path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"  {name:<10} {rows:>9,} rows  {elapsed:6.1f} s  peak {peak / 2**20:6.1f} MiB  "
+                  f"file {os.path.getsize(path) / 2**20:5.1f} MiB")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MEMBERS,
+         int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TRANSACTIONS)
@@ -0,0 +1,72 @@
+"""
+IRR benchmark: batched Newton/bisection (solve_irr) vs. a per-slot scalar solver.
+
+Usage: python -m benchmarks.bench_irr [slots] [periods]   (default: 5000 slots, 24 periods)
+"""
+import sys
+import time
+import numpy as np
+from services.irr_service import solve_irr, MIN_RATE, MAX_RATE, TOLERANCE
+
+DEFAULT_SLOTS = 5000
+DEFAULT_PERIODS = 24
+
+def make_cashflows(slots, periods, seed=0):
+    """Slots of a 1M hụi with random bids, each winning one period."""
+    rng = np.random.default_rng(seed)
+    V = 1_000_000
+    bids = rng.integers(0, 30, size=periods) * 10_000
+    win = rng.integers(1, periods + 1, size=slots)
+    P = np.arange(1, periods + 1)
+    pot = (P - 1) * V + (periods - P) * (V - bids)
+    cf = np.where(P[None, :] < win[:, None], -(V - bids)[None, :], -V).astype(np.float64)
+    cf[np.arange(slots), win - 1] = pot[win - 1] - 20_000
+    return cf
+
+def scalar_irr(row):
+    """Newton then bisection, one slot at a time (the loop solve_irr replaces)."""
+    t = range(len(row))
+    npv = lambda r: sum(c / (1 + r) ** k for k, c in zip(t, row))
+    r = 0.0
+    for _ in range(50):
+        f = npv(r)
+        df = sum(-k * c / (1 + r) ** (k + 1) for k, c in zip(t, row))
+        if df == 0:
+            break
+        new = r - f / df
+        if not MIN_RATE < new < MAX_RATE:
+            break
+        if abs(new - r) < TOLERANCE:
+            return new
+        r = new
+    lo, hi = MIN_RATE, MAX_RATE
+    if (npv(lo) > 0) == (npv(hi) > 0):
+        return float('nan')
+    while hi - lo > TOLERANCE:
+        mid = (lo + hi) / 2
+        if (npv(mid) > 0) == (npv(lo) > 0):
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+def main(slots, periods):
+    cf = make_cashflows(slots, periods)
+
+    start = time.perf_counter()
+    batched = solve_irr(cf)
+    batched_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = np.array([scalar_irr(row) for row in cf.tolist()])
+    scalar_s = time.perf_counter() - start
+
+    both = ~np.isnan(batched) & ~np.isnan(scalar)
+    print(f"{slots:,} slots x {periods} periods")
+    print(f"  batched   {batched_s * 1000:9.1f} ms")
+    print(f"  scalar    {scalar_s * 1000:9.1f} ms")
+    print(f"  max |diff| {np.abs(batched[both] - scalar[both]).max(initial=0):.2e}")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SLOTS,
+         int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PERIODS)
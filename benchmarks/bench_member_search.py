@@ -0,0 +1,52 @@
+"""
+Member search benchmark: MemberSearchIndex vs. the linear substring scan it replaces.
+
+Usage: python -m benchmarks.bench_member_search [members]   (default: 50000)
+"""
+import sys
+import time
+import numpy as np
+from app.models.member import Member
+from app.services.member_search_index import MemberSearchIndex
+
+DEFAULT_MEMBERS = 50000
+FAMILY = ["Nguyễn", "Trần", "Lê", "Phạm", "Hoàng", "Huỳnh", "Phan", "Vũ", "Võ", "Đặng", "Bùi", "Đỗ"]
+MIDDLE = ["Văn", "Thị", "Hữu", "Minh", "Ngọc", "Thanh", "Quốc"]
+GIVEN = ["An", "Bình", "Cường", "Dũng", "Hằng", "Lan", "Linh", "Nam", "Phúc", "Tâm", "Thảo", "Yến"]
+QUERIES = ["nguyen", "tran thi lan", "dang", "0903", "45678", "vo minh phuc"]
+ROUNDS = 100
+
+def make_members(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        Member(id=str(i), name=f"{rng.choice(FAMILY)} {rng.choice(MIDDLE)} {rng.choice(GIVEN)}",
+               phone=f"09{rng.integers(0, 10**8):08d}", address="", joinDate="")
+        for i in range(count)
+    ]
+
+def linear_search(members, query):
+    query_lower = query.lower()
+    return [m for m in members if query_lower in m.name.lower() or query_lower in m.phone]
+
+def main(count):
+    members = make_members(count)
+
+    start = time.perf_counter()
+    index = MemberSearchIndex(members, subscribe=False)
+    build_s = time.perf_counter() - start
+
+    print(f"{count:,} members, index built in {build_s * 1000:.0f} ms")
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            hits = index.search(query)
+        indexed_ms = (time.perf_counter() - start) * 1000 / ROUNDS
+
+        start = time.perf_counter()
+        for _ in range(10):
+            linear_search(members, query)
+        linear_ms = (time.perf_counter() - start) * 1000 / 10
+        print(f"  {query!r:16} {len(hits):6,} hits  index {indexed_ms:8.3f} ms  linear {linear_ms:8.3f} ms")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MEMBERS)
@@ -0,0 +1,64 @@
+"""
+Memory benchmark: slotted Transaction/AuditLog vs. the previous
+__dict__-backed dataclasses.
+
+Usage: python -m benchmarks.bench_model_memory [rows ...]   (default: 100000 1000000)
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from dataclasses import make_dataclass, fields
+from data_models import Transaction, AuditLog
+
+DEFAULT_ROWS = (100_000, 1_000_000)
+
+def _legacy(model):
+    """Same fields as `model`, but a plain dataclass with a per-instance __dict__."""
+    return make_dataclass('Legacy' + model.__name__,
+                          [(f.name, f.type, f) for f in fields(model)])
+
+def _transaction_row(i: int) -> dict:
+    return {
+        'id': f"tx_{i}", 'huiGroupId': f"g{i % 50}", 'memberId': f"m{i % 400}",
+        'type': 'CONTRIBUTE' if i % 10 else 'COLLECT', 'amount': 900000 + i % 7 * 10000,
+        'date': "2024-06-01T10:00:00", 'period': i % 24 + 1,
+    }
+
+def _audit_log_row(i: int) -> dict:
+    return {
+        'id': f"log_{i}", 'timestamp': "2024-06-01T10:00:00", 'action': 'PAYMENT', 'userId': 'admin',
+        'scenario': "Đóng hụi", 'stateBefore': {}, 'inputParameters': {}, 'resultCalculated': {},
+        'huiGroupId': f"g{i % 50}",
+    }
+
+def measure(model, make_row, rows: int):
+    """Return (bytes allocated, seconds) for building `rows` instances of `model`."""
+    data = [make_row(i) for i in range(rows)]
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = [model(**d) for d in data]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size, elapsed
+
+def main(row_counts):
+    cases = [
+        ('Transaction', Transaction, _transaction_row),
+        ('AuditLog', AuditLog, _audit_log_row),
+    ]
+    print(f"{'model':<12} {'rows':>9} {'dict MB':>9} {'slots MB':>9} {'saved':>7} {'dict s':>7} {'slots s':>7}")
+    for name, model, make_row in cases:
+        legacy = _legacy(model)
+        for rows in row_counts:
+            old_size, old_time = measure(legacy, make_row, rows)
+            new_size, new_time = measure(model, make_row, rows)
+            saved = 1 - new_size / old_size
+            print(f"{name:<12} {rows:>9} {old_size / 1e6:>9.1f} {new_size / 1e6:>9.1f} "
+                  f"{saved:>6.0%} {old_time:>7.2f} {new_time:>7.2f}")
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_ROWS)
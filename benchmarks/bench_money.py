@@ -0,0 +1,69 @@
+"""
+Money benchmark: float vs. Decimal vs. integer đồng.
+
+- debt: the per-period shortfall loop of FinanceService.get_member_total_debt
+  (the hot path; pure add/sub/mul of amounts)
+- commission: percentage commission of one payout, plus how often float math
+  misses the exact whole-đồng result
+
+Usage: python -m benchmarks.bench_money [iterations]   (default: 1000000)
+"""
+import sys
+import time
+from decimal import Decimal, ROUND_HALF_UP
+from app.models.money import to_money, percent_of
+
+DEFAULT_ITERATIONS = 1_000_000
+SHARES = (500_000, 1_000_000, 1_500_000, 2_000_000, 5_000_000)
+BIDS = (0, 50_000, 100_000)
+RATES = tuple(r / 10 for r in range(1, 101)) # 0.1% .. 10%
+
+def debt_loop(V, bids, paid, slots):
+    """Same arithmetic as get_member_total_debt for one member over len(bids) periods."""
+    total = 0
+    for p, bid in enumerate(bids):
+        dead = p * slots // len(bids)
+        shortfall = dead * V + (slots - dead) * (V - bid) - paid[p]
+        if shortfall > 0:
+            total += shortfall
+    return total
+
+def commission_float(V, rate):
+    return V * rate / 100
+
+def commission_decimal(V, rate):
+    return (V * rate / 100).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+def bench_debt(convert, iterations):
+    periods = 24
+    bids = [convert(BIDS[p % 3]) for p in range(periods)]
+    paid = [convert(SHARES[1] - BIDS[p % 3] if p % 5 else 0) for p in range(periods)]
+    V = convert(SHARES[1])
+    return timed(lambda: [debt_loop(V, bids, paid, 2) for _ in range(iterations // periods)])
+
+def bench_commission(fn, convert, iterations):
+    shares = [convert(v) for v in SHARES]
+    rates = [Decimal(repr(r)) for r in RATES] if convert is Decimal else list(RATES)
+    return timed(lambda: [fn(shares[i % 5], rates[i % 100]) for i in range(iterations)])
+
+def inexact_commissions():
+    """Commissions whose float result is not the exact whole-đồng value."""
+    return sum(1 for V in SHARES for rate in RATES if V * rate / 100 != percent_of(V, rate))
+
+def main(iterations):
+    print(f"{iterations:,} iterations{'':4}{'debt s':>8}{'commission s':>14}")
+    for name, commission, convert in (('float', commission_float, float),
+                                      ('Decimal', commission_decimal, Decimal),
+                                      ('int đồng', percent_of, to_money)):
+        debt_s = bench_debt(convert, iterations)
+        commission_s = bench_commission(commission, convert, iterations)
+        print(f"  {name:<20}{debt_s:>8.2f}{commission_s:>14.2f}")
+    print(f"float commissions that are not exact: {inexact_commissions()}/{len(SHARES) * len(RATES)}")
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS)
@@ -0,0 +1,52 @@
+"""
+Aggregation benchmark: TransactionStore vs. Python loops over Transaction objects.
+
+Usage: python -m benchmarks.bench_transaction_store [rows ...]   (default: 100000 1000000)
+"""
+import sys
+import time
+from data_models import Transaction
+from app.models.transaction_store import TransactionStore
+
+DEFAULT_ROWS = (100_000, 1_000_000)
+
+def make_transactions(rows: int):
+    return [
+        Transaction(id=f"tx_{i}", huiGroupId=f"g{i % 50}", memberId=f"m{i % 400}",
+                    type='CONTRIBUTE' if i % 10 else 'COLLECT', amount=900000 + i % 7 * 10000,
+                    netAmount=0 if i % 10 else 8500000, date="", period=i % 24 + 1)
+        for i in range(rows)
+    ]
+
+def loop_stats(transactions):
+    total_in = sum(t.amount for t in transactions if t.type == 'CONTRIBUTE')
+    total_out = sum((t.netAmount or t.amount) for t in transactions if t.type == 'COLLECT')
+    by_group = {}
+    for t in transactions:
+        if t.type == 'CONTRIBUTE':
+            by_group[t.huiGroupId] = by_group.get(t.huiGroupId, 0) + t.amount
+    return total_in, total_out, by_group
+
+def store_stats(store: TransactionStore):
+    total_in = store.total('amount', tx_type='CONTRIBUTE')
+    total_out = store.total('payout', tx_type='COLLECT')
+    by_group = store.sum_by('group', tx_type='CONTRIBUTE')
+    return total_in, total_out, by_group
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+def main(row_counts):
+    print(f"{'rows':>9} {'build ms':>9} {'loop ms':>9} {'store ms':>9}")
+    for rows in row_counts:
+        transactions = make_transactions(rows)
+        store, build_ms = timed(TransactionStore, transactions)
+        expected, loop_ms = timed(loop_stats, transactions)
+        result, store_ms = timed(store_stats, store)
+        assert result[:2] == expected[:2]
+        print(f"{rows:>9} {build_ms:>9.1f} {loop_ms:>9.1f} {store_ms:>9.1f}")
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_ROWS)
@@ -0,0 +1,105 @@
+"""
+Binary snapshot format (data.snapshot).
+Sections are pickled (protocol 5) row tuples behind a small section table.
+Members and groups are decoded at load time; transactions and audit logs
+stay encoded until first accessed.
+
+Layout: MAGIC | version (1 byte) | header length (uint32 LE) | header | sections
+
+Snapshots hold only builtin values, so they are read with an unpickler that
+refuses every global: a crafted file cannot import or call anything.
+"""
+import io
+import os
+import pickle
+import struct
+from dataclasses import fields
+from data_models import AppState, Member, HuiGroup, Transaction, AuditLog
+from app.models.archive_summary import ArchiveSummary
+from app.models.lazy_section import LazySection
+
+SNAPSHOT_FILE = "data.snapshot"
+MAGIC = b"SHUI"
+VERSION = 1
+
+# section name -> (model class, decoded at load time)
+SECTIONS = {
+    'members': (Member, True),
+    'groups': (HuiGroup, True),
+    'transactions': (Transaction, False),
+    'auditLogs': (AuditLog, False),
+    'archives': (ArchiveSummary, True),
+}
+
+class _RestrictedUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Snapshot references forbidden global {module}.{name}")
+
+def _loads(raw: bytes):
+    return _RestrictedUnpickler(io.BytesIO(raw)).load()
+
+def _field_names(model) -> tuple:
+    return tuple(f.name for f in fields(model))
+
+def _encode(model, items) -> bytes:
+    # Field names travel with the rows so older snapshots stay readable
+    names = _field_names(model)
+    return pickle.dumps((names, [tuple(getattr(item, n) for n in names) for item in items]), protocol=5)
+
+def _decoder(model):
+    def decode(raw: bytes) -> list:
+        names, rows = _loads(raw)
+        if tuple(names) == _field_names(model):
+            return [model(*row) for row in rows]
+        return [model.from_dict(dict(zip(names, row))) for row in rows]
+    return decode
+
+def write_snapshot(state: AppState, path: str = SNAPSHOT_FILE):
+    """Write the state atomically. Untouched lazy sections are copied without decoding."""
+    header = {}
+    blobs = []
+    offset = 0
+    for name, (model, _) in SECTIONS.items():
+        items = getattr(state, name)
+        raw = items.raw if isinstance(items, LazySection) else None
+        if raw is None:
+            raw = _encode(model, items)
+        header[name] = {'offset': offset, 'length': len(raw), 'count': len(items)}
+        blobs.append(raw)
+        offset += len(raw)
+
+    header_bytes = pickle.dumps(header, protocol=5)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + bytes([VERSION]) + struct.pack('<I', len(header_bytes)))
+        f.write(header_bytes)
+        for raw in blobs:
+            f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def read_snapshot(path: str = SNAPSHOT_FILE) -> AppState:
+    """Load a snapshot; transactions and audit logs are decoded on first access."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != MAGIC:
+        raise ValueError(f"{path} is not a SmartHui snapshot")
+    if data[4] != VERSION:
+        raise ValueError(f"Unsupported snapshot version {data[4]}")
+    (header_len,) = struct.unpack_from('<I', data, 5)
+    body_start = 9 + header_len
+    header = _loads(data[9:body_start])
+
+    view = memoryview(data)
+    sections = {}
+    for name, (model, eager) in SECTIONS.items():
+        entry = header.get(name)
+        if entry is None:
+            # Section added after this snapshot was written
+            continue
+        start = body_start + entry['offset']
+        raw = bytes(view[start:start + entry['length']])
+        decode = _decoder(model)
+        sections[name] = decode(raw) if eager else LazySection(raw, entry['count'], decode)
+    return AppState(**sections)
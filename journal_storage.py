@@ -0,0 +1,167 @@
+"""
+Write-ahead journal for the JSON snapshot (data.json).
+Each save appends new transactions, audit logs and member/group edits as
+JSON lines; the full snapshot is only rewritten on checkpoint.
+"""
+import json
+import os
+from typing import Callable, Dict, List
+from data_models import AppState, Member, HuiGroup, Transaction, AuditLog
+from app.models.archive_summary import ArchiveSummary
+from app.utils.atomic_write import read_json_lines, write_json_atomic
+
+JOURNAL_FILE = "data.journal"
+CHECKPOINT_EVERY = 500 # Journal records between snapshot rewrites
+
+class Journal:
+    """
+    Snapshot + append-only journal.
+    Records carry a sequence number and the snapshot stores the last one it
+    includes, so replaying after a crash between checkpoint steps is idempotent.
+    """
+
+    def __init__(self, snapshot_path: str, journal_path: str = JOURNAL_FILE,
+                 checkpoint_every: int = CHECKPOINT_EVERY):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.checkpoint_every = checkpoint_every
+        self.seq = 0
+        self.pending = 0
+        self._saved_members: Dict[str, dict] = {}
+        self._saved_groups: Dict[str, dict] = {}
+        self._saved_archives: Dict[str, dict] = {}
+        self._tx_count = 0
+        self._log_count = 0
+        self._revision = 0 # AppState.revision of the last load/append/checkpoint
+
+    # --- Loading ---
+
+    def load(self, default_factory: Callable[[], AppState]) -> AppState:
+        """Load the last snapshot and replay journal records written after it."""
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            state = AppState.from_dict(data)
+            self.seq = data.get('journalSeq', 0)
+        else:
+            state = default_factory()
+            self.seq = 0
+
+        self.pending = 0
+        if os.path.exists(self.journal_path):
+            # Drop a torn last line now, before the next append lands after it
+            records = read_json_lines(self.journal_path, repair=True)
+            replayer = _Replayer(state)
+            for record in records:
+                if record['seq'] <= self.seq:
+                    continue
+                replayer.apply(record)
+                self.seq = record['seq']
+                self.pending += 1
+
+        self._mark_saved(state)
+        return state
+
+    # --- Saving ---
+
+    def _mark_saved(self, state: AppState):
+        self._saved_members = {m.id: dict(m.to_dict()) for m in state.members}
+        self._saved_groups = {g.id: {**g.to_dict(), 'members': list(g.members)} for g in state.groups}
+        self._saved_archives = {a.id: dict(a.to_dict()) for a in state.archives}
+        self._tx_count = len(state.transactions)
+        self._log_count = len(state.auditLogs)
+        self._revision = state.revision
+
+    def _changes(self, state: AppState) -> List[dict]:
+        """Journal records for everything changed since the last append/checkpoint."""
+        records = []
+        for op, items, saved in (('member', state.members, self._saved_members),
+                                 ('group', state.groups, self._saved_groups),
+                                 ('archive', state.archives, self._saved_archives)):
+            current = {item.id: item.to_dict() for item in items}
+            for item_id, data in current.items():
+                if saved.get(item_id) != data:
+                    records.append({'op': op, 'data': data})
+            for item_id in saved:
+                if item_id not in current:
+                    records.append({'op': op + '_deleted', 'id': item_id})
+        records.extend({'op': 'transaction', 'data': t.to_dict()} for t in state.transactions[self._tx_count:])
+        records.extend({'op': 'auditLog', 'data': l.to_dict()} for l in state.auditLogs[self._log_count:])
+        return records
+
+    def append(self, state: AppState) -> int:
+        """
+        Append changes to the journal, checkpointing every `checkpoint_every` records.
+        Returns the number of records written.
+        """
+        if (state.revision != self._revision
+                or len(state.transactions) < self._tx_count or len(state.auditLogs) < self._log_count):
+            # History was rewritten in place or truncated (e.g. archived); it cannot be expressed as appends
+            self.checkpoint(state)
+            return 0
+
+        records = self._changes(state)
+        if records:
+            lines = []
+            for record in records:
+                self.seq += 1
+                record['seq'] = self.seq
+                lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self.pending += len(records)
+            self._mark_saved(state)
+
+        if self.pending >= self.checkpoint_every:
+            self.checkpoint(state)
+        return len(records)
+
+    def checkpoint(self, state: AppState):
+        """Rewrite the snapshot atomically and start an empty journal."""
+        data = state.to_dict()
+        data['journalSeq'] = self.seq
+        write_json_atomic(self.snapshot_path, data, indent=2)
+        # A crash here leaves an old journal whose records are all <= journalSeq
+        with open(self.journal_path, 'w', encoding='utf-8'):
+            pass
+        self.pending = 0
+        self._mark_saved(state)
+
+class _Replayer:
+    """Applies journal records to an AppState."""
+
+    def __init__(self, state: AppState):
+        self.state = state
+
+    def apply(self, record: dict):
+        op = record['op']
+        if op == 'transaction':
+            self.state.transactions.append(Transaction.from_dict(record['data']))
+        elif op == 'auditLog':
+            self.state.auditLogs.append(AuditLog.from_dict(record['data']))
+        elif op == 'member':
+            self._upsert(self.state.members, Member.from_dict(record['data']))
+        elif op == 'member_deleted':
+            self._delete(self.state.members, record['id'])
+        elif op == 'group':
+            self._upsert(self.state.groups, HuiGroup.from_dict(record['data']))
+        elif op == 'group_deleted':
+            self._delete(self.state.groups, record['id'])
+        elif op == 'archive':
+            self._upsert(self.state.archives, ArchiveSummary.from_dict(record['data']))
+        elif op == 'archive_deleted':
+            self._delete(self.state.archives, record['id'])
+
+    @staticmethod
+    def _upsert(items: list, new_item):
+        for i, item in enumerate(items):
+            if item.id == new_item.id:
+                items[i] = new_item
+                return
+        items.append(new_item)
+
+    @staticmethod
+    def _delete(items: list, item_id: str):
+        items[:] = [item for item in items if item.id != item_id]
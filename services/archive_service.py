@@ -0,0 +1,145 @@
+import json
+import os
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+from data_models import AppState, HuiGroup, Transaction, AuditLog, HuiStatus
+from app.models.archive_summary import ArchiveSummary
+from app.models.money import Money
+from app.utils.atomic_write import write_json_atomic
+from services.finance_service import FinanceService
+
+ARCHIVE_DIR = "archive"
+
+class ArchivedGroup:
+    def __init__(self, group, transactions, auditLogs):
+        self.group = group
+        self.transactions = transactions
+        self.auditLogs = auditLogs
+
+class ArchiveService:
+    @staticmethod
+    def summarize(group: HuiGroup, transactions: List[Transaction], audit_logs: List[AuditLog], segment_file: str) -> ArchiveSummary:
+        total_contributed = 0
+        total_collected = 0
+        collected_periods = 0
+        for t in transactions:
+            if t.type == 'CONTRIBUTE':
+                total_contributed += t.amount
+            elif t.type == 'COLLECT':
+                total_collected += t.netAmount or t.amount
+                collected_periods += 1
+        debts = FinanceService.compute_all_debts([group], transactions)
+
+        return ArchiveSummary(
+            id=group.id,
+            name=group.name,
+            type=group.type,
+            amountPerShare=group.amountPerShare,
+            archivedAt=datetime.now().isoformat(),
+            segmentFile=segment_file,
+            members=list(group.members),
+            transactionCount=len(transactions),
+            auditLogCount=len(audit_logs),
+            totalContributed=total_contributed,
+            totalCollected=total_collected,
+            totalCommission=FinanceService.commission_per_period(group) * collected_periods,
+            memberDebts={m: d for m, d in debts.byMember.items() if d}
+        )
+
+    @staticmethod
+    def archive_completed_groups(state: AppState, archive_dir: str = ARCHIVE_DIR) -> List[ArchiveSummary]:
+        """
+        Move COMPLETED groups, their transactions and audit logs into per-group
+        segment files and keep only a summary in the hot state. Debt still
+        owed in those groups is kept per member in the summary.
+        Audit logs without a huiGroupId belong to no group and stay hot.
+        """
+        completed = {g.id: g for g in state.groups if g.status == HuiStatus.COMPLETED.value}
+        if not completed:
+            return []
+        os.makedirs(archive_dir, exist_ok=True)
+
+        # One pass over the history, splitting hot and archived rows
+        archived_txs: Dict[str, List[Transaction]] = {gid: [] for gid in completed}
+        hot_txs = []
+        for t in state.transactions:
+            if t.huiGroupId in completed:
+                archived_txs[t.huiGroupId].append(t)
+            else:
+                hot_txs.append(t)
+
+        archived_logs: Dict[str, List[AuditLog]] = {gid: [] for gid in completed}
+        hot_logs = []
+        for l in state.auditLogs:
+            if l.huiGroupId in completed:
+                archived_logs[l.huiGroupId].append(l)
+            else:
+                hot_logs.append(l)
+
+        summaries = []
+        for gid, group in completed.items():
+            segment_file = os.path.join(archive_dir, f"{gid}.json")
+            write_json_atomic(segment_file, {
+                'group': group.to_dict(),
+                'transactions': [t.to_dict() for t in archived_txs[gid]],
+                'auditLogs': [l.to_dict() for l in archived_logs[gid]]
+            })
+            summaries.append(ArchiveService.summarize(group, archived_txs[gid], archived_logs[gid], segment_file))
+
+        # Mutate in place: services and views hold references to these lists
+        state.transactions[:] = hot_txs
+        state.auditLogs[:] = hot_logs
+        state.groups[:] = [g for g in state.groups if g.id not in completed]
+        state.archives.extend(summaries)
+        state.history_rewritten()
+        return summaries
+
+    @staticmethod
+    def load_segment(summary: ArchiveSummary) -> ArchivedGroup:
+        with open(summary.segmentFile, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return ArchivedGroup(
+            HuiGroup.from_dict(data['group']),
+            [Transaction.from_dict(t) for t in data['transactions']],
+            [AuditLog.from_dict(l) for l in data['auditLogs']]
+        )
+
+    @staticmethod
+    def iter_member_transactions(member_id: str, state: AppState, include_hot: bool = True,
+                                 load_segment: Optional[Callable[[ArchiveSummary], ArchivedGroup]] = None
+                                 ) -> Iterator[Transaction]:
+        """
+        Full transaction history of a member: archived groups first (loaded on
+        demand, only those the member held slots in), then the hot state.
+        `load_segment` replaces ArchiveService.load_segment (e.g. a cached loader).
+        """
+        load_segment = load_segment or ArchiveService.load_segment
+        for summary in state.archives:
+            if member_id not in summary.members:
+                continue
+            for t in load_segment(summary).transactions:
+                if t.memberId == member_id:
+                    yield t
+        if include_hot:
+            for t in state.transactions:
+                if t.memberId == member_id:
+                    yield t
+
+    @staticmethod
+    def archived_totals(state: AppState) -> Dict[str, Money]:
+        """Precomputed totals over all archived groups (no segment is loaded)."""
+        return {
+            'contributed': sum(a.totalContributed for a in state.archives),
+            'collected': sum(a.totalCollected for a in state.archives),
+            'commission': sum(a.totalCommission for a in state.archives),
+            'badDebt': sum(a.totalBadDebt for a in state.archives),
+        }
+
+    @staticmethod
+    def archived_member_debts(archives: List[ArchiveSummary]) -> Dict[str, Money]:
+        """Debt each member still owes in archived groups."""
+        totals: Dict[str, Money] = {}
+        for summary in archives:
+            for member_id, debt in summary.memberDebts.items():
+                totals[member_id] = totals.get(member_id, 0) + debt
+        return totals
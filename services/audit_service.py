@@ -1,10 +1,12 @@
 from data_models import AuditLog, HuiGroup
 from datetime import datetime
+from app.models.money import Money
 import time
+import uuid
 
 class AuditService:
     @staticmethod
-    def create_collect_log(group: HuiGroup, winner_id: str, bid_amount: float, calculation_result) -> AuditLog:
+    def create_collect_log(group: HuiGroup, winner_id: str, bid_amount: Money, calculation_result) -> AuditLog:
         # calculation_result is expected to be a PayoutDetail object or dict access compatible
         # If it's an object use .attribute, if dict use ['key']
         # Since I defined PayoutDetail as a class, I'll access attributes.
@@ -29,7 +31,7 @@ class AuditService:
         }
         
         return AuditLog(
-            id=f"LOG-{int(time.time()*1000)}",
+            id=uuid.uuid4().hex,
             timestamp=datetime.now().isoformat(),
             action='COLLECT_EXECUTION',
             userId=winner_id,
@@ -50,13 +52,14 @@ class AuditService:
                 "netAmountReceived": cr.netReceived,
                 "logicDescription": f"Payout = ({cr.liveMembers} * (V - B)) + ({cr.deadMembers} * V) - Commission - Deductions"
             },
-            ai_context=ai_context
+            ai_context=ai_context,
+            huiGroupId=group.id
         )
 
     @staticmethod
-    def create_payment_log(group: HuiGroup, member_id: str, required_amount: float, paid_amount: float, remaining_amount: float) -> AuditLog:
+    def create_payment_log(group: HuiGroup, member_id: str, required_amount: Money, paid_amount: Money, remaining_amount: Money) -> AuditLog:
         return AuditLog(
-            id=f"LOG-{int(time.time()*1000)}",
+            id=uuid.uuid4().hex,
             timestamp=datetime.now().isoformat(),
             action='PAYMENT_RECORD',
             userId=member_id,
@@ -75,5 +78,6 @@ class AuditService:
             resultCalculated={
                 "remainingDebt": remaining_amount,
                 "logicDescription": f"Remaining = Required ({required_amount}) - Paid ({paid_amount})"
-            }
+            },
+            huiGroupId=group.id
         )
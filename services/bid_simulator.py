@@ -0,0 +1,106 @@
+from collections import Counter
+from typing import Dict, List, Optional
+import numpy as np
+from data_models import HuiGroup
+from app.models.money import Money, to_money
+from services.finance_service import FinanceService, PayoutDetail, Ledger
+
+DEFAULT_BID_STEP = 10000
+
+class BidSimulation:
+    """
+    Payout and contributions of one (group, period, winner) for a grid of bids.
+    Everything that does not depend on the bid (slot counts, commission, the
+    winner's old debt) is computed once; per-bid values are arrays over `bids`.
+    """
+
+    def __init__(self, group: HuiGroup, winner_id: Optional[str], bids: np.ndarray, live_members: int,
+                 dead_members: int, commission: Money, deductions: Money,
+                 member_ids: List[str], dead_slots: np.ndarray, live_slots: np.ndarray):
+        self.group = group
+        self.winner_id = winner_id
+        self.bids = bids
+        self.liveMembers = live_members
+        self.deadMembers = dead_members
+        self.commission = commission
+        self.deductions = deductions
+        self.memberIds = member_ids
+
+        V = group.amountPerShare
+        self.amountPerLive = V - bids
+        self.totalPot = live_members * self.amountPerLive + dead_members * V
+        self.netReceived = self.totalPot - commission - deductions
+        # (member x bid) amount each member owes this period
+        self.contributions = dead_slots[:, None] * V + live_slots[:, None] * self.amountPerLive[None, :]
+
+        self._step = int(bids[1] - bids[0]) if len(bids) > 1 else 0
+        self._dead_slots = dead_slots
+        self._live_slots = live_slots
+
+    def index(self, bid: Money) -> Optional[int]:
+        """Position of a bid on the grid, None if it falls between or outside grid points."""
+        if not len(self.bids):
+            return None
+        offset = bid - int(self.bids[0])
+        if self._step == 0:
+            return 0 if offset == 0 else None
+        i, remainder = divmod(offset, self._step)
+        return i if remainder == 0 and 0 <= i < len(self.bids) else None
+
+    def payout(self, bid: Money) -> PayoutDetail:
+        """Same result as FinanceService.calculate_payout, in constant time for any bid."""
+        V = self.group.amountPerShare
+        B = to_money(bid)
+        amount_per_live = V - B
+        total_pot = self.liveMembers * amount_per_live + self.deadMembers * V
+        net_received = total_pot - self.commission - self.deductions
+        return PayoutDetail(self.liveMembers, self.deadMembers, amount_per_live, V,
+                            total_pot, self.commission, self.deductions, net_received)
+
+    def contributions_at(self, bid: Money) -> Dict[str, Money]:
+        """Amount each member owes this period for a bid (winner owes nothing)."""
+        i = self.index(bid)
+        if i is not None:
+            return dict(zip(self.memberIds, self.contributions[:, i].tolist()))
+        per_live = self.group.amountPerShare - to_money(bid)
+        required = self._dead_slots * self.group.amountPerShare + self._live_slots * per_live
+        return dict(zip(self.memberIds, required.tolist()))
+
+    def max_bid_with_positive_payout(self) -> Optional[Money]:
+        """Highest simulated bid that still leaves the winner a non-negative payout."""
+        ok = np.flatnonzero(self.netReceived >= 0)
+        return int(self.bids[ok[-1]]) if len(ok) else None
+
+class BidSimulator:
+    @staticmethod
+    def bid_range(group: HuiGroup) -> range:
+        """Bids from 0 to maxBidLimit (or the share value when unlimited) in minBidStep steps."""
+        step = group.minBidStep or DEFAULT_BID_STEP
+        limit = group.maxBidLimit or group.amountPerShare
+        return range(0, limit + 1, step)
+
+    @staticmethod
+    def simulate(group: HuiGroup, winner_id: Optional[str], all_transactions: Ledger,
+                 period: Optional[int] = None, bids=None) -> BidSimulation:
+        """Simulate every bid of `bids` (default: bid_range(group)) for one winner."""
+        period = group.currentPeriod if period is None else period
+        ledger = FinanceService._ledger(all_transactions)
+        group_ledger = ledger.group(group.id)
+        bid_grid = np.array(BidSimulator.bid_range(group) if bids is None else list(bids), dtype=np.int64)
+
+        dead_members = group_ledger.dead_slots(period)
+        live_members = len(group.members) - dead_members - 1
+        commission = FinanceService.commission_per_period(group)
+        deductions = FinanceService.get_member_total_debt(winner_id, [group], ledger) if winner_id else 0
+
+        slots = Counter(group.members)
+        member_ids = list(slots)
+        dead_slots = np.array([group_ledger.dead_slots(period, m) for m in member_ids], dtype=np.int64)
+        live_slots = np.array([slots[m] for m in member_ids], dtype=np.int64) - dead_slots
+        if winner_id in slots:
+            # The winner of the current period does not contribute
+            i = member_ids.index(winner_id)
+            dead_slots[i] = live_slots[i] = 0
+
+        return BidSimulation(group, winner_id, bid_grid, live_members, dead_members, commission,
+                             deductions, member_ids, dead_slots, live_slots)
@@ -0,0 +1,166 @@
+"""
+Cashflow projection.
+Expands each active group's period calendar (by HuiType), projects the
+contributions collected, the pot paid out and the commission of every
+remaining period, and sums them into date buckets.
+"""
+import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+import numpy as np
+from data_models import HuiGroup, HuiType, HuiStatus
+from services.finance_service import FinanceService, Ledger
+
+# Period length per HuiType: (days, months)
+PERIOD_LENGTH = {
+    HuiType.DAILY.value: (1, 0),
+    HuiType.WEEKLY.value: (7, 0),
+    HuiType.BIWEEKLY.value: (15, 0),
+    HuiType.MONTHLY.value: (0, 1),
+    HuiType.KIES.value: (0, 3),
+}
+
+# Bucket size name -> (days, months)
+BUCKETS = {
+    'day': (1, 0),
+    'week': (7, 0),
+    'month': (0, 1),
+    'quarter': (0, 3),
+    'year': (0, 12),
+}
+
+DEFAULT_MONTHS = 6
+
+def add_months(date: datetime.date, months: int) -> datetime.date:
+    """Same day `months` later, clamped to the end of shorter months."""
+    month_index = date.month - 1 + months
+    year, month = date.year + month_index // 12, month_index % 12 + 1
+    next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+    last_day = (next_month - datetime.timedelta(days=1)).day
+    return datetime.date(year, month, min(date.day, last_day))
+
+@lru_cache(maxsize=4096)
+def period_calendar(hui_type: str, anchor: datetime.date, count: int) -> np.ndarray:
+    """
+    Due dates of `count` consecutive periods starting at `anchor`
+    (datetime64[D]). Cached: groups sharing a type and anchor share a calendar.
+    """
+    days, months = PERIOD_LENGTH.get(hui_type, PERIOD_LENGTH[HuiType.MONTHLY.value])
+    if months:
+        dates = [add_months(anchor, i * months) for i in range(count)]
+        calendar = np.array(dates, dtype='datetime64[D]')
+    else:
+        calendar = np.datetime64(anchor, 'D') + np.arange(count) * days
+    calendar.flags.writeable = False
+    return calendar
+
+def _parse_date(value: str) -> Optional[datetime.date]:
+    try:
+        return datetime.date.fromisoformat((value or '')[:10])
+    except ValueError:
+        return None
+
+def _bucket_label(start: datetime.date, bucket: Union[str, int]) -> str:
+    if bucket == 'month':
+        return f"T{start.month}/{start.year}"
+    if bucket == 'quarter':
+        return f"Q{(start.month - 1) // 3 + 1}/{start.year}"
+    if bucket == 'year':
+        return str(start.year)
+    return start.strftime("%d/%m/%Y")
+
+class CashflowService:
+    @staticmethod
+    def bucket_edges(start: datetime.date, end: datetime.date, bucket: Union[str, int] = 'month') -> List[datetime.date]:
+        """Bucket boundaries from start up to (at least) end; `bucket` is a BUCKETS name or a number of days."""
+        days, months = (bucket, 0) if isinstance(bucket, int) else BUCKETS[bucket]
+        if days <= 0 and months <= 0:
+            raise ValueError(f"Invalid bucket size: {bucket!r}")
+        edges = [start]
+        while edges[-1] < end:
+            i = len(edges)
+            edges.append(add_months(start, i * months) if months else start + datetime.timedelta(days=i * days))
+        return edges
+
+    @staticmethod
+    def group_schedule(group: HuiGroup, start: datetime.date, ledger: Optional[Ledger] = None) -> Dict[str, np.ndarray]:
+        """
+        Due date and expected in/out/commission of each remaining period of a group.
+        If the current period is overdue, the remaining periods are rescheduled
+        so it falls due at `start`.
+        """
+        total_periods = group.totalPeriods or len(group.members)
+        remaining = total_periods - group.currentPeriod + 1
+        empty = {'date': np.array([], dtype='datetime64[D]'), 'in': np.zeros(0), 'out': np.zeros(0), 'commission': np.zeros(0)}
+        if remaining <= 0 or not group.members:
+            return empty
+
+        anchor = _parse_date(group.startDate)
+        due = period_calendar(group.type, anchor, total_periods)[group.currentPeriod - 1:] if anchor else None
+        if due is None or due[0] < np.datetime64(start, 'D'):
+            due = period_calendar(group.type, start, remaining)
+
+        V = group.amountPerShare
+        C = FinanceService.commission_per_period(group)
+        N = len(group.members)
+        periods = np.arange(group.currentPeriod, total_periods + 1)
+
+        # Expected bid: average of past winning bids
+        bid = 0
+        group_ledger = FinanceService._ledger(ledger).group(group.id) if ledger is not None else None
+        if group_ledger is not None:
+            past_bids = [e.bid for e in group_ledger.periods(1, group.currentPeriod - 1) if e.winner]
+            bid = int(np.mean(past_bids)) if past_bids else 0
+
+        # Pot of period p (calculate_payout): p - 1 dead slots pay V, the other live slots V - B
+        pot = (periods - 1) * V + (N - periods) * (V - bid)
+        cash_in = pot.astype(np.float64)
+        cash_out = (pot - C).astype(np.float64)
+        commission = np.full(len(periods), C, dtype=np.float64)
+
+        if group_ledger is not None and group_ledger.winner(group.currentPeriod):
+            # Current period already collected: only its unpaid contributions remain
+            winner = group_ledger.winner(group.currentPeriod)
+            plan = FinanceService.get_contribution_plan(group, group.currentPeriod, winner.bidAmount,
+                                                        winner.memberId, ledger)
+            cash_in[0] = sum(max(item.remainingAmount, 0) for item in plan)
+            cash_out[0] = 0
+            commission[0] = 0
+
+        return {'date': due, 'in': cash_in, 'out': cash_out, 'commission': commission}
+
+    @staticmethod
+    def project(groups: List[HuiGroup], start: Optional[datetime.date] = None, end: Optional[datetime.date] = None,
+                bucket: Union[str, int] = 'month', ledger: Optional[Ledger] = None) -> List[dict]:
+        """
+        Projected cash in/out and commission per bucket for active groups,
+        from `start` (default today) to `end` (default DEFAULT_MONTHS later).
+        """
+        start = start or datetime.date.today()
+        end = end or add_months(start, DEFAULT_MONTHS)
+        edges = CashflowService.bucket_edges(start, end, bucket)
+        edge_array = np.array(edges, dtype='datetime64[D]')
+        buckets = len(edges) - 1
+
+        schedules = [CashflowService.group_schedule(g, start, ledger)
+                     for g in groups if g.status == HuiStatus.ACTIVE.value]
+        totals = {key: np.zeros(buckets) for key in ('in', 'out', 'commission')}
+        if schedules:
+            dates = np.concatenate([s['date'] for s in schedules])
+            index = np.searchsorted(edge_array, dates, side='right') - 1
+            inside = (index >= 0) & (index < buckets)
+            for key in totals:
+                values = np.concatenate([s[key] for s in schedules])
+                totals[key] = np.bincount(index[inside], weights=values[inside], minlength=buckets)
+
+        return [
+            {
+                "name": _bucket_label(edges[i], bucket),
+                "start": edges[i],
+                "end": edges[i + 1],
+                "in": int(totals['in'][i]),
+                "out": int(totals['out'][i]),
+                "commission": int(totals['commission'][i])
+            }
+            for i in range(buckets)
+        ]
@@ -0,0 +1,234 @@
+"""
+Excel export (spec Module 5: "Xuất Excel", "Sổ nợ cá nhân").
+Group ledgers, member statements and the owner's commission report are
+written with openpyxl's write-only mode: rows are produced by generators
+over TransactionStore row positions and streamed to the sheet, so memory
+stays bounded however long the history is. Archived groups are read one
+segment at a time through a small LRU.
+
+Headless: python -m services.export_service {ledgers,statements,commission} OUTPUT.xlsx
+"""
+import argparse
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from data_models import AppState, HuiGroup, Member, Transaction
+from app.models.archive_summary import ArchiveSummary
+from services.archive_service import ArchiveService, ArchivedGroup
+from services.finance_service import FinanceService
+from services.portfolio_report import PortfolioReportService
+
+MAX_SHEET_ROWS = 1_048_576 # Excel limit; longer exports continue on a new sheet
+SEGMENT_CACHE_SIZE = 4 # Archive segments kept loaded while exporting statements
+
+TX_TYPE_LABELS = {'CONTRIBUTE': "Đóng", 'COLLECT': "Hốt", 'PENALTY': "Phạt"}
+LEDGER_COLUMNS = ["Ngày", "Kỳ", "Thành viên", "Loại", "Số tiền", "Tiền thăm", "Thực nhận", "Ghi chú"]
+STATEMENT_COLUMNS = ["Thành viên", "SĐT", "Ngày", "Dây hụi", "Kỳ", "Loại", "Số tiền", "Tiền thăm",
+                     "Thực nhận", "Ghi chú"]
+COMMISSION_COLUMNS = ["Dây hụi", "Trạng thái", "Kỳ", "Số kỳ đã hốt", "Hoa hồng/kỳ", "Hoa hồng đã thu",
+                      "Tổng đã đóng", "Nợ xấu"]
+DEBT_LABEL = "Còn nợ" # Closing row of a member statement
+TOTAL_LABEL = "Tổng cộng"
+
+Sheet = Tuple[str, Sequence[str], Iterable[list]] # (title, header, rows)
+_NO_ROWS = np.zeros(0, dtype=np.intp)
+
+_INVALID_TITLE_CHARS = str.maketrans({c: " " for c in "[]:*?/\\"})
+
+def sheet_title(name: str, used: Set[str]) -> str:
+    """Valid, unique sheet title (31 characters, no []:*?/\\)."""
+    base = (name.translate(_INVALID_TITLE_CHARS).strip() or "Sheet")[:31]
+    title, n = base, 1
+    while title.lower() in used:
+        n += 1
+        suffix = f" ({n})"
+        title = base[:31 - len(suffix)] + suffix
+    used.add(title.lower())
+    return title
+
+class _SegmentCache:
+    """LRU of loaded archive segments, keyed by segment file."""
+
+    def __init__(self, maxsize: int = SEGMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._segments: "OrderedDict[str, ArchivedGroup]" = OrderedDict()
+
+    def load(self, summary: ArchiveSummary) -> ArchivedGroup:
+        segment = self._segments.get(summary.segmentFile)
+        if segment is None:
+            segment = self._segments[summary.segmentFile] = ArchiveService.load_segment(summary)
+            if len(self._segments) > self.maxsize:
+                self._segments.popitem(last=False)
+        else:
+            self._segments.move_to_end(summary.segmentFile)
+        return segment
+
+def _tx_cells(t: Transaction) -> list:
+    return [TX_TYPE_LABELS.get(t.type, t.type), t.amount, t.bidAmount or None, t.netAmount or None, t.note]
+
+class ExportService:
+    # --- Row generators ---
+
+    @staticmethod
+    def group_ledger_rows(state: AppState, group: HuiGroup, rows=None) -> Iterator[list]:
+        """
+        Transaction journal of a group, then one totals row per direction:
+        contributions in, payouts out (netAmount, else amount) and penalties.
+        `rows`: store positions (default: the group's).
+        """
+        if rows is None:
+            rows = state.store.rows(group_id=group.id)
+        registry = state.registry
+        transactions = state.transactions
+        contributed = paid_out = penalties = 0
+        for i in rows.tolist():
+            t = transactions[i]
+            member = registry.get(t.memberId)
+            if t.type == 'CONTRIBUTE':
+                contributed += t.amount
+            elif t.type == 'COLLECT':
+                paid_out += t.netAmount or t.amount
+            elif t.type == 'PENALTY':
+                penalties += t.amount
+            yield [t.date, t.period, member.name if member else t.memberId] + _tx_cells(t)
+        yield [TOTAL_LABEL, None, None, TX_TYPE_LABELS['CONTRIBUTE'], contributed, None, None, None]
+        yield [TOTAL_LABEL, None, None, TX_TYPE_LABELS['COLLECT'], None, None, paid_out, None]
+        yield [TOTAL_LABEL, None, None, TX_TYPE_LABELS['PENALTY'], penalties, None, None, None]
+
+    @staticmethod
+    def member_statement_rows(state: AppState, member: Member, rows=None, debt=None,
+                              segments: Optional[_SegmentCache] = None) -> Iterator[list]:
+        """
+        Statement ("sổ nợ") of a member: archived history, then the hot
+        transactions, then the debt still owed in live and archived groups.
+        `rows`: store positions of the member's hot transactions (default: looked up).
+        """
+        if rows is None:
+            rows = state.store.rows(member_id=member.id)
+        if debt is None:
+            debt = FinanceService.compute_all_debts(
+                [g for g in state.groups if member.id in g.members], state.ledger).member_total(member.id)
+            debt += sum(a.memberDebts.get(member.id, 0) for a in state.archives)
+        segments = segments or _SegmentCache()
+        group_names = {g.id: g.name for g in state.groups}
+        group_names.update((a.id, a.name) for a in state.archives)
+        head = [member.name, member.phone]
+
+        archived = ArchiveService.iter_member_transactions(member.id, state, include_hot=False,
+                                                           load_segment=segments.load)
+        hot = (state.transactions[i] for i in rows.tolist())
+        for source in (archived, hot):
+            for t in source:
+                yield head + [t.date, group_names.get(t.huiGroupId, t.huiGroupId), t.period] + _tx_cells(t)
+        yield head + [None, None, None, DEBT_LABEL, debt, None, None, None]
+
+    @staticmethod
+    def commission_rows(state: AppState) -> Iterator[list]:
+        """Commission and bad debt per live group, archived groups (debt left when archived), then totals."""
+        report = PortfolioReportService.run(state)
+        groups = {g.id: g for g in state.groups}
+        for p in report.groups:
+            yield [p.name, p.status, f"{p.currentPeriod}/{p.totalPeriods}", p.collectedPeriods,
+                   FinanceService.commission_per_period(groups[p.groupId]), p.commissionEarned,
+                   p.totalContributed, p.badDebt]
+        for a in state.archives:
+            yield [a.name, "Lưu trữ", None, None, None, a.totalCommission, a.totalContributed, a.totalBadDebt]
+        # The report totals already include the archived groups
+        yield [TOTAL_LABEL, None, None, None, None, report.totalCommission,
+               report.totalContributed, report.totalBadDebt]
+
+    # --- Workbooks ---
+
+    @staticmethod
+    def write_workbook(path: str, sheets: Iterable[Sheet]) -> int:
+        """Stream sheets into a write-only workbook. Returns the number of data rows written."""
+        workbook = Workbook(write_only=True)
+        used: Set[str] = set()
+        written = 0
+        for title, header, rows in sheets:
+            sheet, sheet_rows, part = None, MAX_SHEET_ROWS, 1
+            for row in rows:
+                if sheet_rows >= MAX_SHEET_ROWS:
+                    sheet = workbook.create_sheet(sheet_title(title if part == 1 else f"{title} {part}", used))
+                    sheet.append(ExportService._header(sheet, header))
+                    sheet_rows, part = 1, part + 1
+                sheet.append(row)
+                sheet_rows += 1
+                written += 1
+            if sheet is None: # Keep empty sheets, with their header
+                sheet = workbook.create_sheet(sheet_title(title, used))
+                sheet.append(ExportService._header(sheet, header))
+        if not used:
+            workbook.create_sheet("Sheet")
+        workbook.save(path)
+        return written
+
+    @staticmethod
+    def _header(sheet, header: Sequence[str]) -> List[WriteOnlyCell]:
+        cells = []
+        for title in header:
+            cell = WriteOnlyCell(sheet, value=title)
+            cell.font = Font(bold=True)
+            cells.append(cell)
+        return cells
+
+    @staticmethod
+    def export_group_ledgers(state: AppState, path: str, group_ids: Optional[Sequence[str]] = None) -> int:
+        """One sheet per group (all live groups by default)."""
+        wanted = set(group_ids) if group_ids is not None else None
+        groups = [g for g in state.groups if wanted is None or g.id in wanted]
+        rows_by_group = dict(state.store.rows_by('group'))
+        return ExportService.write_workbook(path, (
+            (g.name, LEDGER_COLUMNS, ExportService.group_ledger_rows(state, g, rows_by_group.get(g.id, _NO_ROWS)))
+            for g in groups
+        ))
+
+    @staticmethod
+    def export_member_statements(state: AppState, path: str, member_ids: Optional[Sequence[str]] = None) -> int:
+        """
+        Statements of the given members (all by default), one after another
+        on a single sheet: a sheet per member would keep a temporary file
+        open per sheet until the workbook is saved.
+        """
+        members = state.members if member_ids is None else [state.registry.get(m) for m in member_ids]
+        members = [m for m in members if m is not None]
+        rows_by_member = dict(state.store.rows_by('member'))
+        debts = FinanceService.compute_all_debts(state.groups, state.ledger)
+        archived_debts = ArchiveService.archived_member_debts(state.archives)
+        segments = _SegmentCache()
+
+        def rows():
+            for m in members:
+                debt = debts.member_total(m.id) + archived_debts.get(m.id, 0)
+                yield from ExportService.member_statement_rows(
+                    state, m, rows_by_member.get(m.id, _NO_ROWS), debt, segments)
+
+        title = "Sổ nợ" if len(members) != 1 else f"Sổ nợ {members[0].name}"
+        return ExportService.write_workbook(path, [(title, STATEMENT_COLUMNS, rows())])
+
+    @staticmethod
+    def export_commission_report(state: AppState, path: str) -> int:
+        return ExportService.write_workbook(path, [("Hoa hồng", COMMISSION_COLUMNS, ExportService.commission_rows(state))])
+
+EXPORTS = {
+    'ledgers': ExportService.export_group_ledgers,
+    'statements': ExportService.export_member_statements,
+    'commission': ExportService.export_commission_report,
+}
+
+def main(argv=None):
+    from storage import get_initial_data
+
+    parser = argparse.ArgumentParser(description="Export ledgers, member statements or the commission report to Excel")
+    parser.add_argument('kind', choices=sorted(EXPORTS))
+    parser.add_argument('output')
+    args = parser.parse_args(argv)
+
+    rows = EXPORTS[args.kind](get_initial_data(), args.output)
+    print(f"{rows:,} dòng -> {args.output}")
+
+if __name__ == '__main__':
+    main()
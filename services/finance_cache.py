@@ -0,0 +1,105 @@
+"""
+Finance Cache
+Memoizes FinanceService.calculate_payout and get_contribution_plan.
+Entries are keyed on the group's parameters, the period, bid and winner and
+the version of the group's ledger, so a new transaction in one group only
+drops that group's entries.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+from data_models import HuiGroup
+from app.models.group_ledger import GroupLedger
+from app.models.money import Money, to_money
+from services.finance_service import FinanceService, PayoutDetail, ContributionDetail, Ledger
+
+DEFAULT_MAXSIZE = 1024
+
+class FinanceCache:
+    """
+    LRU cache of payout and contribution-plan results.
+    Cached results are shared between callers and must not be modified.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, object]" = OrderedDict()
+        self._keys_by_group: Dict[str, Set[tuple]] = {}
+        self._ledgers: Dict[str, Tuple[GroupLedger, int]] = {} # group -> (ledger, version) of cached entries
+
+    @staticmethod
+    def _group_params(group: HuiGroup) -> tuple:
+        """Group fields the finance results depend on."""
+        return (group.amountPerShare, group.commissionRate, group.commissionType,
+                group.currentPeriod, group.totalPeriods, tuple(group.members))
+
+    def _check_version(self, group_id: str, group_ledger: GroupLedger):
+        """Drop the group's entries if its ledger changed (new transaction or rebuilt index)."""
+        cached = self._ledgers.get(group_id)
+        if cached is not None and (cached[0] is not group_ledger or cached[1] != group_ledger.version):
+            self.invalidate(group_id)
+        self._ledgers[group_id] = (group_ledger, group_ledger.version)
+
+    def _lookup(self, kind: str, group: HuiGroup, period: int, bid: Money, winner_id: Optional[str],
+                all_transactions: Ledger, compute):
+        ledger = FinanceService._ledger(all_transactions)
+        group_ledger = ledger.group(group.id)
+        self._check_version(group.id, group_ledger)
+
+        key = (kind, group.id, period, bid, winner_id, group_ledger.version, self._group_params(group))
+        result = self._entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = compute(group, period, bid, winner_id, ledger)
+        self._entries[key] = result
+        self._keys_by_group.setdefault(group.id, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            old_key, _ = self._entries.popitem(last=False)
+            self._keys_by_group[old_key[1]].discard(old_key)
+        return result
+
+    def calculate_payout(self, group: HuiGroup, period: int, bid_amount: Money, winner_id: str,
+                         all_transactions: Ledger) -> PayoutDetail:
+        return self._lookup('payout', group, period, to_money(bid_amount), winner_id,
+                            all_transactions, FinanceService.calculate_payout)
+
+    def get_contribution_plan(self, group: HuiGroup, period: int, bid_amount: Money, winner_id: Optional[str],
+                              all_transactions: Ledger) -> List[ContributionDetail]:
+        return self._lookup('plan', group, period, to_money(bid_amount), winner_id,
+                            all_transactions, FinanceService.get_contribution_plan)
+
+    def invalidate(self, group_id: Optional[str] = None):
+        """Drop one group's entries (all entries if group_id is None)."""
+        if group_id is None:
+            self._entries.clear()
+            self._keys_by_group.clear()
+            self._ledgers.clear()
+            return
+        for key in self._keys_by_group.pop(group_id, ()):
+            self._entries.pop(key, None)
+        self._ledgers.pop(group_id, None)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+# Global instance
+_finance_cache = None
+
+def get_finance_cache() -> FinanceCache:
+    """Get the global finance cache instance (lazy initialization)."""
+    global _finance_cache
+    if _finance_cache is None:
+        _finance_cache = FinanceCache()
+    return _finance_cache
@@ -1,5 +1,12 @@
-from typing import List, Dict, Optional
+from collections import Counter
+from typing import List, Dict, Optional, Union
+import numpy as np
 from data_models import HuiGroup, Transaction, Member, HuiStatus, AuditLog
+from app.models.ledger_index import LedgerIndex
+from app.models.money import Money, to_money, percent_of
+
+# Finance functions accept either the raw transaction list or a prebuilt LedgerIndex
+Ledger = Union[List[Transaction], LedgerIndex]
 
 class PayoutDetail:
     def __init__(self, liveMembers, deadMembers, amountPerLive, amountPerDead, totalPot, commission, deductions, netReceived):
@@ -22,17 +29,45 @@ class ContributionDetail:
         self.remainingAmount = remainingAmount
         self.status = status # 'FULL' | 'PARTIAL' | 'UNPAID' | 'OVERPAID'
 
+class PortfolioDebts:
+    def __init__(self, byMemberGroup: Dict[str, Dict[str, Money]]):
+        self.byMemberGroup = byMemberGroup # member -> group -> debt
+        self.byMember = {m: sum(debts.values()) for m, debts in byMemberGroup.items()} # member -> total debt
+
+    def get(self, member_id: str, group_id: str) -> Money:
+        return self.byMemberGroup.get(member_id, {}).get(group_id, 0)
+
+    def member_total(self, member_id: str) -> Money:
+        return self.byMember.get(member_id, 0)
+
 class FinanceService:
     @staticmethod
-    def calculate_payout(group: HuiGroup, period: int, bid_amount: float, winner_id: str, all_transactions: List[Transaction]) -> PayoutDetail:
+    def _ledger(all_transactions: Ledger) -> LedgerIndex:
+        """Use the given index as-is, or index a plain transaction list once."""
+        if isinstance(all_transactions, LedgerIndex):
+            return all_transactions
+        return LedgerIndex(all_transactions)
+
+    @staticmethod
+    def commission_per_period(group: HuiGroup) -> Money:
+        """Commission the owner takes each period: a fixed amount or a percentage of V."""
+        if hasattr(group, 'commissionType') and group.commissionType == 'FIXED':
+            return to_money(group.commissionRate)
+        return percent_of(group.amountPerShare, group.commissionRate)
+
+    @staticmethod
+    def calculate_payout(group: HuiGroup, period: int, bid_amount: Money, winner_id: str, all_transactions: Ledger) -> PayoutDetail:
+        ledger = FinanceService._ledger(all_transactions)
+        group_ledger = ledger.group(group.id)
+
         # 1. Determine dead slots
-        dead_slots_count = len([t for t in all_transactions if t.huiGroupId == group.id and t.type == 'COLLECT' and t.period < period])
+        dead_slots_count = group_ledger.dead_slots(period)
         
         N_dead = dead_slots_count
         N_live = len(group.members) - N_dead - 1
 
         V = group.amountPerShare
-        B = bid_amount
+        B = to_money(bid_amount)
 
         # 2. Calculate amounts
         amount_per_live = V - B
@@ -40,31 +75,27 @@ class FinanceService:
         total_pot = (N_live * amount_per_live) + (N_dead * amount_per_dead)
 
         # 3. Commission
-        if hasattr(group, 'commissionType') and group.commissionType == 'FIXED':
-            C = group.commissionRate
-        else:
-            C = V * (group.commissionRate or 0) / 100
+        C = FinanceService.commission_per_period(group)
 
         # 4. Deductions (old debts) - now calls the corrected debt function
-        D = FinanceService.get_member_total_debt(winner_id, [group], all_transactions)
+        D = FinanceService.get_member_total_debt(winner_id, [group], ledger)
         
         net_received = total_pot - C - D
 
         return PayoutDetail(N_live, N_dead, amount_per_live, amount_per_dead, total_pot, C, D, net_received)
 
     @staticmethod
-    def get_contribution_plan(group: HuiGroup, period: int, bid_amount: float, winner_id: Optional[str], all_transactions: List[Transaction]) -> List[ContributionDetail]:
-        unique_members = list(set(group.members))
+    def get_contribution_plan(group: HuiGroup, period: int, bid_amount: Money, winner_id: Optional[str], all_transactions: Ledger) -> List[ContributionDetail]:
+        group_ledger = FinanceService._ledger(all_transactions).group(group.id)
+        entry = group_ledger.period(period)
         plan = []
         V = group.amountPerShare
         
-        amount_per_live = V - bid_amount
+        amount_per_live = V - to_money(bid_amount)
         amount_per_dead = V
 
-        for member_id in unique_members:
-            total_slots = group.members.count(member_id)
-
-            dead_slots = len([t for t in all_transactions if t.huiGroupId == group.id and t.type == 'COLLECT' and t.period < period and t.memberId == member_id])
+        for member_id, total_slots in Counter(group.members).items():
+            dead_slots = group_ledger.dead_slots(period, member_id)
             
             live_slots = total_slots - dead_slots
             
@@ -75,8 +106,7 @@ class FinanceService:
             
             required_amount = (dead_slots * amount_per_dead) + (live_slots * amount_per_live)
 
-            paid_amount = sum(t.amount for t in all_transactions 
-                              if t.huiGroupId == group.id and t.period == period and t.memberId == member_id and t.type == 'CONTRIBUTE')
+            paid_amount = entry.paid.get(member_id, 0) if entry else 0
             
             remaining_amount = required_amount - paid_amount
 
@@ -96,42 +126,14 @@ class FinanceService:
         return plan
 
     @staticmethod
-    def calculate_cashflow_projection(groups: List[HuiGroup]):
-        projection = []
-        import datetime
-        today = datetime.date.today()
-        
-        for i in range(6):
-            # Calculate target month (roughly)
-            # Python date math is annoying without dateutil, assume simple increment
-            month = today.month + i
-            year = today.year + (month - 1) // 12
-            month = (month - 1) % 12 + 1
-            
-            month_key = f"T{month}/{year}"
-            
-            estimated_in = 0
-            estimated_out = 0
-            
-            # Filter active groups
-            active_groups = [g for g in groups if g.status == HuiStatus.ACTIVE.value]
-            
-            for g in active_groups:
-                total_slots = len(g.members)
-                # Approximation from React code:
-                estimated_in += (total_slots - 1) * g.amountPerShare
-                estimated_out += (total_slots - 1) * g.amountPerShare
-            
-            projection.append({
-                "name": month_key,
-                "in": estimated_in,
-                "out": estimated_out,
-                "commission": estimated_in * 0.02
-            })
-        return projection
+    def calculate_cashflow_projection(groups: List[HuiGroup], all_transactions: Optional[Ledger] = None, **options):
+        """Monthly cashflow projection of active groups (see CashflowService.project for options)."""
+        from services.cashflow_service import CashflowService
+        return CashflowService.project(groups, ledger=all_transactions, **options)
 
     @staticmethod
-    def get_member_total_debt(member_id: str, all_groups: List[HuiGroup], all_transactions: List[Transaction]) -> float:
+    def get_member_total_debt(member_id: str, all_groups: List[HuiGroup], all_transactions: Ledger) -> Money:
+        ledger = FinanceService._ledger(all_transactions)
         total_debt = 0
         for group in all_groups:
             if member_id not in group.members:
@@ -139,20 +141,18 @@ class FinanceService:
             
             slots_count = group.members.count(member_id)
             V = group.amountPerShare
+            group_ledger = ledger.group(group.id)
             
             # Iterate through PAST periods only
             for p in range(1, group.currentPeriod):
                 # Find the bid amount for this past period
-                bid_in_p = 0
-                winner_in_p = None
-                for t in all_transactions:
-                    if t.huiGroupId == group.id and t.type == 'COLLECT' and t.period == p:
-                        bid_in_p = t.bidAmount or 0
-                        winner_in_p = t.memberId
-                        break
+                entry = group_ledger.period(p)
+                collect_tx = entry.winner if entry else None
+                bid_in_p = (collect_tx.bidAmount or 0) if collect_tx else 0
+                winner_in_p = collect_tx.memberId if collect_tx else None
                 
                 # Determine member's status in this period (p)
-                my_dead_slots_in_p = len([t for t in all_transactions if t.huiGroupId == group.id and t.type == 'COLLECT' and t.period < p and t.memberId == member_id])
+                my_dead_slots_in_p = group_ledger.dead_slots(p, member_id)
                 my_live_slots_in_p = slots_count - my_dead_slots_in_p
 
                 required_in_p = 0
@@ -162,10 +162,61 @@ class FinanceService:
                 else:
                     required_in_p = (my_dead_slots_in_p * V) + (my_live_slots_in_p * (V - bid_in_p))
 
-                paid_in_p = sum(t.amount for t in all_transactions if t.huiGroupId == group.id and t.memberId == member_id and t.type == 'CONTRIBUTE' and t.period == p)
+                paid_in_p = entry.paid.get(member_id, 0) if entry else 0
                 
                 shortfall = required_in_p - paid_in_p
                 if shortfall > 0:
                     total_debt += shortfall
                     
         return total_debt
+
+    @staticmethod
+    def compute_all_debts(all_groups: List[HuiGroup], all_transactions: Ledger) -> PortfolioDebts:
+        """
+        Debt of every slot holder in every group, in one pass over each group's
+        per-period table. Same rules as get_member_total_debt, evaluated as
+        (member x past period) required/paid matrices.
+        """
+        ledger = FinanceService._ledger(all_transactions)
+        by_member_group: Dict[str, Dict[str, Money]] = {}
+        for group in all_groups:
+            slots_count = Counter(group.members)
+            member_ids = list(slots_count)
+            periods = max(group.currentPeriod - 1, 0)
+            if periods == 0:
+                for member_id in member_ids:
+                    by_member_group.setdefault(member_id, {})[group.id] = 0
+                continue
+
+            row = {member_id: i for i, member_id in enumerate(member_ids)}
+            paid = np.zeros((len(member_ids), periods), dtype=np.int64)
+            collects = np.zeros((len(member_ids), periods), dtype=np.int64)
+            bids = np.zeros(periods, dtype=np.int64)
+            winners = np.full(periods, -1, dtype=np.int64) # -1: nobody collected, -2: not a slot holder
+
+            for entry in ledger.group(group.id).periods(1, periods):
+                p = entry.period - 1
+                for member_id, amount in entry.paid.items():
+                    i = row.get(member_id)
+                    if i is not None:
+                        paid[i, p] += amount
+                if entry.winner is not None:
+                    winners[p] = row.get(entry.winner.memberId, -2)
+                    bids[p] = entry.bid
+                for t in entry.collects:
+                    i = row.get(t.memberId)
+                    if i is not None:
+                        collects[i, p] += 1
+
+            # Dead slots in period p = the member's COLLECTs strictly before p
+            dead = np.cumsum(collects, axis=1) - collects
+            live = np.array([slots_count[m] for m in member_ids], dtype=np.int64)[:, None] - dead
+            V = group.amountPerShare
+            required = dead * V + live * (V - bids)[None, :]
+            won = np.flatnonzero(winners >= 0)
+            required[winners[won], won] = 0 # Winner does not contribute in the period they win
+
+            debts = np.clip(required - paid, 0, None).sum(axis=1)
+            for member_id, debt in zip(member_ids, debts.tolist()):
+                by_member_group.setdefault(member_id, {})[group.id] = debt
+        return PortfolioDebts(by_member_group)
@@ -0,0 +1,200 @@
+"""
+IRR service.
+A slot of a hụi is a loan (won early) or a deposit (won late). This module
+builds each slot's per-period cashflows from the group parameters and its
+transactions and solves the implied interest rate of every slot at once.
+
+Slot cashflows (period p, slot winning period w):
+- p < w: pays V - bid of period p (live slot)
+- p = w: receives the pot minus commission (FinanceService payout formula)
+- p > w: pays V (dead slot)
+Past periods use the recorded bids; future periods the average past bid.
+Slots that have not collected yet are projected to win the periods nobody
+has collected in yet, in slot order.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import numpy as np
+from data_models import HuiGroup, HuiType
+from services.finance_service import FinanceService, Ledger
+from services.cashflow_service import PERIOD_LENGTH
+
+# Search interval for the per-period rate
+MIN_RATE = -0.99
+MAX_RATE = 1.0
+TOLERANCE = 1e-10
+NEWTON_ITERATIONS = 50
+BISECTION_ITERATIONS = 200
+
+def periods_per_year(hui_type: str) -> float:
+    days, months = PERIOD_LENGTH.get(hui_type, PERIOD_LENGTH[HuiType.MONTHLY.value])
+    return 12 / months if months else 365 / days
+
+def _npv(cashflows: np.ndarray, rates: np.ndarray) -> np.ndarray:
+    t = np.arange(cashflows.shape[1])
+    return (cashflows * (1 + rates)[:, None] ** -t[None, :]).sum(axis=1)
+
+def solve_irr(cashflows: np.ndarray, low: float = MIN_RATE, high: float = MAX_RATE,
+              tol: float = TOLERANCE) -> np.ndarray:
+    """
+    Per-period IRR of each row of a (slots x periods) cashflow matrix.
+    Vectorized Newton from 0; rows where it diverges, leaves [low, high] or
+    does not converge are finished by bisection. NaN when [low, high] does
+    not bracket a root (e.g. all flows have the same sign).
+    """
+    cf = np.asarray(cashflows, dtype=np.float64)
+    if cf.ndim != 2:
+        raise ValueError("cashflows must be a (slots x periods) matrix")
+    rows, periods = cf.shape
+    t = np.arange(periods, dtype=np.float64)
+    scale = np.abs(cf).max(axis=1, initial=0)
+    has_flows = scale > 0
+    scale[~has_flows] = 1
+    cf = cf / scale[:, None]
+
+    rates = np.zeros(rows)
+    done = np.zeros(rows, dtype=bool)
+    active = np.arange(rows)
+    for _ in range(NEWTON_ITERATIONS):
+        if not len(active):
+            break
+        r = rates[active]
+        discount = (1 + r)[:, None] ** -t[None, :]
+        flows = cf[active] * discount
+        f = flows.sum(axis=1)
+        df = -(flows * t).sum(axis=1) / (1 + r)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            new = r - f / df
+        # Already at a root: also covers double roots, where df is 0 and no interval brackets them
+        at_root = (np.abs(f) < tol) & has_flows[active]
+        new[at_root] = r[at_root]
+        ok = np.isfinite(new) & (new > low) & (new < high)
+        converged = ok & (np.abs(new - r) < tol)
+        rates[active[ok]] = new[ok]
+        done[active[converged]] = True
+        active = active[ok & ~converged]
+
+    # Bisection fallback
+    rest = np.flatnonzero(~done)
+    if len(rest):
+        lo = np.full(len(rest), low)
+        hi = np.full(len(rest), high)
+        f_lo = _npv(cf[rest], lo)
+        f_hi = _npv(cf[rest], hi)
+        bracketed = np.sign(f_lo) != np.sign(f_hi)
+        for _ in range(BISECTION_ITERATIONS):
+            mid = (lo + hi) / 2
+            f_mid = _npv(cf[rest], mid)
+            left = np.sign(f_mid) == np.sign(f_lo)
+            lo = np.where(left, mid, lo)
+            f_lo = np.where(left, f_mid, f_lo)
+            hi = np.where(left, hi, mid)
+            if np.all(hi - lo < tol):
+                break
+        rates[rest] = np.where(bracketed, (lo + hi) / 2, np.nan)
+    return rates
+
+@dataclass
+class SlotCashflow:
+    groupId: str
+    memberId: str
+    slot: int # Index in group.members
+    winPeriod: int
+    projected: bool # Win period is assumed (slot has not collected yet)
+    cashflows: np.ndarray = field(repr=False) # (periods,) signed from the member's side
+
+@dataclass
+class SlotRate:
+    groupId: str
+    memberId: str
+    slot: int
+    winPeriod: int
+    projected: bool
+    periodRate: float # Per-period IRR (NaN if undefined): cost for borrowers, return for savers
+    annualRate: float # Effective annual rate
+    isBorrower: bool # Pays more after winning than before (the pot works as a loan)
+
+class IrrService:
+    @staticmethod
+    def slot_cashflows(group: HuiGroup, all_transactions: Ledger) -> List[SlotCashflow]:
+        """Cashflow series of every slot of a group."""
+        N = len(group.members)
+        T = group.totalPeriods or N
+        if not N or not T:
+            return []
+        group_ledger = FinanceService._ledger(all_transactions).group(group.id)
+        V = group.amountPerShare
+        C = FinanceService.commission_per_period(group)
+
+        # Recorded winners and bids; future periods use the average past bid
+        bids = np.zeros(T, dtype=np.int64)
+        winners: Dict[str, List[int]] = defaultdict(list)
+        recorded = []
+        for entry in group_ledger.periods(1, T):
+            if entry.winner is not None:
+                bids[entry.period - 1] = entry.bid
+                recorded.append(entry.period)
+                for t in entry.collects:
+                    winners[t.memberId].append(entry.period)
+        past_bids = [int(bids[p - 1]) for p in recorded if p < group.currentPeriod]
+        expected_bid = int(np.mean(past_bids)) if past_bids else 0
+        future = np.ones(T, dtype=bool)
+        future[[p - 1 for p in recorded]] = False
+        bids[future] = expected_bid
+
+        # Each member's collect periods go to their slots in order; the other
+        # slots take the open periods in order (the last period if none is left)
+        win = np.full(N, T, dtype=np.int64)
+        projected = np.ones(N, dtype=bool)
+        assigned: Dict[str, int] = defaultdict(int)
+        for s, member_id in enumerate(group.members):
+            periods = winners.get(member_id, [])
+            k = assigned[member_id]
+            if k < len(periods):
+                win[s] = min(periods[k], T)
+                projected[s] = False
+                assigned[member_id] += 1
+        open_periods = iter(np.flatnonzero(future) + 1)
+        for s in np.flatnonzero(projected):
+            win[s] = next(open_periods, T)
+
+        P = np.arange(1, T + 1)
+        pot = (P - 1) * V + (N - P) * (V - bids)
+        cf = np.where(P[None, :] < win[:, None], -(V - bids)[None, :], -V)
+        cf[np.arange(N), win - 1] = pot[win - 1] - C
+
+        return [
+            SlotCashflow(group.id, member_id, s, int(win[s]), bool(projected[s]), cf[s])
+            for s, member_id in enumerate(group.members)
+        ]
+
+    @staticmethod
+    def slot_rates(groups: List[HuiGroup], all_transactions: Ledger,
+                   member_id: Optional[str] = None) -> List[SlotRate]:
+        """IRR and effective annual rate of every slot of `groups` (optionally one member's), solved in one batch."""
+        ledger = FinanceService._ledger(all_transactions)
+        slots: List[SlotCashflow] = []
+        per_year: List[float] = []
+        for g in groups:
+            for s in IrrService.slot_cashflows(g, ledger):
+                if member_id is None or s.memberId == member_id:
+                    slots.append(s)
+                    per_year.append(periods_per_year(g.type))
+        if not slots:
+            return []
+
+        # Pad to a common length; trailing zeros do not change the NPV
+        width = max(len(s.cashflows) for s in slots)
+        matrix = np.zeros((len(slots), width))
+        for i, s in enumerate(slots):
+            matrix[i, :len(s.cashflows)] = s.cashflows
+        rates = solve_irr(matrix)
+        annual = (1 + rates) ** np.array(per_year) - 1
+
+        return [
+            SlotRate(s.groupId, s.memberId, s.slot, s.winPeriod, s.projected,
+                     float(rates[i]), float(annual[i]),
+                     bool(-s.cashflows[s.winPeriod:].sum() > -s.cashflows[:s.winPeriod - 1].sum()))
+            for i, s in enumerate(slots)
+        ]
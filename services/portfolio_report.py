@@ -0,0 +1,184 @@
+"""
+Portfolio report.
+Owner's report over every group: commission earned, bad debt (unpaid
+contributions) and each group's position. Groups are partitioned into
+chunks and computed in a process pool; each worker only receives its
+groups and a compact slice of their transactions.
+
+Headless: python -m services.portfolio_report [--workers N]
+"""
+import argparse
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from data_models import AppState, HuiGroup, Transaction
+from app.models.archive_summary import ArchiveSummary
+from app.models.money import Money
+from services.finance_service import FinanceService
+
+CHUNKS_PER_WORKER = 4 # More chunks than workers: balances load and gives finer progress
+
+# Compact transaction row shipped to workers: (memberId, type, period, amount, bidAmount, netAmount)
+TxRow = Tuple[str, str, int, Money, Money, Money]
+GroupSlice = Tuple[HuiGroup, List[TxRow]]
+
+ProgressCallback = Callable[[int, int], None] # (groups done, total groups)
+
+@dataclass
+class GroupPosition:
+    groupId: str
+    name: str
+    status: str
+    currentPeriod: int
+    totalPeriods: int
+    collectedPeriods: int
+    totalContributed: Money
+    totalCollected: Money # COLLECT payouts (netAmount, else amount)
+    commissionEarned: Money # Commission over the collected periods
+    badDebt: Money # Unpaid contributions of past periods (before currentPeriod)
+    debtByMember: Dict[str, Money] = field(default_factory=dict)
+
+@dataclass
+class PortfolioReport:
+    """Positions of the live groups; totals and debtByMember also cover archived groups."""
+    groups: List[GroupPosition]
+    totalContributed: Money
+    totalCollected: Money
+    totalCommission: Money
+    totalBadDebt: Money
+    debtByMember: Dict[str, Money]
+
+    @classmethod
+    def merge(cls, positions: List[GroupPosition],
+              archives: Sequence[ArchiveSummary] = ()) -> 'PortfolioReport':
+        """Combine group positions with the precomputed totals of archived groups."""
+        debt_by_member: Dict[str, Money] = {}
+        for debts in [p.debtByMember for p in positions] + [a.memberDebts for a in archives]:
+            for member_id, debt in debts.items():
+                debt_by_member[member_id] = debt_by_member.get(member_id, 0) + debt
+        return cls(
+            groups=positions,
+            totalContributed=sum(p.totalContributed for p in positions) + sum(a.totalContributed for a in archives),
+            totalCollected=sum(p.totalCollected for p in positions) + sum(a.totalCollected for a in archives),
+            totalCommission=sum(p.commissionEarned for p in positions) + sum(a.totalCommission for a in archives),
+            totalBadDebt=sum(p.badDebt for p in positions) + sum(a.totalBadDebt for a in archives),
+            debtByMember=debt_by_member
+        )
+
+def _to_row(t: Transaction) -> TxRow:
+    return (t.memberId, t.type, t.period, t.amount, t.bidAmount, t.netAmount)
+
+def compute_chunk(slices: List[GroupSlice]) -> List[GroupPosition]:
+    """Positions of a chunk of groups. Top-level so it can run in a worker process."""
+    groups = [group for group, _ in slices]
+    transactions = [
+        Transaction(id=f"{group.id}:{i}", huiGroupId=group.id, memberId=member_id, type=tx_type,
+                    amount=amount, date="", period=period, bidAmount=bid, netAmount=net)
+        for group, rows in slices
+        for i, (member_id, tx_type, period, amount, bid, net) in enumerate(rows)
+    ]
+    debts = FinanceService.compute_all_debts(groups, transactions)
+
+    positions = []
+    for group, rows in slices:
+        contributed = collected = collected_periods = 0
+        for _, tx_type, _, amount, _, net in rows:
+            if tx_type == 'CONTRIBUTE':
+                contributed += amount
+            elif tx_type == 'COLLECT':
+                collected += net or amount
+                collected_periods += 1
+        debt_by_member = {m: debts.get(m, group.id) for m in dict.fromkeys(group.members)}
+        debt_by_member = {m: d for m, d in debt_by_member.items() if d}
+        positions.append(GroupPosition(
+            groupId=group.id,
+            name=group.name,
+            status=group.status,
+            currentPeriod=group.currentPeriod,
+            totalPeriods=group.totalPeriods or len(group.members),
+            collectedPeriods=collected_periods,
+            totalContributed=contributed,
+            totalCollected=collected,
+            commissionEarned=FinanceService.commission_per_period(group) * collected_periods,
+            badDebt=sum(debt_by_member.values()),
+            debtByMember=debt_by_member
+        ))
+    return positions
+
+class PortfolioReportService:
+    @staticmethod
+    def slices(groups: List[HuiGroup], transactions: List[Transaction]) -> List[GroupSlice]:
+        """Each group with the compact rows of its own transactions (one pass over the history)."""
+        rows: Dict[str, List[TxRow]] = {g.id: [] for g in groups}
+        for t in transactions:
+            group_rows = rows.get(t.huiGroupId)
+            if group_rows is not None:
+                group_rows.append(_to_row(t))
+        return [(g, rows[g.id]) for g in groups]
+
+    @staticmethod
+    def partition(slices: List[GroupSlice], chunks: int) -> List[List[GroupSlice]]:
+        """Split slices into at most `chunks` chunks of similar transaction counts (largest first)."""
+        chunks = max(1, min(chunks, len(slices)))
+        bins: List[List[GroupSlice]] = [[] for _ in range(chunks)]
+        loads = [0] * chunks
+        for s in sorted(slices, key=lambda s: len(s[1]), reverse=True):
+            i = loads.index(min(loads))
+            bins[i].append(s)
+            loads[i] += len(s[1]) + 1
+        return [b for b in bins if b]
+
+    @staticmethod
+    def run(state: AppState, workers: Optional[int] = None,
+            progress: Optional[ProgressCallback] = None) -> PortfolioReport:
+        """
+        Report over all groups of `state`, archived groups included in the
+        totals (from their summaries). With workers > 1 chunks run in a
+        process pool; `progress(done, total)` is called as chunks finish.
+        Groups keep the order of state.groups.
+        """
+        slices = PortfolioReportService.slices(state.groups, state.transactions)
+        total = len(slices)
+        positions: Dict[str, GroupPosition] = {}
+
+        def collect(chunk_positions: List[GroupPosition]):
+            for p in chunk_positions:
+                positions[p.groupId] = p
+            if progress:
+                progress(len(positions), total)
+
+        if workers and workers > 1 and total > 1:
+            chunks = PortfolioReportService.partition(slices, workers * CHUNKS_PER_WORKER)
+            # spawn: the UI runs the report from a background thread, and
+            # forking a process that has Qt threads running is unsafe
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                for future in as_completed([pool.submit(compute_chunk, c) for c in chunks]):
+                    collect(future.result())
+        else:
+            for chunk in PortfolioReportService.partition(slices, CHUNKS_PER_WORKER):
+                collect(compute_chunk(chunk))
+
+        return PortfolioReport.merge([positions[g.id] for g in state.groups], state.archives)
+
+def main(argv=None):
+    from storage import get_initial_data
+
+    parser = argparse.ArgumentParser(description="Portfolio report over all hui groups")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    report = PortfolioReportService.run(
+        get_initial_data(), workers=args.workers,
+        progress=lambda done, total: print(f"\r{done}/{total} dây", end='', flush=True)
+    )
+    print()
+    for p in report.groups:
+        print(f"{p.name:<30} {p.status:<10} kỳ {p.currentPeriod}/{p.totalPeriods}  "
+              f"hoa hồng {p.commissionEarned:>14,}  nợ xấu {p.badDebt:>14,}")
+    print(f"Tổng hoa hồng: {report.totalCommission:,}")
+    print(f"Tổng nợ xấu: {report.totalBadDebt:,}")
+
+if __name__ == '__main__':
+    main()
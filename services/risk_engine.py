@@ -0,0 +1,213 @@
+"""
+Monte Carlo risk engine.
+Simulates the remaining periods of each active group many times: future
+winners are drawn among the slots that have not collected yet, and every
+member pays each period's contribution (FinanceService formula) in full,
+partially or not at all, with probabilities derived from their status and
+reputationScore. Unpaid contributions are the owner's cash shortfall.
+"""
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import numpy as np
+from data_models import AppState, HuiGroup, Member, HuiStatus, MemberStatus
+from app.models.money import Money
+from services.finance_service import FinanceService, Ledger
+
+DEFAULT_SCENARIOS = 20000
+CHUNK_SCENARIOS = 2000 # Scenarios simulated per vectorized batch (bounds memory)
+
+# Risk multiplier per member status
+STATUS_RISK = {
+    MemberStatus.TRUSTED.value: 0.5,
+    MemberStatus.NORMAL.value: 1.0,
+    MemberStatus.WATCHLIST.value: 2.0,
+    MemberStatus.BLACKLIST.value: 4.0,
+}
+BASE_MISS_RATE = 0.02 # Chance that even a perfect-score member misses a full payment
+SCORE_MISS_RATE = 0.3 # Extra miss chance at reputationScore 0 (scaled by status)
+MAX_MISS_RATE = 0.95
+PARTIAL_SHARE = 0.7 # Share of misses that are partial payments rather than nothing
+PARTIAL_BETA = (2.0, 2.0) # Fraction paid on a partial payment (mean 0.5)
+
+@dataclass
+class PaymentBehavior:
+    """Per-period payment probabilities of a member."""
+    full: float
+    partial: float # Remaining probability is paying nothing
+
+    @classmethod
+    def for_member(cls, member: Optional[Member]) -> 'PaymentBehavior':
+        if member is None:
+            return cls(full=1 - BASE_MISS_RATE, partial=BASE_MISS_RATE * PARTIAL_SHARE)
+        score = min(max(member.reputationScore, 0), 100)
+        multiplier = STATUS_RISK.get(member.status, 1.0)
+        miss = min(MAX_MISS_RATE, BASE_MISS_RATE + (100 - score) / 100 * SCORE_MISS_RATE * multiplier)
+        return cls(full=1 - miss, partial=miss * PARTIAL_SHARE)
+
+@dataclass
+class GroupScenarioInput:
+    """Plain-data description of one group's remaining periods (picklable for worker processes)."""
+    groupId: str
+    name: str
+    amountPerShare: Money
+    bid: Money # Assumed bid for future periods
+    commission: Money # Owner's commission per period
+    periods: int # Future periods to simulate
+    slots: np.ndarray # (members,) slot count per member
+    deadSlots: np.ndarray # (members,) slots already collected
+    full: np.ndarray # (members,) probability of paying in full
+    partial: np.ndarray # (members,) probability of paying partially
+    existingDebt: Money = 0 # Unpaid contributions of past periods
+
+@dataclass
+class GroupRisk:
+    groupId: str
+    name: str
+    scenarios: int
+    periods: int
+    existingDebt: Money
+    expectedShortfall: float
+    p50: float
+    p95: float
+    p99: float
+    probShortfall: float # P(any unpaid contribution)
+    probExceedsCommission: float # P(shortfall > commission earned over the same periods)
+    worstPeriodP95: float # 95th percentile of the largest single-period shortfall
+    shortfalls: np.ndarray = field(repr=False, default=None) # (scenarios,) total shortfall per scenario
+
+@dataclass
+class PortfolioRisk:
+    groups: List[GroupRisk]
+    scenarios: int
+    expectedShortfall: float
+    p95: float
+    p99: float
+    probShortfall: float
+    shortfalls: np.ndarray = field(repr=False, default=None)
+
+def _simulate_chunk(inp: GroupScenarioInput, scenarios: int, rng: np.random.Generator):
+    """Total and worst-period shortfall for a batch of scenarios."""
+    M = len(inp.slots)
+    R = inp.periods
+    V = inp.amountPerShare
+
+    # Winner order: a random permutation of the slots that have not collected yet
+    live_owner = np.repeat(np.arange(M), inp.slots - inp.deadSlots)
+    order = np.argsort(rng.random((scenarios, len(live_owner))), axis=1)[:, :R]
+    winners = live_owner[order] # (S, R) member index winning each period
+
+    won = np.zeros((scenarios, R, M), dtype=np.int16)
+    np.put_along_axis(won, winners[:, :, None], 1, axis=2)
+    dead = inp.deadSlots[None, None, :] + np.cumsum(won, axis=1) - won # Dead slots before each period
+    live = inp.slots[None, None, :] - dead
+    required = dead * V + live * (V - inp.bid)
+    required[won == 1] = 0 # Winner does not contribute in the period they win
+
+    u = rng.random((scenarios, R, M))
+    fraction = np.where(u < inp.full, 1.0,
+                        np.where(u < inp.full + inp.partial, rng.beta(*PARTIAL_BETA, size=u.shape), 0.0))
+    unpaid = (required * (1.0 - fraction)).sum(axis=2) # (S, R)
+    return unpaid.sum(axis=1), unpaid.max(axis=1)
+
+def simulate_group(inp: GroupScenarioInput, scenarios: int, seed: np.random.SeedSequence) -> GroupRisk:
+    """Run all scenarios of one group. Top-level so it can run in a worker process."""
+    if inp.periods <= 0 or not len(inp.slots):
+        totals = worst = np.zeros(scenarios)
+    else:
+        totals, worst = [], []
+        chunks = -(-scenarios // CHUNK_SCENARIOS)
+        for chunk_seed, start in zip(seed.spawn(chunks), range(0, scenarios, CHUNK_SCENARIOS)):
+            chunk_total, chunk_worst = _simulate_chunk(inp, min(CHUNK_SCENARIOS, scenarios - start),
+                                                       np.random.default_rng(chunk_seed))
+            totals.append(chunk_total)
+            worst.append(chunk_worst)
+        totals, worst = np.concatenate(totals), np.concatenate(worst)
+
+    commission_income = inp.commission * inp.periods
+    return GroupRisk(
+        groupId=inp.groupId,
+        name=inp.name,
+        scenarios=scenarios,
+        periods=inp.periods,
+        existingDebt=inp.existingDebt,
+        expectedShortfall=float(totals.mean()),
+        p50=float(np.percentile(totals, 50)),
+        p95=float(np.percentile(totals, 95)),
+        p99=float(np.percentile(totals, 99)),
+        probShortfall=float((totals > 0).mean()),
+        probExceedsCommission=float((totals > commission_income).mean()),
+        worstPeriodP95=float(np.percentile(worst, 95)),
+        shortfalls=totals
+    )
+
+class RiskEngine:
+    @staticmethod
+    def group_input(group: HuiGroup, members_by_id: Dict[str, Member], all_transactions: Ledger,
+                    existing_debt: Money = 0) -> GroupScenarioInput:
+        """Remaining periods of a group with its members' payment behavior."""
+        group_ledger = FinanceService._ledger(all_transactions).group(group.id)
+        # The current period is simulated unless it already has a winner
+        first = group.currentPeriod + (1 if group_ledger.winner(group.currentPeriod) else 0)
+        slots = Counter(group.members)
+        member_ids = list(slots)
+        slot_counts = np.array([slots[m] for m in member_ids], dtype=np.int64)
+        dead_slots = np.array([group_ledger.dead_slots(first, m) for m in member_ids], dtype=np.int64)
+        total_periods = group.totalPeriods or len(group.members)
+        live_slots = int((slot_counts - dead_slots).sum())
+
+        past_bids = [e.bid for e in group_ledger.periods(1, first - 1) if e.winner]
+        behaviors = [PaymentBehavior.for_member(members_by_id.get(m)) for m in member_ids]
+        return GroupScenarioInput(
+            groupId=group.id,
+            name=group.name,
+            amountPerShare=group.amountPerShare,
+            bid=int(np.mean(past_bids)) if past_bids else 0,
+            commission=FinanceService.commission_per_period(group),
+            periods=max(0, min(total_periods - first + 1, live_slots)),
+            slots=slot_counts,
+            deadSlots=dead_slots,
+            full=np.array([b.full for b in behaviors]),
+            partial=np.array([b.partial for b in behaviors]),
+            existingDebt=existing_debt
+        )
+
+    @staticmethod
+    def run(state: AppState, scenarios: int = DEFAULT_SCENARIOS, seed: Optional[int] = None,
+            workers: Optional[int] = None) -> PortfolioRisk:
+        """
+        Simulate every active group. With workers > 1 groups run in a process pool;
+        results only depend on `seed`, not on the number of workers.
+        """
+        groups = [g for g in state.groups if g.status == HuiStatus.ACTIVE.value]
+        members_by_id = {m.id: m for m in state.members}
+        ledger = state.ledger
+        debts = FinanceService.compute_all_debts(groups, ledger)
+        inputs = [
+            RiskEngine.group_input(g, members_by_id, ledger,
+                                   sum(debts.get(m, g.id) for m in set(g.members)))
+            for g in groups
+        ]
+        seeds = np.random.SeedSequence(seed).spawn(len(inputs))
+
+        if workers and workers > 1 and len(inputs) > 1:
+            # spawn: like the portfolio report this may run from a background
+            # thread of the Qt app, and forking with Qt threads running is unsafe
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                results = list(pool.map(simulate_group, inputs, [scenarios] * len(inputs), seeds))
+        else:
+            results = [simulate_group(inp, scenarios, s) for inp, s in zip(inputs, seeds)]
+
+        # Groups are independent; portfolio shortfall is the scenario-wise sum
+        total = np.sum([r.shortfalls for r in results], axis=0) if results else np.zeros(scenarios)
+        return PortfolioRisk(
+            groups=results,
+            scenarios=scenarios,
+            expectedShortfall=float(total.mean()),
+            p95=float(np.percentile(total, 95)),
+            p99=float(np.percentile(total, 99)),
+            probShortfall=float((total > 0).mean()),
+            shortfalls=total
+        )
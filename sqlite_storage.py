@@ -0,0 +1,204 @@
+"""
+SQLite storage backend (smarthui.db).
+Members and groups are upserted when they change, slots are stored per group,
+and transactions/audit logs are inserted row by row as they are appended.
+"""
+import json
+import sqlite3
+from dataclasses import fields
+from typing import Dict, List, get_args
+from data_models import AppState, Member, HuiGroup, Transaction, AuditLog
+from app.models.archive_summary import ArchiveSummary
+
+DB_FILE = "smarthui.db"
+
+# table name -> (model class, key column, columns stored as JSON text)
+TABLES = {
+    'members': (Member, 'id', ()),
+    'groups': (HuiGroup, 'id', ()),
+    'transactions': (Transaction, 'seq', ()),
+    'audit_logs': (AuditLog, 'seq', ('stateBefore', 'inputParameters', 'resultCalculated', 'ai_context')),
+    'archives': (ArchiveSummary, 'id', ('members', 'memberDebts')),
+}
+
+SQL_TYPES = {int: 'INTEGER', float: 'REAL', str: 'TEXT'}
+
+def _columns(model) -> List[str]:
+    # HuiGroup.members is stored in the slots table
+    return [f.name for f in fields(model) if not (model is HuiGroup and f.name == 'members')]
+
+def _sql_type(model, name: str) -> str:
+    annotation = next(f.type for f in fields(model) if f.name == name)
+    # Optional[X] -> X
+    annotation = next((a for a in get_args(annotation) if a is not type(None)), annotation)
+    return SQL_TYPES.get(annotation, 'TEXT')
+
+class SQLiteRepository:
+    """
+    Row-level persistence of AppState.
+    Transactions and audit logs are append-only: save() inserts only rows
+    added since the last load/save.
+    """
+
+    def __init__(self, path: str = DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._saved_members: Dict[str, dict] = {}
+        self._saved_groups: Dict[str, dict] = {}
+        self._saved_archives: Dict[str, dict] = {}
+        self._tx_count = 0
+        self._log_count = 0
+        self._revision = 0 # AppState.revision of the last load/save
+        self._create_schema()
+
+    def close(self):
+        self.conn.close()
+
+    def _create_schema(self):
+        with self.conn:
+            for table, (model, key, _) in TABLES.items():
+                if key == 'seq':
+                    self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (seq INTEGER PRIMARY KEY AUTOINCREMENT)")
+                else:
+                    self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({key} TEXT PRIMARY KEY)")
+                # Add columns for model fields missing from older databases
+                existing = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+                for name in _columns(model):
+                    if name not in existing:
+                        self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {_sql_type(model, name)}")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS slots ("
+                "group_id TEXT NOT NULL, slot_index INTEGER NOT NULL, member_id TEXT NOT NULL, "
+                "PRIMARY KEY (group_id, slot_index))"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_group_period ON transactions (huiGroupId, period)")
+
+    # --- Row conversion ---
+
+    @staticmethod
+    def _to_row(table: str, data: dict) -> list:
+        model, _, json_columns = TABLES[table]
+        return [json.dumps(data.get(name), ensure_ascii=False) if name in json_columns else data.get(name)
+                for name in _columns(model)]
+
+    @staticmethod
+    def _from_row(table: str, columns: List[str], row) -> dict:
+        model, _, json_columns = TABLES[table]
+        data = {}
+        for name, value in zip(columns, row):
+            if name in json_columns and value is not None:
+                value = json.loads(value)
+            data[name] = value
+        return data
+
+    def _select(self, table: str) -> List[dict]:
+        model, key, _ = TABLES[table]
+        columns = _columns(model)
+        order = " ORDER BY seq" if key == 'seq' else " ORDER BY rowid"
+        cursor = self.conn.execute(f"SELECT {', '.join(columns)} FROM {table}{order}")
+        return [self._from_row(table, columns, row) for row in cursor]
+
+    def _insert(self, table: str, rows: List[dict], upsert: bool = False):
+        if not rows:
+            return
+        model, key, _ = TABLES[table]
+        columns = _columns(model)
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        if upsert:
+            # Update in place so rowid (and therefore load order) is preserved
+            updates = ', '.join(f"{c} = excluded.{c}" for c in columns if c != key)
+            sql += f" ON CONFLICT({key}) DO UPDATE SET {updates}"
+        self.conn.executemany(sql, [self._to_row(table, r) for r in rows])
+
+    # --- Public API ---
+
+    def is_empty(self) -> bool:
+        return all(self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 0 for table in TABLES)
+
+    def load(self) -> AppState:
+        """Load the full state and remember what is already persisted."""
+        slots: Dict[str, List[str]] = {}
+        for group_id, member_id in self.conn.execute("SELECT group_id, member_id FROM slots ORDER BY group_id, slot_index"):
+            slots.setdefault(group_id, []).append(member_id)
+
+        groups = []
+        for data in self._select('groups'):
+            data['members'] = slots.get(data['id'], [])
+            groups.append(HuiGroup.from_dict(data))
+
+        state = AppState(
+            members=[Member.from_dict(m) for m in self._select('members')],
+            groups=groups,
+            transactions=[Transaction.from_dict(t) for t in self._select('transactions')],
+            auditLogs=[AuditLog.from_dict(l) for l in self._select('audit_logs')],
+            archives=[ArchiveSummary.from_dict(a) for a in self._select('archives')]
+        )
+        self._mark_saved(state)
+        return state
+
+    def _mark_saved(self, state: AppState):
+        self._saved_members = {m.id: dict(m.to_dict()) for m in state.members}
+        self._saved_archives = {a.id: dict(a.to_dict()) for a in state.archives}
+        self._saved_groups = {g.id: {**g.to_dict(), 'members': list(g.members)} for g in state.groups}
+        self._tx_count = len(state.transactions)
+        self._log_count = len(state.auditLogs)
+        self._revision = state.revision
+
+    def save(self, state: AppState):
+        """Persist changes since the last load/save in a single transaction."""
+        with self.conn:
+            self._save_keyed('members', state.members, self._saved_members)
+            self._save_keyed('archives', state.archives, self._saved_archives)
+            self._save_groups(state.groups)
+            # History rewritten in place (e.g. archived): the rows cannot be expressed as appends
+            rewritten = state.revision != self._revision
+            self._tx_count = self._append_rows('transactions', state.transactions, self._tx_count, rewritten)
+            self._log_count = self._append_rows('audit_logs', state.auditLogs, self._log_count, rewritten)
+            self._revision = state.revision
+
+    def _save_keyed(self, table: str, items: list, saved: Dict[str, dict]):
+        """Upsert changed rows and delete removed rows of an id-keyed table."""
+        current = {item.id: item.to_dict() for item in items}
+        changed = [d for item_id, d in current.items() if saved.get(item_id) != d]
+        removed = [item_id for item_id in saved if item_id not in current]
+        self._insert(table, changed, upsert=True)
+        self.conn.executemany(f"DELETE FROM {table} WHERE id = ?", [(item_id,) for item_id in removed])
+        for d in changed:
+            saved[d['id']] = dict(d)
+        for item_id in removed:
+            del saved[item_id]
+
+    def _save_groups(self, groups: List[HuiGroup]):
+        current = {g.id: g.to_dict() for g in groups}
+        changed = [d for gid, d in current.items() if self._saved_groups.get(gid) != d]
+        removed = [gid for gid in self._saved_groups if gid not in current]
+        self._insert('groups', changed, upsert=True)
+        for gid in removed + [d['id'] for d in changed]:
+            self.conn.execute("DELETE FROM slots WHERE group_id = ?", (gid,))
+        self.conn.executemany("DELETE FROM groups WHERE id = ?", [(gid,) for gid in removed])
+        self.conn.executemany(
+            "INSERT INTO slots (group_id, slot_index, member_id) VALUES (?, ?, ?)",
+            [(d['id'], i, mid) for d in changed for i, mid in enumerate(d['members'])]
+        )
+        for d in changed:
+            self._saved_groups[d['id']] = {**d, 'members': list(d['members'])}
+        for gid in removed:
+            del self._saved_groups[gid]
+
+    def _append_rows(self, table: str, items: list, saved_count: int, rewritten: bool = False) -> int:
+        if rewritten or len(items) < saved_count:
+            # History was rewritten or truncated: rewrite the table
+            self.conn.execute(f"DELETE FROM {table}")
+            saved_count = 0
+        self._insert(table, [item.to_dict() for item in items[saved_count:]])
+        return len(items)
+
+    def import_json(self, json_path: str) -> AppState:
+        """One-time import of a data.json file into an empty database."""
+        if not self.is_empty():
+            raise ValueError(f"Database {self.path} already contains data")
+        with open(json_path, 'r', encoding='utf-8') as f:
+            state = AppState.from_dict(json.load(f))
+        self._mark_saved(AppState())
+        self.save(state)
+        return state
@@ -1,10 +1,76 @@
 import json
 import os
 from data_models import AppState
+from app.utils.atomic_write import write_json_atomic
 
 DATA_FILE = "data.json"
+DB_FILE = "smarthui.db"
+
+# "json": rewrite DATA_FILE on every save
+# "journal": append changes to JOURNAL_FILE, rewrite DATA_FILE on checkpoint
+# "binary": SNAPSHOT_FILE with lazily decoded transactions/audit logs
+# "sqlite": row-level writes to DB_FILE (data.json is imported once)
+# "events": append published domain events to EVENTS_FILE, snapshot every SNAPSHOT_EVERY events
+STORAGE_BACKEND = "json"
+SNAPSHOT_FILE = "data.snapshot"
+JOURNAL_FILE = "data.journal"
+CHECKPOINT_EVERY = 500
+EVENTS_FILE = "data.events"
+EVENTS_SNAPSHOT_FILE = "data.events.snapshot"
+SNAPSHOT_EVERY = 500
+
+_repository = None
+_journal = None
+_event_store = None
+
+def get_repository():
+    """Get the SQLite repository (lazy initialization)."""
+    global _repository
+    if _repository is None:
+        from sqlite_storage import SQLiteRepository
+        _repository = SQLiteRepository(DB_FILE)
+    return _repository
+
+def get_journal():
+    """Get the snapshot journal (lazy initialization)."""
+    global _journal
+    if _journal is None:
+        from journal_storage import Journal
+        _journal = Journal(DATA_FILE, JOURNAL_FILE, CHECKPOINT_EVERY)
+    return _journal
+
+def get_event_store():
+    """Get the event store, recording published domain events (lazy initialization)."""
+    global _event_store
+    if _event_store is None:
+        from app.core.event_store import EventStore
+        _event_store = EventStore(EVENTS_FILE, EVENTS_SNAPSHOT_FILE, SNAPSHOT_EVERY)
+        _event_store.subscribe()
+    return _event_store
 
 def get_initial_data() -> AppState:
+    if STORAGE_BACKEND == "sqlite":
+        return _load_sqlite()
+    if STORAGE_BACKEND == "events":
+        try:
+            return get_event_store().load(create_default_data)
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return create_default_data()
+    if STORAGE_BACKEND == "journal":
+        try:
+            return get_journal().load(create_default_data)
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return create_default_data()
+    if STORAGE_BACKEND == "binary" and os.path.exists(SNAPSHOT_FILE):
+        try:
+            from binary_storage import read_snapshot
+            return read_snapshot(SNAPSHOT_FILE)
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return create_default_data()
+    # JSON file (also the migration path for the binary backend)
     if os.path.exists(DATA_FILE):
         try:
             with open(DATA_FILE, 'r', encoding='utf-8') as f:
@@ -16,6 +82,20 @@ def get_initial_data() -> AppState:
     else:
         return create_default_data()
 
+def _load_sqlite() -> AppState:
+    repo = get_repository()
+    try:
+        if repo.is_empty():
+            if os.path.exists(DATA_FILE):
+                return repo.import_json(DATA_FILE)
+            state = create_default_data()
+            repo.save(state)
+            return state
+        return repo.load()
+    except Exception as e:
+        print(f"Error loading data: {e}")
+        return create_default_data()
+
 def create_default_data() -> AppState:
     from data_models import Member, HuiGroup, Transaction, HuiType, HuiStatus, MemberStatus
     from datetime import datetime
@@ -185,9 +265,36 @@ def create_default_data() -> AppState:
     
     return AppState(members=members, groups=groups, transactions=transactions, auditLogs=[])
 
+def write_data(state: AppState):
+    """Persist the state with the configured backend. Raises on failure."""
+    if STORAGE_BACKEND == "sqlite":
+        get_repository().save(state)
+    elif STORAGE_BACKEND == "journal":
+        get_journal().append(state)
+    elif STORAGE_BACKEND == "events":
+        # Domain events were captured when published; the snapshot is not needed
+        get_event_store().write()
+    elif STORAGE_BACKEND == "binary":
+        from binary_storage import write_snapshot
+        write_snapshot(state, SNAPSHOT_FILE)
+    else:
+        write_json_atomic(DATA_FILE, state.to_dict(), indent=2)
+
 def save_data(state: AppState):
     try:
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(state.to_dict(), f, ensure_ascii=False, indent=2)
+        write_data(state)
     except Exception as e:
         print(f"Error saving data: {e}")
+
+def flush_data(state: AppState):
+    """Called on exit: checkpoint the journal/event store, or do a final save for other backends."""
+    if STORAGE_BACKEND in ("journal", "events"):
+        try:
+            if STORAGE_BACKEND == "journal":
+                get_journal().checkpoint(state)
+            else:
+                get_event_store().checkpoint(state)
+        except Exception as e:
+            print(f"Error saving data: {e}")
+        return
+    save_data(state)
@@ -0,0 +1,21 @@
+import pytest
+from data_models import HuiGroup, HuiType, HuiStatus
+
+@pytest.fixture
+def make_group():
+    """
+    Factory of HuiGroups for tests: a monthly, active 1,000,000 group in
+    period 2 by default. `members` is a list of slot member IDs or a slot
+    count ("m1".."mN"); any other HuiGroup field can be overridden.
+    """
+    def make(group_id="g1", members=("m1", "m2"), **fields):
+        if isinstance(members, int):
+            members = [f"m{i}" for i in range(1, members + 1)]
+        values = dict(
+            id=group_id, name=group_id, type=HuiType.MONTHLY.value, amountPerShare=1000000,
+            commissionRate=5, totalMembers=len(members), startDate="2024-01-01",
+            status=HuiStatus.ACTIVE.value, members=list(members), currentPeriod=2
+        )
+        values.update(fields)
+        return HuiGroup(**values)
+    return make
@@ -0,0 +1,107 @@
+import pytest
+from data_models import AppState, Transaction, AuditLog, HuiStatus
+from services.archive_service import ArchiveService
+from services.finance_service import FinanceService
+
+# --- Arrange: Reusable Test Data ---
+
+def make_log(log_id, group_id):
+    return AuditLog(id=log_id, timestamp="", action="COLLECT", userId="admin", scenario="",
+                    stateBefore={}, inputParameters={}, resultCalculated={}, huiGroupId=group_id)
+
+@pytest.fixture
+def state(make_group):
+    return AppState(
+        groups=[make_group("done", status=HuiStatus.COMPLETED.value), make_group("live")],
+        transactions=[
+            Transaction(id="t1", huiGroupId="done", memberId="m1", type='COLLECT', amount=0, netAmount=1850000, bidAmount=100000, period=1, date=""),
+            Transaction(id="t2", huiGroupId="done", memberId="m2", type='CONTRIBUTE', amount=900000, period=1, date=""),
+            Transaction(id="t3", huiGroupId="live", memberId="m1", type='CONTRIBUTE', amount=1000000, period=1, date=""),
+        ],
+        auditLogs=[make_log("l1", "done"), make_log("l2", "live")]
+    )
+
+# --- Tests for ArchiveService ---
+
+def test_archive_moves_completed_groups_out_of_hot_state(state, tmp_path):
+    """Test case: Completed groups and their rows leave the hot lists; a summary stays."""
+    summaries = ArchiveService.archive_completed_groups(state, str(tmp_path))
+
+    assert [s.id for s in summaries] == ["done"]
+    assert [g.id for g in state.groups] == ["live"]
+    assert [t.id for t in state.transactions] == ["t3"]
+    assert [l.id for l in state.auditLogs] == ["l2"]
+    assert state.archives == summaries
+
+    summary = summaries[0]
+    assert summary.transactionCount == 2
+    assert summary.auditLogCount == 1
+    assert summary.totalContributed == 900000
+    assert summary.totalCollected == 1850000
+    assert summary.totalCommission == 50000 # 5% of 1,000,000 for one collected period
+
+def test_archive_segment_round_trip(state, tmp_path):
+    """Test case: The segment file restores the group with its full history."""
+    summary = ArchiveService.archive_completed_groups(state, str(tmp_path))[0]
+
+    archived = ArchiveService.load_segment(summary)
+    assert archived.group.id == "done"
+    assert [t.id for t in archived.transactions] == ["t1", "t2"]
+    assert [l.id for l in archived.auditLogs] == ["l1"]
+
+def test_member_history_includes_archived_rows(state, tmp_path):
+    """Test case: Member statements still see transactions of archived groups."""
+    ArchiveService.archive_completed_groups(state, str(tmp_path))
+
+    history = list(ArchiveService.iter_member_transactions("m1", state))
+    assert [t.id for t in history] == ["t1", "t3"]
+
+def test_archived_totals_and_noop(state, tmp_path):
+    """Test case: Totals are summed from summaries; nothing to archive is a no-op."""
+    ArchiveService.archive_completed_groups(state, str(tmp_path))
+    assert ArchiveService.archive_completed_groups(state, str(tmp_path)) == []
+
+    totals = ArchiveService.archived_totals(state)
+    assert totals == {'contributed': 900000, 'collected': 1850000, 'commission': 50000, 'badDebt': 0}
+
+def test_archive_keeps_member_debts(state, tmp_path):
+    """Test case: Debt still owed in a completed group is kept per member in its summary."""
+    # Arrange: m2 paid only part of period 1
+    state.transactions[1].amount = 400000
+    owed = FinanceService.compute_all_debts(state.groups[:1], state.transactions).byMember
+
+    # Act
+    summary = ArchiveService.archive_completed_groups(state, str(tmp_path))[0]
+
+    # Assert
+    assert summary.memberDebts == {"m2": 500000} == {m: d for m, d in owed.items() if d}
+    assert summary.totalBadDebt == 500000
+    assert ArchiveService.archived_member_debts(state.archives) == {"m2": 500000}
+    assert ArchiveService.archived_totals(state)['badDebt'] == 500000
+    assert AppState.from_dict(state.to_dict()).archives == state.archives
+
+def test_archived_state_serializes(state, tmp_path):
+    """Test case: Archive summaries survive an AppState dict round trip."""
+    ArchiveService.archive_completed_groups(state, str(tmp_path))
+
+    restored = AppState.from_dict(state.to_dict())
+    assert restored.archives == state.archives
+
+def test_indexes_rebuild_after_archive_and_refill(state, tmp_path):
+    """Test case: Archiving rewrites the history in place; indexes rebuild even if new rows restore its length."""
+    # Arrange: index the full history
+    assert len(state.ledger.group_transactions("done")) == 2
+    assert state.store.total(group_id="done") == 900000
+
+    # Act: archive (3 rows -> 1), then append two new rows before the next sync
+    ArchiveService.archive_completed_groups(state, str(tmp_path))
+    state.transactions.extend([
+        Transaction(id="t4", huiGroupId="live", memberId="m2", type='CONTRIBUTE', amount=700000, period=1, date=""),
+        Transaction(id="t5", huiGroupId="live", memberId="m2", type='CONTRIBUTE', amount=300000, period=1, date=""),
+    ])
+
+    # Assert
+    assert state.ledger.group_transactions("done") == []
+    assert state.ledger.paid("live", 1, "m2") == 1000000
+    assert state.store.total(group_id="done") == 0
+    assert state.store.total(group_id="live") == 1000000 + 1000000
@@ -0,0 +1,68 @@
+import pytest
+from data_models import Transaction
+from services.bid_simulator import BidSimulator
+from services.finance_service import FinanceService
+
+# --- Arrange: Reusable Test Data ---
+
+@pytest.fixture
+def group(make_group):
+    """Period 3 of a 4-slot group; m1 holds two slots."""
+    return make_group("g1", ["m1", "m1", "m2", "m3"], commissionRate=2.5, currentPeriod=3,
+                      minBidStep=50000, maxBidLimit=300000)
+
+@pytest.fixture
+def transactions():
+    return [
+        Transaction(id="t1", huiGroupId="g1", memberId="m1", type='COLLECT', amount=0, bidAmount=100000, period=1, date=""),
+        Transaction(id="t2", huiGroupId="g1", memberId="m2", type='CONTRIBUTE', amount=900000, period=1, date=""),
+        Transaction(id="t3", huiGroupId="g1", memberId="m2", type='COLLECT', amount=0, bidAmount=150000, period=2, date=""),
+        Transaction(id="t4", huiGroupId="g1", memberId="m3", type='CONTRIBUTE', amount=500000, period=2, date=""),
+    ]
+
+# --- Tests for BidSimulator ---
+
+def test_bid_range_uses_limit_and_step(group):
+    """Test case: The bid grid runs from 0 to maxBidLimit (or V) in minBidStep steps."""
+    assert list(BidSimulator.bid_range(group)) == [0, 50000, 100000, 150000, 200000, 250000, 300000]
+    group.maxBidLimit = 0
+    assert BidSimulator.bid_range(group)[-1] == 1000000
+
+@pytest.mark.parametrize("winner_id", ["m3", "m1"])
+def test_simulation_matches_calculate_payout(group, transactions, winner_id):
+    """Test case: Every simulated bid gives the same payout as FinanceService."""
+    # Act
+    simulation = BidSimulator.simulate(group, winner_id, transactions)
+
+    # Assert
+    for i, bid in enumerate(simulation.bids.tolist()):
+        expected = FinanceService.calculate_payout(group, group.currentPeriod, bid, winner_id, transactions)
+        assert simulation.netReceived[i] == expected.netReceived
+        assert simulation.totalPot[i] == expected.totalPot
+        assert simulation.payout(bid).__dict__ == expected.__dict__
+    # Off-grid bids are computed directly
+    assert simulation.index(123456) is None
+    assert simulation.payout(123456).netReceived == \
+        FinanceService.calculate_payout(group, group.currentPeriod, 123456, winner_id, transactions).netReceived
+
+def test_simulation_contributions_match_plan(group, transactions):
+    """Test case: Per-member contributions match the contribution plan for each bid."""
+    # Act
+    simulation = BidSimulator.simulate(group, "m3", transactions)
+
+    # Assert
+    for bid in (0, 150000, 175000):
+        plan = FinanceService.get_contribution_plan(group, group.currentPeriod, bid, "m3", transactions)
+        assert simulation.contributions_at(bid) == {item.memberId: item.requiredAmount for item in plan}
+
+def test_max_bid_with_positive_payout(group, transactions):
+    """Test case: The highest bid keeping the winner's payout non-negative is found on the grid."""
+    # m3 owes 900,000 from period 1 and 850,000 - 500,000 from period 2
+    simulation = BidSimulator.simulate(group, "m3", transactions, bids=range(0, 2000001, 10000))
+    assert simulation.deductions == 1250000
+
+    # Net = (V - B) + 2V - 25,000 commission - 1,250,000 debt >= 0  <=>  B <= 1,725,000
+    max_bid = simulation.max_bid_with_positive_payout()
+    assert max_bid == 1720000
+    assert simulation.payout(max_bid).netReceived >= 0
+    assert simulation.payout(max_bid + 10000).netReceived < 0
@@ -0,0 +1,94 @@
+import datetime
+import functools
+import pytest
+from data_models import Transaction, HuiType, HuiStatus
+from services.cashflow_service import CashflowService, add_months, period_calendar
+
+START = datetime.date(2026, 1, 1)
+
+@pytest.fixture
+def make_group(make_group):
+    """Four-slot groups at 2% commission, starting 2026-01-10 in period 1."""
+    return functools.partial(make_group, members=4, commissionRate=2, startDate="2026-01-10", currentPeriod=1)
+
+# --- Tests for calendars ---
+
+def test_add_months_clamps_to_month_end():
+    """Test case: Month arithmetic keeps the day when possible and clamps otherwise."""
+    assert add_months(datetime.date(2026, 1, 31), 1) == datetime.date(2026, 2, 28)
+    assert add_months(datetime.date(2026, 11, 15), 3) == datetime.date(2027, 2, 15)
+
+@pytest.mark.parametrize("hui_type, expected", [
+    (HuiType.DAILY.value, ["2026-01-10", "2026-01-11", "2026-01-12"]),
+    (HuiType.WEEKLY.value, ["2026-01-10", "2026-01-17", "2026-01-24"]),
+    (HuiType.BIWEEKLY.value, ["2026-01-10", "2026-01-25", "2026-02-09"]),
+    (HuiType.MONTHLY.value, ["2026-01-10", "2026-02-10", "2026-03-10"]),
+    (HuiType.KIES.value, ["2026-01-10", "2026-04-10", "2026-07-10"]),
+])
+def test_period_calendar_per_type(hui_type, expected):
+    """Test case: Each HuiType expands to its own period length."""
+    calendar = period_calendar(hui_type, datetime.date(2026, 1, 10), 3)
+    assert [str(d) for d in calendar] == expected
+
+# --- Tests for projections ---
+
+def test_weekly_group_lands_in_the_right_months(make_group):
+    """Test case: A weekly group contributes one period per week to its month bucket."""
+    # Arrange: 8 weekly periods from 2026-01-10: 4 in January, 4 in February
+    group = make_group(type=HuiType.WEEKLY.value, members=8)
+
+    # Act
+    projection = CashflowService.project([group], start=START, end=datetime.date(2026, 4, 1))
+
+    # Assert
+    assert [p["name"] for p in projection] == ["T1/2026", "T2/2026", "T3/2026"]
+    assert projection[0]["commission"] == 4 * 20000
+    assert projection[1]["commission"] == 4 * 20000
+    assert projection[2]["in"] == 0
+    # Every period collects 7 shares of 1M (no bids); the winner receives the pot minus commission
+    total_in = sum(p["in"] for p in projection)
+    assert total_in == 8 * 7 * 1000000
+    assert sum(p["out"] for p in projection) == total_in - 8 * 20000
+
+def test_overdue_group_is_rescheduled_from_start(make_group):
+    """Test case: If the current period is past due, the remaining periods start at the horizon start."""
+    group = make_group(startDate="2024-01-01", currentPeriod=3)
+
+    schedule = CashflowService.group_schedule(group, START)
+
+    assert [str(d) for d in schedule['date']] == ["2026-01-01", "2026-02-01"]
+
+def test_day_buckets_and_inactive_groups(make_group):
+    """Test case: Integer buckets are sizes in days; only active groups are projected."""
+    daily = make_group(type=HuiType.DAILY.value, startDate="2026-01-01", members=5)
+    done = make_group("g2", startDate="2026-01-01")
+    done.status = HuiStatus.COMPLETED.value
+
+    projection = CashflowService.project([daily, done], start=START, end=datetime.date(2026, 1, 11), bucket=2)
+
+    assert len(projection) == 5
+    assert projection[0]["name"] == "01/01/2026"
+    assert [p["commission"] for p in projection] == [40000, 40000, 20000, 0, 0]
+
+def test_expected_bid_and_collected_current_period(make_group):
+    """Test case: Past bids set the expected bid; a collected current period only brings its unpaid contributions."""
+    # Arrange: period 1 won with a 100k bid, period 2 already collected, only m2 paid for it
+    group = make_group(currentPeriod=2)
+    transactions = [
+        Transaction(id="t1", huiGroupId="g1", memberId="m1", type='COLLECT', amount=0, bidAmount=100000, period=1, date=""),
+        Transaction(id="t2", huiGroupId="g1", memberId="m2", type='COLLECT', amount=0, bidAmount=200000, period=2, date=""),
+        Transaction(id="t3", huiGroupId="g1", memberId="m3", type='CONTRIBUTE', amount=800000, period=2, date=""),
+    ]
+    # Due: period 2 on 2026-02-10, 3 on 03-10, 4 on 04-10; group_schedule starts after period 1
+    schedule = CashflowService.group_schedule(group, START, transactions)
+
+    # Period 2: m1 (dead) owes 1M, m4 owes 800k, m3 paid in full
+    assert schedule['in'][0] == 1000000 + 800000
+    assert schedule['out'][0] == 0
+    # Period 3: 2 dead slots pay 1M, 1 live slot pays 1M - 100k (the average past bid)
+    assert schedule['in'][1] == 2 * 1000000 + 900000
+    assert schedule['out'][1] == 2900000 - 20000
+
+def test_invalid_bucket_raises():
+    with pytest.raises(ValueError):
+        CashflowService.bucket_edges(START, datetime.date(2026, 2, 1), 0)
@@ -0,0 +1,90 @@
+import pytest
+from data_models import Transaction, HuiType
+from app.core.event_bus import get_event_bus, Event, EventType
+from app.models.archive_summary import ArchiveSummary
+from app.services.debt_cache import DebtCache
+from services.finance_service import FinanceService
+
+# --- Arrange: Reusable Test Data ---
+
+@pytest.fixture
+def groups(make_group):
+    return [make_group("g1", ["m1", "m2", "m3"]), make_group("g2", ["m1", "m2"])]
+
+@pytest.fixture
+def transactions():
+    """Period 1 of both groups: m1 won, nobody has paid yet."""
+    return [
+        Transaction(id="t1", huiGroupId="g1", memberId="m1", type='COLLECT', amount=0, bidAmount=100000, period=1, date=""),
+        Transaction(id="t2", huiGroupId="g2", memberId="m1", type='COLLECT', amount=0, bidAmount=0, period=1, date=""),
+    ]
+
+@pytest.fixture
+def cache(groups, transactions):
+    debt_cache = DebtCache(groups, transactions)
+    yield debt_cache
+    debt_cache.close()
+
+# --- Tests for DebtCache ---
+
+def test_debt_cache_totals(cache):
+    """Test case: Debt is summed over every group the member holds slots in."""
+    assert cache.get_member_total_debt("m1") == 0
+    assert cache.get_member_total_debt("m2") == 900000 + 1000000
+    assert cache.get_member_total_debt("m3") == 900000
+
+def test_debt_cache_includes_archived_debt(groups, transactions):
+    """Test case: Debt left in archived groups is added to member totals."""
+    archive = ArchiveSummary(id="old", name="old", type=HuiType.MONTHLY.value, amountPerShare=1000000,
+                             archivedAt="", segmentFile="", memberDebts={"m3": 250000})
+    debt_cache = DebtCache(groups, transactions, [archive])
+    try:
+        assert debt_cache.get_member_total_debt("m3") == 900000 + 250000
+        assert debt_cache.member_totals()["m3"] == 900000 + 250000
+        assert debt_cache.member_totals()["m2"] == 900000 + 1000000
+    finally:
+        debt_cache.close()
+
+def test_payment_event_recomputes_single_cell(cache, groups, transactions, mocker):
+    """Test case: A PAYMENT_MADE event only invalidates the payer's debt in that group."""
+    # Arrange: warm the cache
+    for member_id in ["m1", "m2", "m3"]:
+        cache.get_member_total_debt(member_id)
+    spy = mocker.spy(FinanceService, 'get_member_total_debt')
+
+    # Act
+    tx = Transaction(id="t3", huiGroupId="g1", memberId="m2", type='CONTRIBUTE', amount=900000, period=1, date="")
+    transactions.append(tx)
+    get_event_bus().publish(Event(type=EventType.PAYMENT_MADE, data={'group': groups[0], 'transaction': tx}))
+    totals = {member_id: cache.get_member_total_debt(member_id) for member_id in ["m1", "m2", "m3"]}
+
+    # Assert
+    assert spy.call_count == 1
+    assert totals == {"m1": 0, "m2": 1000000, "m3": 900000}
+
+def test_collection_event_invalidates_group(cache, groups):
+    """Test case: A COLLECTION_EXECUTED event invalidates every member of that group only."""
+    # Arrange
+    for member_id in ["m1", "m2", "m3"]:
+        cache.get_member_total_debt(member_id)
+
+    # Act
+    get_event_bus().publish(Event(type=EventType.COLLECTION_EXECUTED, data={'group': groups[1]}))
+
+    # Assert
+    assert set(cache._debts) == {("m1", "g1"), ("m2", "g1"), ("m3", "g1")}
+
+def test_warm_fills_cache_in_one_batch(cache, mocker):
+    """Test case: warm() computes every missing entry without per-member recomputation."""
+    # Arrange
+    per_member = mocker.spy(FinanceService, 'get_member_total_debt')
+    batch = mocker.spy(FinanceService, 'compute_all_debts')
+
+    # Act
+    cache.warm()
+    totals = {member_id: cache.get_member_total_debt(member_id) for member_id in ["m1", "m2", "m3"]}
+
+    # Assert
+    assert batch.call_count == 1
+    assert per_member.call_count == 0
+    assert totals == {"m1": 0, "m2": 1900000, "m3": 900000}
@@ -0,0 +1,113 @@
+import pytest
+from openpyxl import load_workbook
+from data_models import AppState, Member, Transaction, HuiStatus
+from services import export_service
+from services.archive_service import ArchiveService
+from services.export_service import ExportService, sheet_title, DEBT_LABEL, TOTAL_LABEL
+
+# --- Arrange: Reusable Test Data ---
+
+@pytest.fixture
+def state(tmp_path, make_group):
+    """One archived group and one live group in period 2 where m2 underpaid period 1."""
+    state = AppState(
+        members=[Member(id="m1", name="An", phone="0909000111", address="", joinDate=""),
+                 Member(id="m2", name="Bình", phone="0909000222", address="", joinDate="")],
+        groups=[make_group("done", name="Dây done", status=HuiStatus.COMPLETED.value),
+                make_group("live", name="Dây live")],
+        transactions=[
+            Transaction(id="t1", huiGroupId="done", memberId="m1", type='COLLECT', amount=0, netAmount=1850000, bidAmount=100000, period=1, date="2024-01-01"),
+            Transaction(id="t2", huiGroupId="done", memberId="m2", type='CONTRIBUTE', amount=900000, period=1, date="2024-01-01"),
+            Transaction(id="t3", huiGroupId="live", memberId="m1", type='COLLECT', amount=0, netAmount=1850000, bidAmount=100000, period=1, date="2024-02-01"),
+            Transaction(id="t4", huiGroupId="live", memberId="m2", type='CONTRIBUTE', amount=500000, period=1, date="2024-02-01"),
+        ]
+    )
+    ArchiveService.archive_completed_groups(state, str(tmp_path / "archive"))
+    return state
+
+def read_sheets(path):
+    workbook = load_workbook(path, read_only=True)
+    sheets = {ws.title: [list(r) for r in ws.iter_rows(values_only=True)] for ws in workbook.worksheets}
+    workbook.close()
+    return sheets
+
+# --- Tests for ExportService ---
+
+def test_sheet_title_is_valid_and_unique():
+    used = set()
+    assert sheet_title("Dây [A]/B", used) == "Dây  A  B"
+    assert sheet_title("dây  a  b", used) == "dây  a  b (2)"
+    assert len(sheet_title("x" * 40, used)) == 31
+
+def test_group_ledgers(state, tmp_path):
+    """Test case: Each live group gets a sheet with its transactions, member names and in/out/penalty totals."""
+    # Arrange: a payout without netAmount and a penalty
+    state.transactions.extend([
+        Transaction(id="t5", huiGroupId="live", memberId="m2", type='COLLECT', amount=1000000, period=2, date="2024-03-01"),
+        Transaction(id="t6", huiGroupId="live", memberId="m2", type='PENALTY', amount=20000, period=2, date="2024-03-01"),
+    ])
+
+    # Act
+    path = str(tmp_path / "ledgers.xlsx")
+    written = ExportService.export_group_ledgers(state, path)
+
+    # Assert
+    sheets = read_sheets(path)
+    assert list(sheets) == ["Dây live"]
+    header, *rows = sheets["Dây live"]
+    assert header[:4] == ["Ngày", "Kỳ", "Thành viên", "Loại"]
+    assert [r[:5] for r in rows[:2]] == [["2024-02-01", 1, "An", "Hốt", 0], ["2024-02-01", 1, "Bình", "Đóng", 500000]]
+    totals = rows[-3:]
+    assert all(r[0] == TOTAL_LABEL for r in totals)
+    assert [r[3] for r in totals] == ["Đóng", "Hốt", "Phạt"]
+    assert totals[0][4] == 500000 # Contributions in
+    assert totals[1][6] == 1850000 + 1000000 # Payouts out: netAmount, else amount
+    assert totals[2][4] == 20000 # Penalties
+    assert written == 4 + 3
+
+def test_member_statements_include_archives_and_debt(state, tmp_path):
+    """Test case: A statement lists archived then live transactions and ends with the current debt."""
+    # Act
+    path = str(tmp_path / "statements.xlsx")
+    ExportService.export_member_statements(state, path)
+
+    # Assert
+    rows = read_sheets(path)["Sổ nợ"][1:]
+    m2 = [r for r in rows if r[0] == "Bình"]
+    assert [(r[3], r[5], r[6]) for r in m2[:-1]] == [("Dây done", "Đóng", 900000), ("Dây live", "Đóng", 500000)]
+    assert m2[-1][5] == DEBT_LABEL
+    assert m2[-1][6] == 400000 # 900,000 due in period 1
+    m1 = [r for r in rows if r[0] == "An"]
+    assert [r[5] for r in m1] == ["Hốt", "Hốt", DEBT_LABEL]
+
+def test_single_member_statement(state, tmp_path):
+    path = str(tmp_path / "m2.xlsx")
+
+    ExportService.export_member_statements(state, path, member_ids=["m2"])
+
+    assert list(read_sheets(path)) == ["Sổ nợ Bình"]
+
+def test_commission_report(state, tmp_path):
+    """Test case: Live and archived groups with their commission, and a totals row."""
+    path = str(tmp_path / "commission.xlsx")
+    state.archives[0].memberDebts = {"m2": 300000}
+
+    ExportService.export_commission_report(state, path)
+
+    rows = read_sheets(path)["Hoa hồng"][1:]
+    assert [(r[0], r[5]) for r in rows] == [("Dây live", 50000), ("Dây done", 50000), (TOTAL_LABEL, 100000)]
+    assert rows[0][7] == 400000 # m2's shortfall in period 1
+    assert rows[1][7] == 300000 # Debt left in the archived group
+    assert rows[-1][6] == 900000 + 500000
+    assert rows[-1][7] == 400000 + 300000
+
+def test_long_exports_continue_on_a_new_sheet(state, tmp_path, monkeypatch):
+    """Test case: Rows past the sheet limit go to a numbered sheet that repeats the header."""
+    monkeypatch.setattr(export_service, 'MAX_SHEET_ROWS', 3)
+    path = str(tmp_path / "split.xlsx")
+
+    written = ExportService.write_workbook(path, [("Data", ["A"], ([i] for i in range(5)))])
+
+    sheets = read_sheets(path)
+    assert written == 5
+    assert sheets == {"Data": [["A"], [0], [1]], "Data 2": [["A"], [2], [3]], "Data 3": [["A"], [4]]}
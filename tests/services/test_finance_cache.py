@@ -0,0 +1,113 @@
+import functools
+import pytest
+from data_models import Transaction
+from app.models.ledger_index import LedgerIndex
+from services.finance_cache import FinanceCache, get_finance_cache
+from services.finance_service import FinanceService
+
+# --- Arrange: Reusable Test Data ---
+
+@pytest.fixture
+def make_group(make_group):
+    """Three-slot groups at 2% commission."""
+    return functools.partial(make_group, members=("m1", "m2", "m3"), commissionRate=2)
+
+@pytest.fixture
+def transactions():
+    return [
+        Transaction(id="t1", huiGroupId="g1", memberId="m1", type='COLLECT', amount=0, bidAmount=100000, period=1, date=""),
+        Transaction(id="t2", huiGroupId="g2", memberId="m2", type='COLLECT', amount=0, bidAmount=50000, period=1, date=""),
+    ]
+
+def pay(gid, member_id, amount):
+    return Transaction(id=f"{gid}-{member_id}", huiGroupId=gid, memberId=member_id, type='CONTRIBUTE',
+                       amount=amount, period=2, date="")
+
+# --- Tests for FinanceCache ---
+
+def test_cached_results_match_finance_service(transactions, make_group):
+    """Test case: The cache returns the same figures as FinanceService and counts hits and misses."""
+    # Arrange
+    cache = FinanceCache()
+    group = make_group("g1")
+    ledger = LedgerIndex(transactions)
+
+    # Act
+    plan = cache.get_contribution_plan(group, 2, 0, None, ledger)
+    again = cache.get_contribution_plan(group, 2, 0, None, ledger)
+    payout = cache.calculate_payout(group, 2, 200000, "m2", ledger)
+
+    # Assert
+    expected = FinanceService.get_contribution_plan(group, 2, 0, None, ledger)
+    assert [(p.memberId, p.requiredAmount, p.remainingAmount) for p in plan] == \
+        [(p.memberId, p.requiredAmount, p.remainingAmount) for p in expected]
+    assert again is plan
+    assert payout.netReceived == FinanceService.calculate_payout(group, 2, 200000, "m2", ledger).netReceived
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+def test_new_transaction_only_invalidates_its_group(transactions, make_group):
+    """Test case: A payment in g1 recomputes g1's plan and keeps g2's cached entry."""
+    # Arrange
+    cache = FinanceCache()
+    g1, g2 = make_group("g1"), make_group("g2")
+    ledger = LedgerIndex().sync(transactions)
+    plan_g1 = cache.get_contribution_plan(g1, 2, 0, None, ledger)
+    plan_g2 = cache.get_contribution_plan(g2, 2, 0, None, ledger)
+
+    # Act
+    transactions.append(pay("g1", "m2", 1000000))
+    ledger.sync(transactions)
+    new_g1 = cache.get_contribution_plan(g1, 2, 0, None, ledger)
+    same_g2 = cache.get_contribution_plan(g2, 2, 0, None, ledger)
+
+    # Assert
+    assert new_g1 is not plan_g1
+    assert next(p for p in new_g1 if p.memberId == "m2").paidAmount == 1000000
+    assert same_g2 is plan_g2
+    assert cache.stats()['size'] == 2
+
+def test_group_without_transactions_is_cached(transactions, make_group):
+    """Test case: A group with no transactions yet hits the cache on the second lookup, until it gets a payment."""
+    # Arrange
+    cache = FinanceCache()
+    group = make_group("g3")
+    ledger = LedgerIndex(transactions)
+
+    # Act
+    plan = cache.get_contribution_plan(group, 2, 0, None, ledger)
+    again = cache.get_contribution_plan(group, 2, 0, None, ledger)
+    ledger.add(pay("g3", "m1", 500000))
+    after_payment = cache.get_contribution_plan(group, 2, 0, None, ledger)
+
+    # Assert
+    assert again is plan
+    assert after_payment is not plan
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 2
+
+def test_group_parameters_are_part_of_the_key(transactions, make_group):
+    """Test case: Editing the share value or current period misses the cache."""
+    cache = FinanceCache()
+    group = make_group("g1")
+    ledger = LedgerIndex(transactions)
+    first = cache.get_contribution_plan(group, 2, 0, None, ledger)
+
+    group.amountPerShare = 2000000
+
+    assert cache.get_contribution_plan(group, 2, 0, None, ledger) is not first
+
+def test_lru_eviction(transactions, make_group):
+    """Test case: The least recently used entry is evicted beyond maxsize."""
+    cache = FinanceCache(maxsize=2)
+    group = make_group("g1")
+    ledger = LedgerIndex(transactions)
+    cache.calculate_payout(group, 2, 0, "m2", ledger)
+    cache.calculate_payout(group, 2, 10000, "m2", ledger)
+    cache.calculate_payout(group, 2, 0, "m2", ledger) # Refresh bid 0
+
+    cache.calculate_payout(group, 2, 20000, "m2", ledger) # Evicts bid 10000
+    cache.calculate_payout(group, 2, 0, "m2", ledger)
+
+    assert cache.stats() == {'hits': 2, 'misses': 3, 'size': 2, 'maxsize': 2, 'hit_rate': 0.4}
+
+def test_global_instance():
+    assert get_finance_cache() is get_finance_cache()
@@ -1,3 +1,4 @@
+import datetime
 import pytest
 from data_models import HuiGroup, Transaction, Member, HuiType, HuiStatus, MemberStatus, BiddingRule
 from services.finance_service import FinanceService
@@ -163,19 +164,95 @@ def test_calculate_cashflow_projection(active_hui_group):
     Test case: Verify the cashflow projection for a simple scenario.
     """
     # Arrange
-    # One active group with 4 members, 1M per share
+    # One active group with 4 members, 1M per share, at period 3 of 4.
+    # Period 3 was due on 2024-03-01, so the remaining periods are rescheduled from the start date.
     groups = [active_hui_group]
+    start = datetime.date(2026, 1, 15)
 
     # Act
-    projection = FinanceService.calculate_cashflow_projection(groups)
+    projection = FinanceService.calculate_cashflow_projection(groups, start=start)
 
     # Assert
     # The function should return projections for the next 6 months
     assert len(projection) == 6
+    assert [p["name"] for p in projection] == ["T1/2026", "T2/2026", "T3/2026", "T4/2026", "T5/2026", "T6/2026"]
 
-    # For each month, the estimated in/out should be (total_slots - 1) * amountPerShare
-    # (4 - 1) * 1,000,000 = 3,000,000
+    # Period 3: 2 dead slots + 1 live slot pay 1M each (no bid) = 3,000,000,
+    # the winner receives the pot minus the 5% commission (50,000)
     first_month = projection[0]
     assert first_month["in"] == 3000000
-    assert first_month["out"] == 3000000
-    assert first_month["commission"] == 3000000 * 0.02 # 60,000
+    assert first_month["out"] == 2950000
+    assert first_month["commission"] == 50000
+
+    # Period 4 falls one month later; nothing remains after it
+    assert projection[1]["in"] == 3000000
+    assert all(p["in"] == p["out"] == p["commission"] == 0 for p in projection[2:])
+
+# --- Tests for LedgerIndex inputs ---
+
+def test_finance_service_accepts_ledger_index(active_hui_group, sample_transactions):
+    """Test case: Results from a LedgerIndex match results from the raw transaction list."""
+    # Arrange
+    from app.models.ledger_index import LedgerIndex
+    group = active_hui_group
+    ledger = LedgerIndex(sample_transactions)
+
+    # Act
+    payout_list = FinanceService.calculate_payout(group, 3, 50000, "m4", sample_transactions)
+    payout_index = FinanceService.calculate_payout(group, 3, 50000, "m4", ledger)
+    plan_list = FinanceService.get_contribution_plan(group, 2, 150000, "m2", sample_transactions)
+    plan_index = FinanceService.get_contribution_plan(group, 2, 150000, "m2", ledger)
+
+    # Assert
+    assert payout_index.__dict__ == payout_list.__dict__
+    assert payout_index.deductions == 350000
+    assert [p.__dict__ for p in plan_index] == [p.__dict__ for p in plan_list]
+    assert FinanceService.get_member_total_debt("m4", [group], ledger) == 350000
+
+def test_calculate_payout_commission_is_exact(active_hui_group):
+    """
+    Test case: Verify a fractional commission rate yields an exact integer payout.
+    """
+    # Arrange: 1,500,000 * 2.3% is 34499.99999999999 in float arithmetic
+    active_hui_group.amountPerShare = 1500000
+    active_hui_group.commissionRate = 2.3
+    active_hui_group.currentPeriod = 1 # No past periods, so no deductions
+
+    # Act
+    payout = FinanceService.calculate_payout(active_hui_group, 1, 100000, "m1", [])
+
+    # Assert
+    assert payout.commission == 34500
+    assert payout.netReceived == 3 * 1400000 - 34500
+    assert type(payout.netReceived) is int
+
+def test_compute_all_debts_matches_per_member(active_hui_group, sample_transactions):
+    """
+    Test case: The batch debt computation agrees with get_member_total_debt,
+    including multi-slot members and a second group.
+    """
+    # Arrange: m1 holds two slots in a second group where it already won period 1
+    second = HuiGroup(
+        id="g2", name="Second", type=HuiType.WEEKLY.value, amountPerShare=500000,
+        commissionRate=0, totalMembers=3, startDate="2024-01-01", status=HuiStatus.ACTIVE.value,
+        members=["m1", "m1", "m2"], currentPeriod=3
+    )
+    transactions = sample_transactions + [
+        Transaction(id="x1", huiGroupId="g2", memberId="m1", type='COLLECT', amount=0, bidAmount=20000, period=1, date=""),
+        Transaction(id="x2", huiGroupId="g2", memberId="m2", type='CONTRIBUTE', amount=480000, period=1, date=""),
+        Transaction(id="x3", huiGroupId="g2", memberId="m1", type='CONTRIBUTE', amount=300000, period=2, date=""),
+    ]
+    groups = [active_hui_group, second]
+
+    # Act
+    debts = FinanceService.compute_all_debts(groups, transactions)
+
+    # Assert
+    for member_id in ["m1", "m2", "m3", "m4"]:
+        assert debts.member_total(member_id) == FinanceService.get_member_total_debt(member_id, groups, transactions)
+        for group in groups:
+            if member_id in group.members:
+                assert debts.get(member_id, group.id) == FinanceService.get_member_total_debt(member_id, [group], transactions)
+    assert debts.get("m4", "g1") == 350000
+    assert debts.byMemberGroup["m2"] == {"g1": 0, "g2": 500000}
+    assert debts.member_total("unknown") == 0
@@ -0,0 +1,112 @@
+import pytest
+from openpyxl import Workbook
+from app.core.event_bus import get_event_bus, EventType
+from app.models.enums import MemberStatus
+from app.models.member import Member
+from app.models.member_registry import MemberRegistry
+from app.services.member_importer import MemberImporter, iter_chunks
+from app.services.members_service import MembersService
+
+# --- Arrange: Reusable Test Data ---
+
+HEADER = ["Họ tên", "Số điện thoại", "Địa chỉ", "Zalo", "Ghi chú", "Trạng thái"]
+
+@pytest.fixture
+def members():
+    return [Member(id="m1", name="An", phone="0909123456", address="", joinDate="")]
+
+@pytest.fixture
+def service(members):
+    members_service = MembersService(members, [], [])
+    yield members_service
+    members_service.close()
+
+def write_xlsx(path, rows):
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    return str(path)
+
+def write_csv(path, text):
+    path.write_text(text, encoding='utf-8-sig')
+    return str(path)
+
+# --- Tests for MemberImporter ---
+
+def test_read_xlsx_validates_and_deduplicates(tmp_path, members):
+    """Test case: Rows are checked for required fields, known phones, in-file duplicates and status."""
+    # Arrange
+    path = write_xlsx(tmp_path / "members.xlsx", [
+        HEADER,
+        ["Bình", 912345678, "Quận 1", None, None, "uy tin"], # Numeric phone lost its leading 0
+        ["Chi", "0909 123 456", "", "", "", ""], # Already a member
+        ["Dũng", "0912-345-678", "", "", "", ""], # Duplicate of row 2
+        [None, None, None, None, None, None], # Blank rows are ignored
+        ["", "0977000111", "", "", "", ""], # No name
+        ["Em", "0977000222", "", "", "", "VIP"],
+    ])
+
+    # Act
+    result = MemberImporter(MemberRegistry(members), chunk_size=2).read(path)
+
+    # Assert
+    assert result.total == 5
+    assert result.rows == [{'name': "Bình", 'phone': "0912345678", 'address': "Quận 1", 'zalo': "",
+                            'note': "", 'status': MemberStatus.TRUSTED.value}]
+    assert [(s.row, s.reason.split()[0]) for s in result.skipped] == \
+        [(3, "Số"), (4, "Số"), (6, "Thiếu"), (7, "Trạng")]
+
+def test_read_csv_with_semicolons_and_english_headers(tmp_path):
+    """Test case: CSV delimiters are detected and headers may be in English or without accents."""
+    path = write_csv(tmp_path / "members.csv", "name;phone;dia chi\nAn;0909000111;Q1\nBình;0909000222;Q2\n")
+    progress = []
+
+    result = MemberImporter(MemberRegistry([])).read(path, progress=progress.append)
+
+    assert [(r['name'], r['address'], r['status']) for r in result.rows] == \
+        [("An", "Q1", MemberStatus.NORMAL.value), ("Bình", "Q2", MemberStatus.NORMAL.value)]
+    assert progress == [2]
+
+def test_missing_required_column(tmp_path):
+    path = write_csv(tmp_path / "members.csv", "Tên,Địa chỉ\nAn,Q1\n")
+
+    with pytest.raises(ValueError, match="phone"):
+        MemberImporter(MemberRegistry([])).read(path)
+
+def test_iter_chunks():
+    assert [len(c) for c in iter_chunks(range(5), 2)] == [2, 2, 1]
+
+# --- Tests for MembersService.bulk_create ---
+
+def test_bulk_create_publishes_one_event(service, members):
+    """Test case: Importing many rows adds them to the list, registry and search index with a single event."""
+    # Arrange
+    rows = [{'name': f"Thành viên {i}", 'phone': f"0911{i:06d}", 'status': MemberStatus.NORMAL.value}
+            for i in range(50)]
+    events = []
+    get_event_bus().subscribe(EventType.MEMBERS_IMPORTED, events.append)
+    created_events = []
+    get_event_bus().subscribe(EventType.MEMBER_CREATED, created_events.append)
+
+    # Act
+    created = service.bulk_create(rows)
+
+    # Assert
+    get_event_bus().unsubscribe(EventType.MEMBERS_IMPORTED, events.append)
+    get_event_bus().unsubscribe(EventType.MEMBER_CREATED, created_events.append)
+    assert len(members) == 51
+    assert len(events) == 1 and events[0].data['members'] == created
+    assert created_events == []
+    assert service.registry.by_phone("0911000042") is created[42]
+    assert service.search("thanh vien 42") == [created[42]]
+
+def test_bulk_create_is_all_or_nothing(service, members):
+    """Test case: A batch with a taken phone is rejected before any member is added."""
+    rows = [{'name': "Bình", 'phone': "0977000111"}, {'name': "Chi", 'phone': "+84 909 123 456"}]
+
+    with pytest.raises(ValueError, match="đã tồn tại"):
+        service.bulk_create(rows)
+
+    assert len(members) == 1
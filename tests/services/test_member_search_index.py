@@ -0,0 +1,68 @@
+import pytest
+from app.core.event_bus import get_event_bus, Event, EventType
+from app.models.member import Member
+from app.services.member_search_index import MemberSearchIndex, normalize
+
+# --- Arrange: Reusable Test Data ---
+
+@pytest.fixture
+def members():
+    return [
+        Member(id="m1", name="Nguyễn Văn An", phone="0909 123 456", address="Quận 1", joinDate="", zalo="0909123456"),
+        Member(id="m2", name="Đỗ Thị Hằng", phone="0912345678", address="Thủ Đức", joinDate=""),
+        Member(id="m3", name="Nguyên Bảo", phone="0988777666", address="", joinDate="", zalo="baonguyen"),
+    ]
+
+@pytest.fixture
+def index(members):
+    search_index = MemberSearchIndex(members)
+    yield search_index
+    search_index.close()
+
+def ids(results):
+    return [m.id for m in results]
+
+# --- Tests for MemberSearchIndex ---
+
+def test_normalize_strips_vietnamese_accents():
+    assert normalize("Đỗ Thị Hằng") == "do thi hang"
+    assert normalize("NGUYỄN") == "nguyen"
+
+def test_accent_insensitive_prefix_search(index):
+    """Test case: Unaccented queries match accented names by word prefix, every word must match."""
+    assert ids(index.search("nguyen")) == ["m1", "m3"]
+    assert ids(index.search("Nguy")) == ["m1", "m3"]
+    assert ids(index.search("nguyen an")) == ["m1"]
+    assert ids(index.search("hang do")) == ["m2"]
+    assert ids(index.search("thu duc")) == ["m2"]
+    assert index.search("nguyen hang") == []
+
+def test_phone_fragments_match_anywhere(index):
+    """Test case: Phone and zalo fragments of 3+ digits match inside the number, separators are ignored."""
+    assert ids(index.search("3456")) == ["m1", "m2"]
+    assert ids(index.search("777")) == ["m3"]
+    assert ids(index.search("0909 123 456")) == ["m1"]
+    assert ids(index.search("aonguy")) == ["m3"] # Zalo fragment
+
+def test_blank_query_returns_everyone(index, members):
+    assert index.search("  ") == members
+
+def test_index_follows_member_events(index, members):
+    """Test case: MEMBER_CREATED/UPDATED/DELETED keep the index current without a rebuild."""
+    # Arrange
+    bus = get_event_bus()
+    new_member = Member(id="m4", name="Trần Đức", phone="0901000000", address="", joinDate="")
+
+    # Act & Assert
+    bus.publish(Event(type=EventType.MEMBER_CREATED, data=new_member))
+    assert ids(index.search("duc")) == ["m2", "m4"]
+
+    new_member.name = "Lê Minh"
+    bus.publish(Event(type=EventType.MEMBER_UPDATED, data={'member': new_member, 'old_data': {}}))
+    assert ids(index.search("duc")) == ["m2"]
+    assert ids(index.search("minh")) == ["m4"]
+
+    bus.publish(Event(type=EventType.MEMBER_DELETED, data=members[1]))
+    assert index.search("duc") == []
+    assert index.search("hang") == []
+    assert len(index) == 3
@@ -0,0 +1,83 @@
+import pytest
+from data_models import AppState, HuiGroup, Transaction, HuiType, HuiStatus
+from app.models.archive_summary import ArchiveSummary
+from services.finance_service import FinanceService
+from services.portfolio_report import PortfolioReportService
+
+# --- Arrange: Reusable Test Data ---
+
+@pytest.fixture
+def state():
+    """Three groups of different sizes; m1 is in two of them."""
+    groups = [
+        HuiGroup(id=f"g{i}", name=f"Hui {i}", type=HuiType.MONTHLY.value, amountPerShare=1000000,
+                 commissionRate=2, totalMembers=len(members), startDate="", status=HuiStatus.ACTIVE.value,
+                 members=members, currentPeriod=current)
+        for i, (members, current) in enumerate([(["m1", "m2", "m3"], 2), (["m1", "m4"], 2), (["m5", "m6", "m7", "m8"], 1)])
+    ]
+    transactions = [
+        Transaction(id="t1", huiGroupId="g0", memberId="m2", type='COLLECT', amount=2000000, netAmount=1960000, bidAmount=0, period=1, date=""),
+        Transaction(id="t2", huiGroupId="g0", memberId="m1", type='CONTRIBUTE', amount=1000000, period=1, date=""),
+        Transaction(id="t3", huiGroupId="g1", memberId="m4", type='COLLECT', amount=900000, bidAmount=100000, period=1, date=""),
+        Transaction(id="t4", huiGroupId="g1", memberId="m1", type='CONTRIBUTE', amount=400000, period=1, date=""),
+    ]
+    return AppState(members=[], groups=groups, transactions=transactions)
+
+# --- Tests for PortfolioReportService ---
+
+def test_report_matches_finance_service(state):
+    """Test case: Positions and totals agree with FinanceService on the full history."""
+    # Act
+    report = PortfolioReportService.run(state)
+
+    # Assert
+    assert [p.groupId for p in report.groups] == ["g0", "g1", "g2"]
+    for member_id in ("m1", "m3", "m4"):
+        assert report.debtByMember.get(member_id, 0) == FinanceService.get_member_total_debt(member_id, state.groups, state.transactions)
+    assert report.debtByMember["m1"] == 500000 # g1: owes 900k in period 1, paid 400k
+    assert report.totalCommission == 2 * 20000
+    assert report.totalCollected == 1960000 + 900000
+    assert report.totalContributed == 1400000
+    assert report.totalBadDebt == sum(p.badDebt for p in report.groups)
+
+def test_archived_groups_count_in_totals(state):
+    """Test case: Archived groups add their commission, contributions and left-over debt to the totals, not to the positions."""
+    # Arrange
+    live = PortfolioReportService.run(state)
+    state.archives.append(ArchiveSummary(
+        id="old", name="Old", type=HuiType.MONTHLY.value, amountPerShare=1000000, archivedAt="", segmentFile="",
+        totalContributed=3000000, totalCollected=2900000, totalCommission=60000, memberDebts={"m1": 250000}))
+
+    # Act
+    report = PortfolioReportService.run(state)
+
+    # Assert
+    assert report.groups == live.groups
+    assert report.totalCommission == live.totalCommission + 60000
+    assert report.totalContributed == live.totalContributed + 3000000
+    assert report.totalCollected == live.totalCollected + 2900000
+    assert report.totalBadDebt == live.totalBadDebt + 250000
+    assert report.debtByMember["m1"] == live.debtByMember["m1"] + 250000
+
+def test_process_pool_gives_same_report_and_progress(state):
+    """Test case: Running in worker processes gives the same result and reports progress up to all groups."""
+    # Arrange
+    calls = []
+
+    # Act
+    serial = PortfolioReportService.run(state)
+    pooled = PortfolioReportService.run(state, workers=2, progress=lambda done, total: calls.append((done, total)))
+
+    # Assert
+    assert pooled == serial
+    assert calls[-1] == (3, 3)
+    assert [done for done, _ in calls] == sorted(done for done, _ in calls)
+
+def test_partition_balances_transaction_counts(state):
+    """Test case: Chunks never exceed the requested count and every group lands in exactly one chunk."""
+    slices = PortfolioReportService.slices(state.groups, state.transactions)
+
+    chunks = PortfolioReportService.partition(slices, 2)
+
+    assert len(chunks) == 2
+    assert sorted(g.id for chunk in chunks for g, _ in chunk) == ["g0", "g1", "g2"]
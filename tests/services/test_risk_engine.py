@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from data_models import AppState, Member, Transaction, MemberStatus
+from services.risk_engine import RiskEngine, PaymentBehavior, GroupScenarioInput, simulate_group
+
+# --- Arrange: Reusable Test Data ---
+
+def make_member(member_id, score=100, status=MemberStatus.NORMAL.value):
+    return Member(id=member_id, name=member_id, phone="", address="", joinDate="",
+                  reputationScore=score, status=status)
+
+def make_input(full, partial=0.0, bid=0):
+    """Three single-slot members, nobody has collected yet."""
+    return GroupScenarioInput(
+        groupId="g1", name="g1", amountPerShare=1000000, bid=bid, commission=20000, periods=3,
+        slots=np.array([1, 1, 1]), deadSlots=np.array([0, 0, 0]),
+        full=np.full(3, full), partial=np.full(3, partial)
+    )
+
+@pytest.fixture
+def state(make_group):
+    group = make_group("g1", ["m1", "m2", "m3", "m5"], commissionRate=2)
+    return AppState(
+        members=[make_member("m1"), make_member("m2"), make_member("m3", 90, MemberStatus.TRUSTED.value),
+                 make_member("m5", 45, MemberStatus.WATCHLIST.value)],
+        groups=[group],
+        transactions=[Transaction(id="t1", huiGroupId="g1", memberId="m1", type='COLLECT', amount=0, bidAmount=100000, period=1, date="")]
+    )
+
+# --- Tests for RiskEngine ---
+
+def test_payment_behavior_by_status():
+    """Test case: Watchlist/blacklist members and low scores miss payments more often."""
+    trusted = PaymentBehavior.for_member(make_member("a", 95, MemberStatus.TRUSTED.value))
+    normal = PaymentBehavior.for_member(make_member("b", 95))
+    watch = PaymentBehavior.for_member(make_member("c", 45, MemberStatus.WATCHLIST.value))
+    black = PaymentBehavior.for_member(make_member("d", 45, MemberStatus.BLACKLIST.value))
+    assert trusted.full > normal.full > watch.full > black.full
+    assert 0 < black.full + black.partial < 1
+
+def test_full_payers_have_no_shortfall():
+    """Test case: Members that always pay in full never leave a shortfall."""
+    risk = simulate_group(make_input(full=1.0), 1000, np.random.SeedSequence(1))
+    assert risk.expectedShortfall == 0
+    assert risk.probShortfall == 0
+
+def test_non_payers_shortfall_is_every_contribution():
+    """Test case: If nobody pays, the shortfall is the sum of all contributions (6V - 3B)."""
+    risk = simulate_group(make_input(full=0.0, bid=100000), 500, np.random.SeedSequence(1))
+    assert risk.p50 == pytest.approx(6 * 1000000 - 3 * 100000)
+    assert risk.probExceedsCommission == 1
+
+def test_run_reports_groups_and_portfolio(state):
+    """Test case: The portfolio run uses the group's remaining periods and is reproducible by seed."""
+    # Act
+    report = RiskEngine.run(state, scenarios=3000, seed=7)
+    again = RiskEngine.run(state, scenarios=3000, seed=7)
+
+    # Assert
+    group = report.groups[0]
+    assert group.periods == 3 # Periods 2..4, m1 already collected
+    assert group.existingDebt == 3 * 900000 # Nobody paid period 1
+    assert 0 < group.probShortfall <= 1
+    assert group.p50 <= group.p95 <= group.p99
+    assert np.array_equal(report.shortfalls, group.shortfalls)
+    assert np.array_equal(report.shortfalls, again.shortfalls)
+
+def test_process_pool_matches_serial_run(state, make_group):
+    """Test case: Running groups in worker processes gives the same result as in-process."""
+    # Arrange: a second group so the pool is used
+    second = make_group("g2", ["m2", "m5", "m5"], commissionRate=2, currentPeriod=1)
+    state.groups.append(second)
+
+    # Act
+    serial = RiskEngine.run(state, scenarios=2000, seed=3)
+    pooled = RiskEngine.run(state, scenarios=2000, seed=3, workers=2)
+
+    # Assert
+    assert np.array_equal(serial.shortfalls, pooled.shortfalls)
+    assert [g.groupId for g in pooled.groups] == ["g1", "g2"]
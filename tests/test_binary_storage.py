@@ -0,0 +1,86 @@
+import os
+import pickle
+import struct
+import pytest
+from data_models import AuditLog
+from storage import create_default_data
+from binary_storage import MAGIC, VERSION, write_snapshot, read_snapshot
+from app.models.lazy_section import LazySection
+
+@pytest.fixture
+def state():
+    app_state = create_default_data()
+    app_state.auditLogs.append(AuditLog(
+        id="LOG-1", timestamp="2024-01-01", action='PAYMENT_RECORD', userId="m1", scenario="s",
+        stateBefore={"currentPeriod": 1}, inputParameters={}, resultCalculated={"remainingDebt": 0}
+    ))
+    return app_state
+
+def test_snapshot_round_trip(state, tmp_path):
+    """
+    Test case: Verify a binary snapshot loads back to the same state.
+    """
+    # Arrange
+    path = str(tmp_path / "data.snapshot")
+
+    # Act
+    write_snapshot(state, path)
+    loaded = read_snapshot(path)
+
+    # Assert
+    assert loaded.to_dict() == state.to_dict()
+
+def test_history_sections_are_decoded_lazily(state, tmp_path):
+    """
+    Test case: Verify transactions and audit logs stay encoded until accessed, while len() is available.
+    """
+    # Arrange
+    path = str(tmp_path / "data.snapshot")
+    write_snapshot(state, path)
+
+    # Act
+    loaded = read_snapshot(path)
+
+    # Assert
+    assert isinstance(loaded.auditLogs, LazySection)
+    assert not loaded.auditLogs.loaded
+    assert len(loaded.auditLogs) == 1
+    assert not loaded.auditLogs.loaded
+    assert loaded.auditLogs[0].id == "LOG-1"
+    assert loaded.auditLogs.loaded
+
+def test_untouched_sections_are_rewritten_without_decoding(state, tmp_path, mocker):
+    """
+    Test case: Verify saving a snapshot copies undecoded sections as raw bytes.
+    """
+    # Arrange
+    path = str(tmp_path / "data.snapshot")
+    write_snapshot(state, path)
+    loaded = read_snapshot(path)
+    loaded.members[0].name = "Renamed"
+    decode_spy = mocker.spy(loaded.auditLogs, '_decoder')
+
+    # Act
+    write_snapshot(loaded.snapshot(), path)
+    reloaded = read_snapshot(path)
+
+    # Assert
+    assert decode_spy.call_count == 0
+    assert reloaded.members[0].name == "Renamed"
+    assert reloaded.to_dict()['auditLogs'] == state.to_dict()['auditLogs']
+
+def test_snapshot_referencing_globals_is_rejected(tmp_path):
+    """
+    Test case: Verify a crafted snapshot cannot make the loader import or call anything.
+    """
+    # Arrange
+    class Payload:
+        def __reduce__(self):
+            return (os.system, ("true",))
+    header = pickle.dumps({'members': Payload()}, protocol=5)
+    path = tmp_path / "data.snapshot"
+    path.write_bytes(MAGIC + bytes([VERSION]) + struct.pack('<I', len(header)) + header)
+
+    # Act / Assert
+    with pytest.raises(pickle.UnpicklingError, match="forbidden global"):
+        read_snapshot(str(path))
@@ -1,5 +1,5 @@
 import pytest
-from data_models import Member, HuiGroup, MemberStatus, HuiType, HuiStatus, BiddingRule
+from data_models import Member, HuiGroup, Transaction, AuditLog, MemberStatus, HuiType, HuiStatus, BiddingRule
 
 # Arrange: Create test data for a member
 MEMBER_DATA = {
@@ -126,3 +126,54 @@ def test_hui_group_conversion_to_dict():
 
     # Assert
     assert hui_group_dict == HUI_GROUP_DATA
+
+# Arrange: Create test data for a Transaction
+TRANSACTION_DATA = {
+    "id": "T001",
+    "huiGroupId": "H001",
+    "memberId": "M001",
+    "type": "CONTRIBUTE",
+    "amount": 900000,
+    "date": "2024-06-01",
+    "period": 2,
+    "bidAmount": 0,
+    "netAmount": 0,
+    "note": None,
+}
+
+def test_transaction_dict_round_trip():
+    """
+    Test case: Verify that a Transaction converts to a fresh dict and back.
+    """
+    # Arrange
+    transaction = Transaction.from_dict(TRANSACTION_DATA)
+
+    # Act
+    transaction_dict = transaction.to_dict()
+    transaction_dict["amount"] = 0
+
+    # Assert
+    assert not hasattr(transaction, "__dict__")
+    assert transaction.amount == 900000
+    assert Transaction.from_dict(TRANSACTION_DATA.copy()) == transaction
+    assert transaction.to_dict() == TRANSACTION_DATA
+
+def test_audit_log_dict_round_trip():
+    """
+    Test case: Verify that an AuditLog converts to a fresh dict and back.
+    """
+    # Arrange
+    log_data = {
+        "id": "L001", "timestamp": "2024-06-01T10:00:00", "action": "COLLECT", "userId": "admin",
+        "scenario": "Khui hụi", "stateBefore": {}, "inputParameters": {"bid": 100000},
+        "resultCalculated": {"net": 1850000}, "ai_context": None, "aiAnalysis": None, "huiGroupId": "H001",
+    }
+    log = AuditLog.from_dict(log_data)
+
+    # Act
+    log_dict = log.to_dict()
+
+    # Assert
+    assert not hasattr(log, "__dict__")
+    assert log_dict == log_data
+    assert log_dict is not log.to_dict()
@@ -0,0 +1,119 @@
+import pytest
+import time
+from PyQt6.QtCore import QCoreApplication
+from app.core.event_bus import EventBus, Event, EventType
+
+@pytest.fixture(scope="session")
+def qt_app():
+    """Qt event loop needed to fire the dispatch timer (kept alive for the session)."""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+@pytest.fixture
+def bus():
+    """A private bus, so tests do not touch the global subscribers."""
+    bus = EventBus()
+    yield bus
+    bus.clear_all()
+
+def wait_for(condition, app, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+def test_default_dispatch_is_synchronous(bus):
+    """Test case: Without queued mode subscribers run inside publish()."""
+    received = []
+    bus.subscribe(EventType.PAYMENT_MADE, received.append)
+
+    bus.publish(Event(type=EventType.PAYMENT_MADE, data=1))
+
+    assert [e.data for e in received] == [1]
+
+def test_queued_dispatch_runs_from_event_loop(qt_app, bus):
+    """Test case: In queued mode publish() returns before handlers run; the timer drains the queue in order."""
+    # Arrange
+    received = []
+    bus.queued = True
+    bus.subscribe(EventType.PAYMENT_MADE, received.append)
+
+    # Act
+    bus.publish(Event(type=EventType.PAYMENT_MADE, data=1))
+    bus.publish(Event(type=EventType.PAYMENT_MADE, data=2))
+
+    # Assert
+    assert received == []
+    assert bus.pending_count() == 2
+    assert wait_for(lambda: len(received) == 2, qt_app)
+    assert [e.data for e in received] == [1, 2]
+
+def test_per_call_queued_override(bus):
+    """Test case: publish(queued=True) defers a single event on a synchronous bus."""
+    received = []
+    bus.subscribe(EventType.PAYMENT_MADE, received.append)
+
+    bus.publish(Event(type=EventType.PAYMENT_MADE, data=1), queued=True)
+    assert received == []
+
+    assert bus.process_pending() == 1
+    assert [e.data for e in received] == [1]
+
+def test_search_burst_is_coalesced_to_latest(qt_app, bus):
+    """Test case: A burst of MEMBER_SEARCH events within the window dispatches only the last one."""
+    # Arrange
+    received = []
+    bus.set_coalescing(EventType.MEMBER_SEARCH, 50)
+    bus.subscribe(EventType.MEMBER_SEARCH, received.append)
+
+    # Act
+    for query in ("A", "An", "Anh"):
+        bus.publish(Event(type=EventType.MEMBER_SEARCH, data={'query': query}))
+
+    # Assert
+    assert received == []
+    assert bus.process_pending(force=False) == 0 # Window not over yet
+    assert wait_for(lambda: received, qt_app)
+    assert [e.data['query'] for e in received] == ["Anh"]
+
+def test_search_is_dispatched_inline_by_default(bus):
+    """Test case: Without opting in to coalescing, MEMBER_SEARCH is delivered at once (no Qt loop needed)."""
+    received = []
+    bus.subscribe(EventType.MEMBER_SEARCH, received.append)
+
+    bus.publish(Event(type=EventType.MEMBER_SEARCH, data={'query': "A"}))
+
+    assert [e.data['query'] for e in received] == ["A"]
+
+def test_coalescing_can_be_disabled(bus):
+    received = []
+    bus.set_coalescing(EventType.MEMBER_SEARCH, None)
+    bus.subscribe(EventType.MEMBER_SEARCH, received.append)
+
+    bus.publish(Event(type=EventType.MEMBER_SEARCH, data={'query': "A"}))
+
+    assert len(received) == 1
+
+def test_handler_stats(bus):
+    """Test case: Every handler call is timed; the slowest handler comes first and errors are counted."""
+    # Arrange
+    def slow_handler(event):
+        time.sleep(0.02)
+
+    def failing_handler(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(EventType.PAYMENT_MADE, slow_handler)
+    bus.subscribe(EventType.PAYMENT_MADE, failing_handler)
+
+    # Act
+    bus.publish(Event(type=EventType.PAYMENT_MADE))
+    bus.publish(Event(type=EventType.PAYMENT_MADE))
+
+    # Assert
+    stats = bus.get_handler_stats()
+    assert stats[0].handler.endswith("slow_handler")
+    assert stats[0].calls == 2
+    assert stats[0].max_ms >= 20
+    assert stats[0].avg_ms == pytest.approx(stats[0].total_ms / 2)
+    assert stats[1].errors == 2
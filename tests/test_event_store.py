@@ -0,0 +1,210 @@
+import pytest
+import json
+from data_models import Transaction, AuditLog
+from storage import create_default_data
+from app.core.event_bus import get_event_bus, Event, EventType
+from app.core.event_store import EventStore, INITIALIZED
+from app.models.archive_summary import ArchiveSummary
+from app.models.member import Member
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "data.events"), str(tmp_path / "data.events.snapshot")
+
+@pytest.fixture
+def store(paths):
+    store = EventStore(*paths)
+    store.subscribe()
+    yield store
+    store.close()
+
+def pay(state, i):
+    """Record a payment the way HuiListTab does: change the state, then publish."""
+    tx = Transaction(id=f"pay-{i}", huiGroupId="g1", memberId="m4", type='CONTRIBUTE',
+                     amount=100000, date="", period=3)
+    log = AuditLog(id=f"log-{i}", timestamp="", action="PAYMENT", userId="admin", scenario="", stateBefore={},
+                   inputParameters={}, resultCalculated={}, huiGroupId="g1")
+    state.add_transaction(tx)
+    state.auditLogs.append(log)
+    get_event_bus().publish(Event(type=EventType.PAYMENT_MADE,
+                                  data={'group': state.groups[0], 'transaction': tx, 'auditLog': log}))
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_save_appends_only_new_events(store, paths):
+    """
+    Test case: Verify the log starts with the initial state and each save appends only the events since the last one.
+    """
+    # Arrange
+    events_path, _ = paths
+    state = store.load(create_default_data)
+
+    # Act
+    pay(state, 1)
+    pay(state, 2)
+    written = store.write()
+
+    # Assert
+    assert written == 2
+    records = read_lines(events_path)
+    assert records[0]['type'] == INITIALIZED
+    assert [r['type'] for r in records[1:]] == [EventType.PAYMENT_MADE.value] * 2
+    assert store.write() == 0
+
+def test_load_replays_events(store, paths):
+    """
+    Test case: Verify a new store rebuilds the same state from the log.
+    """
+    # Arrange
+    state = store.load(create_default_data)
+    pay(state, 1)
+    member = state.members[0]
+    member.note = "edited"
+    get_event_bus().publish(Event(type=EventType.MEMBER_UPDATED, data={'member': member, 'old_data': {}}))
+    removed = state.members.pop()
+    get_event_bus().publish(Event(type=EventType.MEMBER_DELETED, data=removed))
+    store.write()
+
+    # Act
+    reloaded = EventStore(*paths).load(create_default_data)
+
+    # Assert
+    assert reloaded.to_dict() == state.to_dict()
+
+def test_snapshot_every_n_events(store, paths):
+    """
+    Test case: Verify a snapshot is written after N events and loading only replays the events after it.
+    """
+    # Arrange
+    events_path, snapshot_path = paths
+    store.snapshot_every = 2
+    state = store.load(create_default_data)
+
+    # Act
+    for i in range(3):
+        pay(state, i)
+    store.write()
+
+    # Assert
+    with open(snapshot_path, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    assert snapshot['seq'] == 2
+    assert len(snapshot['state']['transactions']) == len(state.transactions) - 1
+    reloaded_store = EventStore(*paths)
+    assert reloaded_store.load(create_default_data).to_dict() == state.to_dict()
+    assert reloaded_store.seq == 3
+
+def test_archive_event_moves_group_to_summary(store, paths):
+    """
+    Test case: Verify replaying CYCLE_ARCHIVED drops the group with its history and keeps the summary.
+    """
+    # Arrange
+    state = store.load(create_default_data)
+    group = state.groups[0]
+    summary = ArchiveSummary(id=group.id, name=group.name, type=group.type, amountPerShare=group.amountPerShare,
+                             archivedAt="", segmentFile="archive/g1.json")
+    state.groups.remove(group)
+    state.transactions[:] = [t for t in state.transactions if t.huiGroupId != group.id]
+    state.archives.append(summary)
+    get_event_bus().publish(Event(type=EventType.CYCLE_ARCHIVED, data={'group': group, 'summary': summary}))
+    store.write()
+
+    # Act
+    reloaded = EventStore(*paths).load(create_default_data)
+
+    # Assert
+    assert [g.id for g in reloaded.groups] == [g.id for g in state.groups]
+    assert all(t.huiGroupId != group.id for t in reloaded.transactions)
+    assert [a.id for a in reloaded.archives] == [group.id]
+
+def test_full_history_and_torn_write(store, paths):
+    """
+    Test case: Verify the log alone replays any past state and a torn last line is ignored.
+    """
+    # Arrange
+    events_path, _ = paths
+    state = store.load(create_default_data)
+    initial = len(state.transactions)
+    for i in range(3):
+        pay(state, i)
+    store.write()
+    with open(events_path, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 4, "type": "payment.made", "data": {"tr')
+
+    # Act
+    records = EventStore(*paths).read_records()
+
+    # Assert
+    assert len(records) == 4
+    assert len(EventStore.replay(records, until_seq=1).transactions) == initial + 1
+    assert EventStore.replay(records).to_dict() == state.to_dict()
+
+def test_members_imported_is_one_record(store, paths):
+    """
+    Test case: Verify a bulk import is logged as a single record and replays every member.
+    """
+    # Arrange
+    events_path, _ = paths
+    state = store.load(create_default_data)
+    imported = [Member(id=f"imp-{i}", name=f"Imported {i}", phone=f"0911{i:06d}", address="", joinDate="")
+                for i in range(3)]
+    state.members.extend(imported)
+    get_event_bus().publish(Event(type=EventType.MEMBERS_IMPORTED, data={'members': imported}))
+
+    # Act
+    written = store.write()
+    reloaded = EventStore(*paths).load(create_default_data)
+
+    # Assert
+    assert written == 1
+    assert read_lines(events_path)[-1]['type'] == EventType.MEMBERS_IMPORTED.value
+    assert reloaded.to_dict() == state.to_dict()
+
+def test_same_id_payments_both_replay(store, paths):
+    """
+    Test case: Verify two payments sharing a transaction id (e.g. made in the same second) both survive a reload.
+    """
+    # Arrange
+    state = store.load(create_default_data)
+    initial = len(state.transactions)
+    pay(state, 1)
+    pay(state, 1)
+    store.write()
+
+    # Act
+    reloaded = EventStore(*paths).load(create_default_data)
+
+    # Assert
+    assert len(reloaded.transactions) == initial + 2
+    assert reloaded.to_dict() == state.to_dict()
+
+def test_write_after_torn_tail_survives_reload(store, paths):
+    """
+    Test case: Verify loading cuts a torn last line, so events written afterwards are replayed on the next load.
+    """
+    # Arrange: two payments, then the last 10 bytes are lost
+    events_path, _ = paths
+    state = store.load(create_default_data)
+    pay(state, 1)
+    pay(state, 2)
+    store.write()
+    store.close()
+    with open(events_path, 'rb+') as f:
+        f.truncate(f.seek(0, 2) - 10)
+
+    # Act: a new session creates member c
+    session = EventStore(*paths)
+    session.subscribe()
+    state = session.load(create_default_data)
+    member = Member(id="c", name="C", phone="0911000000", address="", joinDate="")
+    state.members.append(member)
+    get_event_bus().publish(Event(type=EventType.MEMBER_CREATED, data=member))
+    session.write()
+    session.close()
+    reloaded = EventStore(*paths).load(create_default_data)
+
+    # Assert
+    assert "c" in [m.id for m in reloaded.members]
+    assert reloaded.to_dict() == state.to_dict()
@@ -0,0 +1,144 @@
+import pytest
+import json
+from data_models import Transaction, AuditLog
+from storage import create_default_data
+from journal_storage import Journal
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "data.json"), str(tmp_path / "data.journal")
+
+def new_payment(i):
+    return Transaction(id=f"pay-{i}", huiGroupId="g1", memberId="m4", type='CONTRIBUTE',
+                       amount=100000, date="", period=3)
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+def test_append_writes_only_changes(paths):
+    """
+    Test case: Verify a save appends one record per new transaction/member edit and leaves the snapshot alone.
+    """
+    # Arrange
+    snapshot_path, journal_path = paths
+    journal = Journal(snapshot_path, journal_path)
+    state = journal.load(create_default_data)
+
+    # Act
+    state.transactions.append(new_payment(1))
+    state.members[0].note = "edited"
+    written = journal.append(state)
+
+    # Assert
+    assert written == 2
+    assert [r['op'] for r in read_lines(journal_path)] == ['member', 'transaction']
+    assert journal.append(state) == 0
+
+def test_load_replays_journal_over_snapshot(paths):
+    """
+    Test case: Verify loading replays journal records written after the last snapshot.
+    """
+    # Arrange
+    snapshot_path, journal_path = paths
+    journal = Journal(snapshot_path, journal_path)
+    state = journal.load(create_default_data)
+    journal.checkpoint(state)
+    state.transactions.append(new_payment(1))
+    removed = state.members.pop()
+    journal.append(state)
+
+    # Act
+    reloaded = Journal(snapshot_path, journal_path).load(create_default_data)
+
+    # Assert
+    assert reloaded.to_dict() == state.to_dict()
+    assert removed.id not in [m.id for m in reloaded.members]
+
+def test_checkpoint_every_n_records(paths):
+    """
+    Test case: Verify the snapshot is rewritten and the journal emptied after N records.
+    """
+    # Arrange
+    snapshot_path, journal_path = paths
+    journal = Journal(snapshot_path, journal_path, checkpoint_every=3)
+    state = journal.load(create_default_data)
+
+    # Act
+    for i in range(3):
+        state.transactions.append(new_payment(i))
+        journal.append(state)
+
+    # Assert
+    assert read_lines(journal_path) == []
+    with open(snapshot_path, encoding='utf-8') as f:
+        snapshot = json.load(f)
+    assert snapshot['journalSeq'] == 3
+    assert len(snapshot['transactions']) == len(state.transactions)
+
+def test_replay_is_idempotent_and_tolerates_torn_write(paths):
+    """
+    Test case: Verify records already in the snapshot are skipped and a torn last line is ignored.
+    """
+    # Arrange: crash after the snapshot was replaced but before the journal was truncated
+    snapshot_path, journal_path = paths
+    journal = Journal(snapshot_path, journal_path)
+    state = journal.load(create_default_data)
+    state.transactions.append(new_payment(1))
+    journal.append(state)
+    with open(journal_path, encoding='utf-8') as f:
+        stale_journal = f.read()
+    journal.checkpoint(state)
+    with open(journal_path, 'w', encoding='utf-8') as f:
+        f.write(stale_journal + '{"op": "transaction", "seq": 2, "data": {"id"')
+
+    # Act
+    reloaded = Journal(snapshot_path, journal_path).load(create_default_data)
+
+    # Assert
+    assert len(reloaded.transactions) == len(state.transactions)
+
+def test_append_after_torn_write_survives_reload(paths):
+    """
+    Test case: Verify a torn tail is cut on load, so records appended afterwards are readable on the next load.
+    """
+    # Arrange: records a and b, then the last 10 bytes are lost
+    snapshot_path, journal_path = paths
+    journal = Journal(snapshot_path, journal_path)
+    state = journal.load(create_default_data)
+    initial = len(state.transactions)
+    for i in (1, 2):
+        state.transactions.append(new_payment(i))
+        journal.append(state)
+    with open(journal_path, 'rb+') as f:
+        f.truncate(f.seek(0, 2) - 10)
+
+    # Act
+    journal = Journal(snapshot_path, journal_path)
+    state = journal.load(create_default_data)
+    state.transactions.append(new_payment(3))
+    journal.append(state)
+    reloaded = Journal(snapshot_path, journal_path).load(create_default_data)
+
+    # Assert
+    assert [t.id for t in reloaded.transactions[initial:]] == ["pay-1", "pay-3"]
+
+def test_in_place_rewrite_triggers_checkpoint(paths):
+    """
+    Test case: Verify a history rewritten in place and refilled to its old length is checkpointed, not appended.
+    """
+    # Arrange
+    snapshot_path, journal_path = paths
+    journal = Journal(snapshot_path, journal_path)
+    state = journal.load(create_default_data)
+
+    # Act: drop the first row, append a new one, save a snapshot as SaveWorker does
+    state.transactions[:] = state.transactions[1:]
+    state.history_rewritten()
+    state.transactions.append(new_payment(1))
+    written = journal.append(state.snapshot())
+    reloaded = Journal(snapshot_path, journal_path).load(create_default_data)
+
+    # Assert
+    assert written == 0
+    assert [t.id for t in reloaded.transactions] == [t.id for t in state.transactions]
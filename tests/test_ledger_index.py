@@ -0,0 +1,103 @@
+import pytest
+from data_models import AppState, Transaction
+from app.models.ledger_index import LedgerIndex
+
+@pytest.fixture
+def transactions():
+    """Two periods of a 3-slot group where m1 holds two slots."""
+    return [
+        Transaction(id="t1", huiGroupId="g1", memberId="m1", type='COLLECT', amount=0, bidAmount=100000, period=1, date=""),
+        Transaction(id="t2", huiGroupId="g1", memberId="m2", type='CONTRIBUTE', amount=400000, period=1, date=""),
+        Transaction(id="t3", huiGroupId="g1", memberId="m2", type='CONTRIBUTE', amount=500000, period=1, date=""),
+        Transaction(id="t4", huiGroupId="g1", memberId="m1", type='COLLECT', amount=0, bidAmount=50000, period=2, date=""),
+        Transaction(id="t5", huiGroupId="g2", memberId="m2", type='COLLECT', amount=0, bidAmount=0, period=1, date=""),
+    ]
+
+def test_ledger_index_lookups(transactions):
+    """
+    Test case: Verify the pre-aggregated lookups of the ledger index.
+    """
+    # Act
+    ledger = LedgerIndex(transactions)
+
+    # Assert
+    assert len(ledger) == 5
+    assert ledger.paid("g1", 1, "m2") == 900000
+    assert ledger.paid("g1", 2, "m2") == 0
+    assert ledger.winner("g1", 2).id == "t4"
+    assert ledger.winner("g1", 3) is None
+    assert ledger.dead_slots("g1", 1) == 0
+    assert ledger.dead_slots("g1", 3) == 2
+    assert ledger.dead_slots("g1", 2, "m1") == 1
+    assert ledger.dead_slots("g1", 3, "m2") == 0
+    assert [t.id for t in ledger.find("g1", 1, "m2", 'CONTRIBUTE')] == ["t2", "t3"]
+    assert [t.id for t in ledger.group_transactions("g2")] == ["t5"]
+
+def test_ledger_index_sync_appends_and_rebuilds(transactions):
+    """
+    Test case: Verify sync() indexes appended rows and rebuilds after removals.
+    """
+    # Arrange
+    source = list(transactions[:2])
+    ledger = LedgerIndex().sync(source)
+
+    # Act: append
+    source.extend(transactions[2:])
+    ledger.sync(source)
+
+    # Assert
+    assert len(ledger) == 5
+    assert ledger.paid("g1", 1, "m2") == 900000
+
+    # Act: remove
+    del source[1]
+    ledger.sync(source)
+
+    # Assert
+    assert len(ledger) == 4
+    assert ledger.paid("g1", 1, "m2") == 500000
+
+def test_app_state_keeps_ledger_in_sync(transactions):
+    """
+    Test case: Verify AppState indexes transactions added through add_transaction or appended directly.
+    """
+    # Arrange
+    state = AppState(transactions=list(transactions[:1]))
+    assert state.ledger.winner("g1", 1).id == "t1"
+
+    # Act
+    state.add_transaction(transactions[1])
+    state.transactions.append(transactions[2])
+
+    # Assert
+    assert state.ledger.paid("g1", 1, "m2") == 900000
+
+def test_group_ledger_period_table(transactions):
+    """
+    Test case: Verify the per-group period table and its version counter.
+    """
+    # Arrange
+    state = AppState(transactions=list(transactions))
+    group_ledger = state.ledger.group("g1")
+    version = group_ledger.version
+
+    # Assert: period rows
+    entry = group_ledger.period(1)
+    assert entry.winner.id == "t1"
+    assert entry.bid == 100000
+    assert dict(entry.paid) == {"m2": 900000}
+    assert [e.period for e in group_ledger.periods(1, 5)] == [1, 2]
+    assert group_ledger.period(3) is None
+    assert state.ledger.group("unknown").transactions == []
+
+    # Act: a payment in another group leaves g1 untouched
+    state.add_transaction(Transaction(id="t6", huiGroupId="g2", memberId="m1", type='CONTRIBUTE', amount=1000, period=1, date=""))
+    assert state.ledger.group("g1").version == version
+
+    # Act: a payment in g1 updates its table in place
+    state.add_transaction(Transaction(id="t7", huiGroupId="g1", memberId="m1", type='CONTRIBUTE', amount=1000000, period=2, date=""))
+
+    # Assert
+    assert state.ledger.group("g1") is group_ledger
+    assert group_ledger.version == version + 1
+    assert group_ledger.paid(2, "m1") == 1000000
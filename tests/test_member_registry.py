@@ -0,0 +1,137 @@
+import pytest
+from data_models import AppState, Member
+from app.models.member_registry import MemberRegistry, normalize_phone
+from app.models.enums import MemberStatus
+from app.services.members_service import MembersService
+
+@pytest.fixture
+def members():
+    return [
+        Member(id="m1", name="An", phone="0909 123 456", address="", joinDate=""),
+        Member(id="m2", name="Bình", phone="0912345678", address="", joinDate=""),
+    ]
+
+def test_normalize_phone():
+    assert normalize_phone("+84 909-123-456") == "0909123456"
+    assert normalize_phone("0909.123.456") == "0909123456"
+    assert normalize_phone(None) == ""
+
+def test_registry_lookups(members):
+    """
+    Test case: Verify id and phone lookups, with phones compared regardless of formatting.
+    """
+    # Act
+    registry = MemberRegistry(members)
+
+    # Assert
+    assert len(registry) == 2
+    assert registry.get("m2") is members[1]
+    assert registry.get("m9") is None
+    assert "m1" in registry
+    assert registry.by_phone("+84909123456") is members[0]
+    assert registry.phone_taken("0909-123-456")
+    assert not registry.phone_taken("0909123456", exclude=members[0])
+
+def test_registry_mutations_keep_list_and_indexes_in_step(members):
+    """
+    Test case: Verify add/update/remove change the list and the indexes together.
+    """
+    # Arrange
+    registry = MemberRegistry(members)
+    new_member = Member(id="m3", name="Chi", phone="0977000111", address="", joinDate="")
+
+    # Act & Assert: add
+    registry.add(new_member)
+    assert members[-1] is new_member
+    assert registry.by_phone("0977000111") is new_member
+
+    # Act & Assert: update phone
+    new_member.phone = "0977000222"
+    registry.update(new_member)
+    assert not registry.phone_taken("0977000111")
+    assert registry.by_phone("0977000222") is new_member
+    assert len(registry) == 3
+
+    # Act & Assert: remove
+    registry.remove(members[0])
+    assert [m.id for m in members] == ["m2", "m3"]
+    assert registry.get("m1") is None and not registry.phone_taken("0909123456")
+    with pytest.raises(ValueError):
+        registry.remove(Member(id="m1", name="An", phone="0909 123 456", address="", joinDate=""))
+
+def test_shared_phone_survives_removal_of_one_owner(members):
+    """
+    Test case: Verify a phone shared by two members (e.g. from older data) stays indexed until both are gone.
+    """
+    # Arrange
+    twin = Member(id="m3", name="Anh", phone="0909123456", address="", joinDate="")
+    members.append(twin)
+    registry = MemberRegistry(members)
+
+    # Act
+    registry.remove(members[0])
+
+    # Assert
+    assert registry.by_phone("0909123456") is twin
+    assert registry.phone_taken("0909123456")
+    assert not registry.phone_taken("0909123456", exclude=twin)
+    registry.remove(twin)
+    assert registry.by_phone("0909123456") is None
+    assert not registry.phone_taken("0909123456")
+
+def test_registry_sync_picks_up_direct_changes(members):
+    """
+    Test case: Verify sync() indexes appended members and rebuilds after a removal or a new list.
+    """
+    # Arrange
+    state = AppState(members=members)
+    assert state.registry.get("m1") is members[0]
+
+    # Act
+    members.append(Member(id="m3", name="Chi", phone="0977000111", address="", joinDate=""))
+    assert state.registry.get("m3") is members[2]
+    del members[0]
+
+    # Assert
+    assert state.registry.get("m1") is None
+    assert len(state.registry) == 2
+
+def test_registry_rebuilds_after_invalidate(members):
+    """
+    Test case: Verify an in-place removal followed by an append (same length) is picked up after invalidate().
+    """
+    # Arrange
+    registry = MemberRegistry(members)
+
+    # Act
+    del members[0]
+    members.append(Member(id="m3", name="Chi", phone="0977000111", address="", joinDate=""))
+    registry.invalidate()
+    registry.sync(members)
+
+    # Assert
+    assert registry.get("m1") is None
+    assert registry.get("m3") is members[1]
+    assert not registry.phone_taken("0909123456")
+
+def test_service_uses_shared_registry(members):
+    """
+    Test case: Verify MembersService checks phones and mutates members through the registry it is given.
+    """
+    # Arrange
+    state = AppState(members=members)
+    service = MembersService(state.members, [], [], registry=state.registry)
+
+    # Act
+    created = service.create("Dũng", "0988 000 111", "", "", "", MemberStatus.NORMAL.value)
+    service.delete(members[0])
+
+    # Assert
+    assert state.registry.get(created.id) is created
+    assert service.get(created.id) is created
+    assert "m1" not in state.registry
+    with pytest.raises(ValueError, match="đã tồn tại"):
+        service.create("Em", "+84 912 345 678", "", "", "", MemberStatus.NORMAL.value)
+    with pytest.raises(ValueError, match="đã tồn tại"):
+        service.update(created, "Dũng", "0912345678", "", "", "", MemberStatus.NORMAL.value)
+    service.close()
@@ -2,14 +2,16 @@ import pytest
 from app.models.member import Member
 from app.models.enums import MemberStatus
 from app.services.members_service import MembersService
-from app.core.event_bus import get_event_bus, EventType
+from app.core.event_bus import get_event_bus, Event, EventType
 
 @pytest.fixture
 def members_service():
     members = []
     groups = []
     transactions = []
-    return MembersService(members, groups, transactions)
+    service = MembersService(members, groups, transactions)
+    yield service
+    service.close()
 
 def test_member_risk_logic():
     """Test business rules in Member model."""
@@ -77,3 +79,108 @@ def test_member_service_delete_constraint(members_service):
     
     with pytest.raises(ValueError, match="Không thể xóa"):
         members_service.delete(member)
+
+def test_presenter_stats_served_from_batch(mocker):
+    """Test that presenter stats for all members come from one debt computation."""
+    from app.models.hui_group import HuiGroup
+    from app.models.transaction import Transaction
+    from app.services.members_presenter import MembersPresenter
+    from services.finance_service import FinanceService
+
+    members = [Member(id=m, name=m, phone=m, address="", joinDate="") for m in ("m1", "m2")]
+    group = HuiGroup(
+        id="G1", name="Group", type="Tháng", amountPerShare=1000,
+        commissionRate=5, totalMembers=2, startDate="",
+        status="Đang chạy", members=["m1", "m2"], currentPeriod=2
+    )
+    transactions = [Transaction(id="t1", huiGroupId="G1", memberId="m1", type='COLLECT', amount=0, bidAmount=100, period=1, date="")]
+    presenter = MembersPresenter(members, [group], transactions)
+    batch = mocker.spy(FinanceService, 'compute_all_debts')
+
+    stats = presenter.get_all_member_stats()
+
+    assert batch.call_count == 1
+    assert (stats["m1"].num_collected, stats["m1"].total_debt) == (1, 0)
+    assert (stats["m2"].num_groups, stats["m2"].total_debt) == (1, 900)
+    assert presenter.get_member_stats("m2") == stats["m2"]
+
+def test_service_all_stats_match_per_member_stats():
+    """Test that get_all_stats returns the same figures as get_stats for every member."""
+    from app.models.hui_group import HuiGroup
+    from app.models.transaction import Transaction
+
+    members = [Member(id=m, name=m, phone=m, address="", joinDate="") for m in ("m1", "m2", "m3")]
+    group = HuiGroup(
+        id="G1", name="Group", type="Tháng", amountPerShare=1000,
+        commissionRate=5, totalMembers=3, startDate="",
+        status="Đang chạy", members=["m1", "m2", "m2"], currentPeriod=2
+    )
+    transactions = [Transaction(id="t1", huiGroupId="G1", memberId="m1", type='COLLECT', amount=0, bidAmount=100, period=1, date="")]
+    service = MembersService(members, [group], transactions)
+
+    stats = service.get_all_stats()
+
+    for m in members:
+        expected = service.get_stats(m.id)
+        assert (stats[m.id].num_groups, stats[m.id].num_collected, stats[m.id].total_debt) == \
+            (expected['num_groups'], expected['num_collected'], expected['total_debt'])
+    service.close()
+
+def test_table_model_serves_rows_lazily():
+    """Test that the members table model serves cells and the row's member from the data it holds."""
+    from PyQt6.QtCore import Qt
+    from app.models.member import MemberStats
+    from app.ui.views.members_table_model import MembersTableModel, COLUMNS, COL_DEBT, RED
+
+    members = [Member(id=f"m{i}", name=f"Name {i}", phone=str(i), address="", joinDate="") for i in range(3)]
+    stats = {"m1": MemberStats(member_id="m1", num_groups=2, num_collected=1, total_debt=1500000)}
+    model = MembersTableModel()
+
+    model.set_members(members, stats)
+
+    assert (model.rowCount(), model.columnCount()) == (3, len(COLUMNS))
+    assert model.data(model.index(1, 1)) == "Name 1"
+    assert model.data(model.index(1, COL_DEBT)) == "1,500,000"
+    assert model.data(model.index(1, COL_DEBT), Qt.ItemDataRole.ForegroundRole) == RED
+    assert model.data(model.index(0, COL_DEBT)) == "0"
+    assert model.data(model.index(2, 0), Qt.ItemDataRole.UserRole) is members[2]
+
+    # A new search result keeps the stats
+    model.set_members(members[1:2])
+    assert model.rowCount() == 1
+    assert model.data(model.index(0, COL_DEBT)) == "1,500,000"
+
+def test_member_service_search_ignores_accents(members_service):
+    """Test that searching without accents finds accented names."""
+    members_service.create("Nguyễn Thị Lan", "0901234567", "", "", "", MemberStatus.NORMAL.value)
+    members_service.create("Lê Văn Tám", "0907654321", "", "", "", MemberStatus.NORMAL.value)
+
+    assert [m.name for m in members_service.search("nguyen lan")] == ["Nguyễn Thị Lan"]
+    assert [m.name for m in members_service.search("765")] == ["Lê Văn Tám"]
+    members_service.search_index.close()
+
+def test_service_close_unsubscribes_debt_cache():
+    """Test case: closing a service leaves no debt cache handler on the event bus."""
+    # Arrange
+    bus = get_event_bus()
+    before = len(bus._subscribers.get(EventType.PAYMENT_MADE, []))
+    service = MembersService([], [], [])
+
+    # Act
+    service.close()
+
+    # Assert
+    assert len(bus._subscribers.get(EventType.PAYMENT_MADE, [])) == before
+
+def test_service_close_unsubscribes_search_index():
+    """Test case: a closed service's search index ignores later member events."""
+    # Arrange
+    service = MembersService([], [], [])
+    service.close()
+    member = Member(id="m9", name="Hoa", phone="0900", address="", joinDate="")
+
+    # Act
+    get_event_bus().publish(Event(EventType.MEMBER_CREATED, {'member': member}, "test"))
+
+    # Assert
+    assert service.search_index.search("Hoa") == []
@@ -0,0 +1,66 @@
+import pytest
+from decimal import Decimal
+from app.models.money import to_money, percent_of
+from data_models import HuiGroup, Transaction, HuiType, HuiStatus
+
+@pytest.mark.parametrize("value, expected", [
+    (1850000, 1850000),
+    (1850000.0, 1850000),
+    (1000.5, 1001),
+    (1000.49, 1000),
+    (-1000.5, -1001),
+    ("2,000,000", 2000000),
+    (" 150000 ", 150000),
+    ("", 0),
+    (None, 0),
+    (Decimal("999.5"), 1000),
+])
+def test_to_money(value, expected):
+    """
+    Test case: Verify conversion to whole đồng with half-up rounding.
+    """
+    # Act
+    result = to_money(value)
+
+    # Assert
+    assert result == expected
+    assert type(result) is int
+
+def test_to_money_rejects_garbage():
+    """
+    Test case: Verify invalid user input raises ValueError like float() did.
+    """
+    with pytest.raises(ValueError):
+        to_money("abc")
+
+@pytest.mark.parametrize("amount, rate, expected", [
+    (1000000, 5, 50000),
+    (1500000, 2.3, 34500), # float math gives 34499.99999999999
+    (1000000, 0.3, 3000),
+    (1000000, "1.25", 12500),
+    (333, 50, 167), # 166.5 rounds half up
+    (1000000, 0, 0),
+    (1000000, None, 0),
+])
+def test_percent_of_is_exact(amount, rate, expected):
+    """
+    Test case: Verify commission percentages are computed exactly.
+    """
+    assert percent_of(amount, rate) == expected
+
+def test_models_store_integer_money():
+    """
+    Test case: Verify model money fields are coerced to int on construction.
+    """
+    # Act
+    group = HuiGroup(id="g1", name="g1", type=HuiType.MONTHLY.value, amountPerShare=1000000.0,
+                     commissionRate=2.5, totalMembers=2, startDate="", status=HuiStatus.ACTIVE.value,
+                     members=["m1", "m2"], currentPeriod=1, minBidStep=10000.0)
+    tx = Transaction(id="t1", huiGroupId="g1", memberId="m1", type='COLLECT', amount=0.0,
+                     bidAmount=None, netAmount=1849999.6, date="", period=1)
+
+    # Assert
+    assert type(group.amountPerShare) is int and type(group.minBidStep) is int
+    assert group.commissionRate == 2.5 # Rates stay as entered
+    assert (tx.amount, tx.bidAmount, tx.netAmount) == (0, 0, 1850000)
+    assert all(type(v) is int for v in (tx.amount, tx.bidAmount, tx.netAmount))
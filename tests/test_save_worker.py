@@ -0,0 +1,118 @@
+import pytest
+import threading
+import time
+from PyQt6.QtCore import QCoreApplication
+from storage import create_default_data
+from app.core.event_bus import get_event_bus, EventType
+from app.core.save_worker import SaveWorker
+
+@pytest.fixture(scope="session")
+def qt_app():
+    """Qt event loop needed to deliver signals from the writer thread (kept alive for the session)."""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+@pytest.fixture
+def events():
+    received = []
+    handler = received.append
+    get_event_bus().subscribe(EventType.SAVE_COMPLETED, handler)
+    get_event_bus().subscribe(EventType.SAVE_FAILED, handler)
+    yield received
+    get_event_bus().unsubscribe(EventType.SAVE_COMPLETED, handler)
+    get_event_bus().unsubscribe(EventType.SAVE_FAILED, handler)
+
+def wait_for(condition, app, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+def test_burst_of_requests_is_coalesced(qt_app, events):
+    """
+    Test case: Verify twenty quick save requests produce a single write of the latest state.
+    """
+    # Arrange
+    written = []
+    worker = SaveWorker(writer=written.append, debounce_ms=200)
+    state = create_default_data()
+
+    # Act
+    for i in range(20):
+        state.members[0].note = f"edit {i}"
+        worker.request_save(state)
+
+    # Assert
+    assert wait_for(lambda: events, qt_app)
+    worker.stop()
+    assert len(written) == 1
+    assert written[0].members[0].note == "edit 19"
+    assert events[0].type == EventType.SAVE_COMPLETED
+    assert events[0].data['requests'] == 20
+
+def test_snapshot_is_isolated_from_later_edits(qt_app):
+    """
+    Test case: Verify edits made after a request do not leak into the queued snapshot.
+    """
+    # Arrange
+    written = []
+    worker = SaveWorker(writer=written.append, debounce_ms=10000)
+    state = create_default_data()
+    original_name = state.members[0].name
+
+    # Act
+    worker.request_save(state)
+    state.members[0].name = "Changed"
+    state.groups[0].members.append("m9")
+    worker.flush()
+    worker.stop()
+
+    # Assert
+    assert written[0].members[0].name == original_name
+    assert "m9" not in written[0].groups[0].members
+
+def test_failed_write_publishes_event(qt_app, events):
+    """
+    Test case: Verify a writer exception is reported as SAVE_FAILED.
+    """
+    # Arrange
+    def failing_writer(snapshot):
+        raise OSError("disk full")
+    worker = SaveWorker(writer=failing_writer, debounce_ms=10000)
+
+    # Act
+    worker.request_save(create_default_data())
+    worker.stop()
+
+    # Assert
+    assert [e.type for e in events] == [EventType.SAVE_FAILED]
+    assert events[0].data['error'] == "disk full"
+
+def test_stop_waits_for_write_in_progress(qt_app):
+    """
+    Test case: Verify stop() lets the writer thread finish its write before writing the newer pending snapshot.
+    """
+    # Arrange: the first write blocks until released
+    started, release = threading.Event(), threading.Event()
+    written = []
+    def slow_writer(snapshot):
+        started.set()
+        release.wait(5)
+        written.append(snapshot.members[0].note)
+    worker = SaveWorker(writer=slow_writer, debounce_ms=0)
+    state = create_default_data()
+    state.members[0].note = "first"
+    worker.request_save(state)
+    assert started.wait(5)
+    state.members[0].note = "second"
+    worker.request_save(state)
+
+    # Act
+    stopper = threading.Thread(target=worker.stop)
+    stopper.start()
+    time.sleep(0.05)
+    release.set()
+    stopper.join(5)
+
+    # Assert
+    assert written == ["first", "second"]
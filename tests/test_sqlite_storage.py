@@ -0,0 +1,110 @@
+import pytest
+import json
+from data_models import AppState, Transaction, AuditLog
+from storage import create_default_data
+from sqlite_storage import SQLiteRepository
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = SQLiteRepository(str(tmp_path / "smarthui.db"))
+    yield repository
+    repository.close()
+
+def count_rows(repo, table):
+    return repo.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+def test_save_and_load_round_trip(repo):
+    """
+    Test case: Verify a saved AppState loads back identically, including slot order.
+    """
+    # Arrange
+    state = create_default_data()
+    state.auditLogs.append(AuditLog(
+        id="LOG-1", timestamp="2024-01-01", action='PAYMENT_RECORD', userId="m1", scenario="s",
+        stateBefore={"currentPeriod": 1}, inputParameters={}, resultCalculated={"remainingDebt": 0}
+    ))
+
+    # Act
+    repo.save(state)
+    loaded = SQLiteRepository(repo.path).load()
+
+    # Assert
+    assert loaded.to_dict() == state.to_dict()
+    assert loaded.groups[0].members == ["m1", "m2", "m2", "m3", "m3", "m4", "m4", "m5", "m1", "m3"]
+    assert count_rows(repo, "slots") == sum(len(g.members) for g in state.groups)
+
+def test_save_inserts_only_new_rows(repo, mocker):
+    """
+    Test case: Verify subsequent saves insert new transactions without rewriting history.
+    """
+    # Arrange
+    state = create_default_data()
+    repo.save(state)
+    insert_spy = mocker.spy(repo, '_insert')
+
+    # Act
+    state.transactions.append(Transaction(id="t9", huiGroupId="g1", memberId="m4", type='CONTRIBUTE',
+                                          amount=500000, date="", period=3))
+    state.members[0].note = "changed"
+    repo.save(state)
+
+    # Assert
+    inserted = {call.args[0]: len(call.args[1]) for call in insert_spy.call_args_list if call.args[1]}
+    assert inserted == {'members': 1, 'transactions': 1}
+    assert count_rows(repo, "transactions") == len(state.transactions)
+    assert SQLiteRepository(repo.path).load().members[0].note == "changed"
+
+def test_save_removes_deleted_members(repo):
+    """
+    Test case: Verify members removed from the state are deleted from the database.
+    """
+    # Arrange
+    state = create_default_data()
+    repo.save(state)
+
+    # Act
+    removed = state.members.pop()
+    repo.save(state)
+
+    # Assert
+    ids = [m.id for m in SQLiteRepository(repo.path).load().members]
+    assert removed.id not in ids
+    assert len(ids) == len(state.members)
+
+def test_import_json(repo, tmp_path):
+    """
+    Test case: Verify the one-time importer loads a data.json file and refuses a non-empty database.
+    """
+    # Arrange
+    state = create_default_data()
+    json_path = tmp_path / "data.json"
+    json_path.write_text(json.dumps(state.to_dict(), ensure_ascii=False), encoding='utf-8')
+
+    # Act
+    imported = repo.import_json(str(json_path))
+
+    # Assert
+    assert imported.to_dict() == state.to_dict()
+    assert repo.load().to_dict() == state.to_dict()
+    with pytest.raises(ValueError):
+        repo.import_json(str(json_path))
+
+def test_save_rewrites_history_after_in_place_rewrite(repo):
+    """
+    Test case: Verify a history rewritten in place (e.g. archived) and refilled to its old length is saved in full.
+    """
+    # Arrange
+    state = create_default_data()
+    repo.save(state)
+
+    # Act: drop the first row, append a new one, save a snapshot as SaveWorker does
+    dropped = state.transactions[0]
+    state.transactions[:] = state.transactions[1:]
+    state.history_rewritten()
+    state.transactions.append(Transaction(id="new", huiGroupId=dropped.huiGroupId, memberId=dropped.memberId,
+                                          type='CONTRIBUTE', amount=100000, date="", period=1))
+    repo.save(state.snapshot())
+    loaded = SQLiteRepository(repo.path).load()
+
+    # Assert
+    assert [t.id for t in loaded.transactions] == [t.id for t in state.transactions]
@@ -1,5 +1,6 @@
 import pytest
 import json
+import os
 from unittest.mock import mock_open, patch
 import storage
 from storage import get_initial_data, save_data, create_default_data
@@ -79,24 +80,27 @@ def test_get_initial_data_handles_json_decode_error(mocker):
 
 def test_save_data_writes_to_file_correctly(mocker):
     """
-    Test case: Verify save_data correctly serializes and writes data to the file.
+    Test case: Verify save_data serializes to a temp file and renames it over data.json.
     """
     # Arrange
     mock_file = mock_open()
     mocker.patch('builtins.open', mock_file)
     mocker.patch('json.dump')
+    mocker.patch('os.fsync')
+    mocker.patch('os.replace')
 
     # Act
     save_data(SAMPLE_APP_STATE_OBJ)
 
     # Assert
-    mock_file.assert_called_once_with("data.json", 'w', encoding='utf-8')
+    mock_file.assert_called_once_with("data.json.tmp", 'w', encoding='utf-8')
     json.dump.assert_called_once_with(
         SAMPLE_APP_STATE_OBJ.to_dict(),
         mock_file(),
         ensure_ascii=False,
         indent=2
     )
+    os.replace.assert_called_once_with("data.json.tmp", "data.json")
 
 def test_create_default_data_returns_appstate():
     """
@@ -109,3 +113,28 @@ def test_create_default_data_returns_appstate():
     assert isinstance(default_state, AppState)
     assert len(default_state.members) > 0
     assert len(default_state.groups) > 0
+
+def test_sqlite_backend_imports_json_once(mocker, tmp_path):
+    """
+    Test case: Verify the SQLite backend imports data.json on first start and then saves row by row.
+    """
+    # Arrange
+    data_file = tmp_path / "data.json"
+    data_file.write_text(json.dumps(SAMPLE_APP_STATE_DICT), encoding='utf-8')
+    mocker.patch('storage.STORAGE_BACKEND', "sqlite")
+    mocker.patch('storage.DATA_FILE', str(data_file))
+    mocker.patch('storage.DB_FILE', str(tmp_path / "smarthui.db"))
+    mocker.patch('storage._repository', None)
+
+    # Act
+    app_state = get_initial_data()
+    app_state.members[0].name = "Renamed"
+    save_data(app_state)
+    storage._repository.close()
+    mocker.patch('storage._repository', None)
+    reloaded = get_initial_data()
+
+    # Assert
+    assert app_state.members[0].id == "m1"
+    assert reloaded.members[0].name == "Renamed"
+    storage._repository.close()
@@ -0,0 +1,99 @@
+import pytest
+from data_models import AppState, Transaction
+from app.models.transaction_store import TransactionStore
+
+@pytest.fixture
+def transactions():
+    """Two periods of group g1 plus one collect in g2."""
+    return [
+        Transaction(id="t1", huiGroupId="g1", memberId="m1", type='COLLECT', amount=2000000, netAmount=1850000, bidAmount=100000, period=1, date=""),
+        Transaction(id="t2", huiGroupId="g1", memberId="m2", type='CONTRIBUTE', amount=400000, period=1, date=""),
+        Transaction(id="t3", huiGroupId="g1", memberId="m2", type='CONTRIBUTE', amount=500000, period=1, date=""),
+        Transaction(id="t4", huiGroupId="g1", memberId="m1", type='CONTRIBUTE', amount=1000000, period=2, date=""),
+        Transaction(id="t5", huiGroupId="g2", memberId="m2", type='COLLECT', amount=700000, period=1, date=""),
+    ]
+
+def test_transaction_store_totals(transactions):
+    """
+    Test case: Verify filtered totals, including the payout fallback to amount.
+    """
+    # Act
+    store = TransactionStore(transactions)
+
+    # Assert
+    assert len(store) == 5
+    assert store.total('amount', tx_type='CONTRIBUTE') == 1900000
+    assert store.total('payout', tx_type='COLLECT') == 1850000 + 700000
+    assert store.total('amount', tx_type='CONTRIBUTE', group_id="g1", member_id="m2") == 900000
+    assert store.total('amount', tx_type='PENALTY') == 0
+    assert store.total('amount', group_id="missing") == 0
+
+def test_transaction_store_group_by(transactions):
+    """
+    Test case: Verify group-by sums decode keys and skip absent keys.
+    """
+    # Act
+    store = TransactionStore(transactions)
+
+    # Assert
+    assert store.sum_by('group', tx_type='CONTRIBUTE') == {"g1": 1900000}
+    assert store.sum_by('member', tx_type='CONTRIBUTE') == {"m1": 1000000, "m2": 900000}
+    assert store.sum_by('period', tx_type='CONTRIBUTE', group_id="g1") == {1: 900000, 2: 1000000}
+    assert store.sum_by('type', 'bidAmount') == {'CONTRIBUTE': 0, 'COLLECT': 100000}
+    assert store.sum_by('member', member_id="missing") == {}
+    with pytest.raises(ValueError):
+        store.sum_by('date')
+
+def test_transaction_store_sync_grows_and_rebuilds(transactions):
+    """
+    Test case: Verify sync() appends past the initial capacity and rebuilds after removals.
+    """
+    # Arrange
+    source = list(transactions[:2])
+    store = TransactionStore().sync(source)
+    extra = [Transaction(id=f"x{i}", huiGroupId="g3", memberId="m3", type='CONTRIBUTE', amount=1, period=1, date="")
+             for i in range(3000)]
+
+    # Act: append
+    source.extend(transactions[2:] + extra)
+    store.sync(source)
+
+    # Assert
+    assert len(store) == 3005
+    assert store.sum_by('group', tx_type='CONTRIBUTE') == {"g1": 1900000, "g3": 3000}
+
+    # Act: remove
+    del source[1]
+    store.sync(source)
+
+    # Assert
+    assert len(store) == 3004
+    assert store.total('amount', tx_type='CONTRIBUTE', group_id="g1") == 1500000
+
+def test_app_state_store_follows_transactions(transactions):
+    """
+    Test case: Verify AppState.store picks up transactions added through the state.
+    """
+    # Arrange
+    state = AppState(transactions=list(transactions))
+    assert state.store.total('amount', tx_type='CONTRIBUTE') == 1900000
+
+    # Act
+    state.add_transaction(Transaction(id="t6", huiGroupId="g2", memberId="m1", type='CONTRIBUTE', amount=300000, period=1, date=""))
+
+    # Assert
+    assert state.store.total('amount', tx_type='CONTRIBUTE') == 2200000
+
+def test_transaction_store_row_selection(transactions):
+    """
+    Test case: Verify row positions by filter and split per member, in insertion order.
+    """
+    # Act
+    store = TransactionStore(transactions)
+
+    # Assert
+    assert store.rows(group_id="g1", member_id="m2").tolist() == [1, 2]
+    assert store.rows(member_id="missing").tolist() == []
+    assert [(k, r.tolist()) for k, r in store.rows_by('member')] == [("m1", [0, 3]), ("m2", [1, 2, 4])]
+    assert [(k, r.tolist()) for k, r in store.rows_by('group', tx_type='COLLECT')] == [("g1", [0]), ("g2", [4])]
+    assert list(TransactionStore().rows_by('group')) == []
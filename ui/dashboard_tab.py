@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout, QFrame, Q
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 from data_models import AppState
+from services.archive_service import ArchiveService
 import qtawesome as qta
 
 class StatCard(QFrame):
@@ -88,11 +89,13 @@ class DashboardTab(QWidget):
                 
         total_members = len(self.data.members)
         active_groups = len([g for g in self.data.groups if g.status == 'Đang chạy'])
-        total_groups = len(self.data.groups)
+        total_groups = len(self.data.groups) + len(self.data.archives)
         
-        # Calculate total flow
-        total_in = sum(t.amount for t in self.data.transactions if t.type == 'CONTRIBUTE')
-        total_out = sum((t.netAmount or t.amount) for t in self.data.transactions if t.type == 'COLLECT')
+        # Calculate total flow (archived groups contribute their precomputed totals)
+        archived = ArchiveService.archived_totals(self.data)
+        store = self.data.store
+        total_in = archived['contributed'] + store.total('amount', tx_type='CONTRIBUTE')
+        total_out = archived['collected'] + store.total('payout', tx_type='COLLECT')
         
         # Add Cards with Icons
         self.grid.addWidget(StatCard("Tổng Thành Viên", str(total_members), "fa5s.users", "#3B82F6"), 0, 0)
@@ -1,15 +1,21 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QTableWidget, QTableWidgetItem, QHeaderView,
                              QDialog, QFormLayout, QLineEdit, QComboBox, QMessageBox,
-                             QStackedWidget, QScrollArea, QFrame, QInputDialog, QSpinBox)
+                             QStackedWidget, QScrollArea, QFrame, QInputDialog, QSpinBox, QSlider)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
 import time
+import uuid
 import qtawesome as qta
 from datetime import datetime
 from data_models import AppState, HuiGroup, HuiType, HuiStatus, Transaction, AuditLog
 from services.finance_service import FinanceService
+from services.finance_cache import get_finance_cache
+from app.models.money import to_money
 from services.audit_service import AuditService
+from services.archive_service import ArchiveService
+from services.bid_simulator import BidSimulator
+from app.core.event_bus import get_event_bus, Event, EventType
 
 # --- DIALOGS ---
 
@@ -241,13 +247,13 @@ class CycleSetupWizard(QDialog):
                 past_winners.append({
                     'period': r + 1,
                     'memberId': members_list[slot_idx],
-                    'bid': float(bid_inp.text() or 0)
+                    'bid': to_money(bid_inp.text())
                 })
 
         self.result_data = {
             "name": self.inp_name.text(),
             "type": self.inp_type.currentText(),
-            "amount": float(self.inp_amount.text()),
+            "amount": to_money(self.inp_amount.text()),
             "commission": float(self.inp_comm.text() or 0),
             "commissionType": 'FIXED' if self.inp_comm_type.currentText() == 'VNĐ' else 'PERCENT',
             "members": members_list,
@@ -270,6 +276,7 @@ class BiddingDialog(QDialog):
         self.all_members = all_members
         self.all_transactions = all_transactions
         self.result_data = None
+        self.simulation = None
         self.resize(800, 600)
         
         main_layout = QHBoxLayout(self)
@@ -290,15 +297,23 @@ class BiddingDialog(QDialog):
         unique_members = {m.id: m for m in all_members if m.id in group.members}
         for mid in sorted(unique_members.keys()):
             self.cb_winner.addItem(unique_members[mid].name, mid)
-        self.cb_winner.currentIndexChanged.connect(self.update_preview)
+        self.cb_winner.currentIndexChanged.connect(self.on_winner_changed)
         
         # Bid input
         self.inp_bid = QLineEdit()
         self.inp_bid.setPlaceholderText("Nhập số tiền thăm...")
         self.inp_bid.textChanged.connect(self.update_preview)
         
+        # Bid slider over the simulated bid grid
+        self.bid_slider = QSlider(Qt.Orientation.Horizontal)
+        self.bid_slider.valueChanged.connect(self.on_slider_changed)
+        self.lbl_bid_range = QLabel()
+        self.lbl_bid_range.setStyleSheet("color: #64748B; font-size: 12px;")
+        
         form.addRow("Người Hốt:", self.cb_winner)
         form.addRow("Tiền Thăm (VNĐ):", self.inp_bid)
+        form.addRow("", self.bid_slider)
+        form.addRow("", self.lbl_bid_range)
         
         left_layout.addLayout(form)
         
@@ -363,15 +378,31 @@ class BiddingDialog(QDialog):
         main_layout.addWidget(left_panel, 1)
         main_layout.addWidget(right_panel, 1)
         
+        self.on_winner_changed()
+    
+    def on_winner_changed(self):
+        # Everything except the bid is fixed for a winner: simulate all bids once
+        self.simulation = BidSimulator.simulate(self.group, self.cb_winner.currentData(), self.all_transactions)
+        bids = self.simulation.bids
+        self.bid_slider.blockSignals(True)
+        self.bid_slider.setRange(0, max(len(bids) - 1, 0))
+        self.bid_slider.blockSignals(False)
+        
+        max_ok = self.simulation.max_bid_with_positive_payout()
+        if max_ok is not None:
+            self.lbl_bid_range.setText(f"Thăm tối đa còn thực nhận ≥ 0: {max_ok:,.0f} đ")
+        else:
+            self.lbl_bid_range.setText("Không có mức thăm nào cho thực nhận ≥ 0")
         self.update_preview()
     
+    def on_slider_changed(self, index: int):
+        self.inp_bid.setText(str(int(self.simulation.bids[index])))
+    
     def update_preview(self):
         try:
-            bid = float(self.inp_bid.text() or 0)
+            bid = to_money(self.inp_bid.text())
         except:
-            bid = 0.0
-        
-        winner_id = self.cb_winner.currentData()
+            bid = 0
         
         # Validate
         warnings = []
@@ -382,8 +413,13 @@ class BiddingDialog(QDialog):
             warnings.append("⚠️ Tiền thăm không thể âm")
             bid = 0
         
-        # Calculate
-        calc = FinanceService.calculate_payout(self.group, self.group.currentPeriod, bid, winner_id, self.all_transactions)
+        # Calculate (constant time from the simulation of this winner)
+        calc = self.simulation.payout(bid)
+        index = self.simulation.index(bid)
+        if index is not None and index != self.bid_slider.value():
+            self.bid_slider.blockSignals(True)
+            self.bid_slider.setValue(index)
+            self.bid_slider.blockSignals(False)
         
         if calc.deductions > 0:
             warnings.append(f"💰 Người thắng có nợ cũ: {calc.deductions:,.0f} đ")
@@ -437,7 +473,7 @@ class BiddingDialog(QDialog):
     
     def confirm(self):
         try:
-            bid = float(self.inp_bid.text())
+            bid = to_money(self.inp_bid.text())
         except:
             QMessageBox.warning(self, "Lỗi", "Vui lòng nhập số tiền thăm hợp lệ.")
             return
@@ -476,6 +512,9 @@ class HuiListTab(QWidget):
         self.stack.addWidget(self.page_detail)
         
         self.current_group: HuiGroup = None
+        # What the list and detail pages were last rendered from (skip unchanged refreshes)
+        self._list_signature = None
+        self._detail_signature = None
 
     def init_list_page(self):
         layout = QVBoxLayout(self.page_list)
@@ -495,9 +534,14 @@ class HuiListTab(QWidget):
         btn_add.setProperty("primary", True)
         btn_add.clicked.connect(self.open_create_dialog)
         
+        btn_archive = QPushButton("Lưu Trữ Dây Đã Mãn")
+        btn_archive.setIcon(qta.icon('fa5s.archive', color='#475569'))
+        btn_archive.clicked.connect(self.archive_completed)
+        
         top.addWidget(lbl_icon)
         top.addWidget(lbl)
         top.addStretch()
+        top.addWidget(btn_archive)
         top.addWidget(btn_add)
         layout.addLayout(top)
         
@@ -515,6 +559,16 @@ class HuiListTab(QWidget):
         
     def refresh(self):
         # Refresh list
+        signature = tuple((g.id, g.name, g.type, g.amountPerShare, g.currentPeriod, g.status) for g in self.data.groups)
+        if signature != self._list_signature:
+            self._list_signature = signature
+            self.render_list()
+
+        # Refresh detail if open
+        if self.current_group:
+            self.render_detail(self.current_group)
+
+    def render_list(self):
         self.table_list.setRowCount(0)
         for g in self.data.groups:
             row = self.table_list.rowCount()
@@ -549,17 +603,13 @@ class HuiListTab(QWidget):
             btn_detail.setCursor(Qt.CursorShape.PointingHandCursor)
             btn_detail.clicked.connect(lambda checked, grp=g: self.open_detail(grp))
             self.table_list.setCellWidget(row, 5, btn_detail)
-            
-        # Refresh detail if open
-        if self.current_group:
-            self.render_detail(self.current_group)
 
     def open_create_dialog(self):
         dlg = CycleSetupWizard(self, self.data.members)
         if dlg.exec():
             d = dlg.result_data
             new_group = HuiGroup(
-                id=str(int(time.time())),
+                id=uuid.uuid4().hex,
                 name=d['name'],
                 type=d['type'],
                 amountPerShare=d['amount'],
@@ -574,6 +624,7 @@ class HuiListTab(QWidget):
             self.data.groups.append(new_group)
             
             # Handle Historical Transactions
+            history = []
             for pw in d['pastWinners']:
                 # Calculate what the total pot was (simplified for history)
                 # Actually, FinanceService.calculate_payout provides the real logic, 
@@ -588,7 +639,7 @@ class HuiListTab(QWidget):
                 # So we just record the winner and bid.
                 
                 new_tx = Transaction(
-                    id=f"hist-col-{int(time.time())}-{pw['period']}",
+                    id=uuid.uuid4().hex,
                     huiGroupId=new_group.id,
                     memberId=pw['memberId'],
                     type='COLLECT',
@@ -599,11 +650,41 @@ class HuiListTab(QWidget):
                     period=pw['period'],
                     note='Dữ liệu lịch sử (Hốt hụi)'
                 )
-                self.data.transactions.append(new_tx)
+                self.data.add_transaction(new_tx)
+                history.append(new_tx)
 
+            get_event_bus().publish(Event(
+                type=EventType.CYCLE_CREATED,
+                data={'group': new_group, 'transactions': history},
+                source='HuiListTab'
+            ))
             self.save_callback()
             self.refresh()
 
+    def archive_completed(self):
+        completed = [g for g in self.data.groups if g.status == HuiStatus.COMPLETED.value]
+        if not completed:
+            QMessageBox.information(self, "Lưu Trữ", "Không có dây hụi đã mãn để lưu trữ.")
+            return
+        reply = QMessageBox.question(
+            self, "Xác nhận",
+            f"Lưu trữ {len(completed)} dây hụi đã mãn? Dữ liệu chi tiết sẽ chỉ được tải khi xem báo cáo.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        summaries = ArchiveService.archive_completed_groups(self.data)
+        if self.current_group and any(s.id == self.current_group.id for s in summaries):
+            self.go_back()
+        for group, summary in zip(completed, summaries):
+            get_event_bus().publish(Event(
+                type=EventType.CYCLE_ARCHIVED,
+                data={'group': group, 'summary': summary},
+                source='HuiListTab'
+            ))
+        self.save_callback()
+
     def open_detail(self, group: HuiGroup):
         self.current_group = group
         self.render_detail(group)
@@ -614,6 +695,27 @@ class HuiListTab(QWidget):
         self.stack.setCurrentWidget(self.page_list)
 
     def render_detail(self, group: HuiGroup):
+        # Check Winner of current period
+        ledger = self.data.ledger
+        collector_tx = ledger.winner(group.id, group.currentPeriod)
+
+        # Tracking plan (memoized per group ledger version)
+        plan = get_finance_cache().get_contribution_plan(
+            group, 
+            group.currentPeriod, 
+            collector_tx.bidAmount if collector_tx else 0,
+            collector_tx.memberId if collector_tx else None,
+            ledger
+        )
+
+        registry = self.data.registry
+        names = tuple(registry.get(i.memberId).name if i.memberId in registry else None for i in plan)
+        signature = (group.id, group.name, group.currentPeriod, group.totalMembers, group.amountPerShare,
+                     collector_tx, plan, names)
+        if signature == self._detail_signature:
+            return
+        self._detail_signature = signature
+
         # Clear layout
         while self.detail_layout.count():
             item = self.detail_layout.takeAt(0)
@@ -649,10 +751,6 @@ class HuiListTab(QWidget):
         line.setStyleSheet("color: #E2E8F0;")
         self.detail_layout.addWidget(line)
         
-        # Check Winner of current period
-        txs = [t for t in self.data.transactions if t.huiGroupId == group.id]
-        collector_tx = next((t for t in txs if t.period == group.currentPeriod and t.type == 'COLLECT'), None)
-        
         # Actions Row
         actions = QHBoxLayout()
         if not collector_tx:
@@ -668,7 +766,8 @@ class HuiListTab(QWidget):
             actions.addStretch()
             actions.addWidget(btn_collect)
         else:
-            winner_name = next((m.name for m in self.data.members if m.id == collector_tx.memberId), "???")
+            winner = registry.get(collector_tx.memberId)
+            winner_name = winner.name if winner else "???"
             
             icon_win = QLabel()
             icon_win.setPixmap(qta.icon('fa5s.trophy', color='#F59E0B').pixmap(24,24))
@@ -687,14 +786,6 @@ class HuiListTab(QWidget):
         self.detail_layout.addLayout(actions)
         
         # Tracking Table (Checklist)
-        plan = FinanceService.get_contribution_plan(
-            group, 
-            group.currentPeriod, 
-            collector_tx.bidAmount if collector_tx else 0,
-            collector_tx.memberId if collector_tx else None,
-            self.data.transactions
-        )
-        
         table = QTableWidget()
         table.setColumnCount(5)
         table.setHorizontalHeaderLabels(["Thành Viên", "Phải Đóng", "Đã Đóng", "Còn Nợ (Balance)", "Hành Động"])
@@ -705,7 +796,7 @@ class HuiListTab(QWidget):
         table.setRowCount(len(plan))
         
         for i, item in enumerate(plan):
-            member = next((m for m in self.data.members if m.id == item.memberId), None)
+            member = registry.get(item.memberId)
             m_name = member.name if member else "Unknown"
             
             is_winner = (collector_tx and collector_tx.memberId == item.memberId)
@@ -763,13 +854,13 @@ class HuiListTab(QWidget):
         self.detail_layout.addWidget(table)
         
     def do_collect(self, group):
-        dlg = BiddingDialog(self, group, self.data.members, self.data.transactions)
+        dlg = BiddingDialog(self, group, self.data.members, self.data.ledger)
         if dlg.exec():
             result = dlg.result_data
             
             # Add Transaction
             new_tx = Transaction(
-                id=str(int(time.time())),
+                id=uuid.uuid4().hex,
                 huiGroupId=group.id,
                 memberId=result['winner_id'],
                 type='COLLECT',
@@ -780,12 +871,17 @@ class HuiListTab(QWidget):
                 period=group.currentPeriod,
                 note='Hốt hụi'
             )
-            self.data.transactions.append(new_tx)
+            self.data.add_transaction(new_tx)
             
             # Add Audit Log
             log = AuditService.create_collect_log(group, result['winner_id'], result['bid'], result['calc'])
             self.data.auditLogs.append(log)
             
+            get_event_bus().publish(Event(
+                type=EventType.COLLECTION_EXECUTED,
+                data={'group': group, 'transaction': new_tx, 'auditLog': log},
+                source='HuiListTab'
+            ))
             self.save_callback()
 
     def do_payment(self, group, item, member):
@@ -794,19 +890,24 @@ class HuiListTab(QWidget):
                                        int(item.remainingAmount), 0, 1000000000, 1000)
         if ok and amount > 0:
             new_tx = Transaction(
-                id=f"pay-{int(time.time())}",
+                id=uuid.uuid4().hex,
                 huiGroupId=group.id,
                 memberId=member.id,
                 type='CONTRIBUTE',
-                amount=float(amount),
+                amount=amount,
                 date=datetime.now().isoformat(),
                 period=group.currentPeriod,
                 note='Đóng tiền'
             )
-            self.data.transactions.append(new_tx)
+            self.data.add_transaction(new_tx)
             
             # Audit
             log = AuditService.create_payment_log(group, member.id, item.requiredAmount, amount, item.remainingAmount - amount)
             self.data.auditLogs.append(log)
             
+            get_event_bus().publish(Event(
+                type=EventType.PAYMENT_MADE,
+                data={'group': group, 'transaction': new_tx, 'auditLog': log},
+                source='HuiListTab'
+            ))
             self.save_callback()
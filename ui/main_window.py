@@ -2,7 +2,9 @@ from PyQt6.QtWidgets import QMainWindow, QTabWidget, QVBoxLayout, QWidget, QLabe
 from ui.dashboard_tab import DashboardTab
 from ui.hui_list_tab import HuiListTab
 from ui.reports_tab import ReportsTab
-from storage import get_initial_data, save_data
+from storage import get_initial_data, flush_data
+from app.core.event_bus import get_event_bus, Event, EventType, SEARCH_COALESCE_MS
+from app.core.save_worker import SaveWorker
 from app.services.members_service import MembersService
 from app.ui.views.members_view import MembersView
 
@@ -13,6 +15,10 @@ class MainWindow(QMainWindow):
         self.resize(1200, 800)
         
         self.data = get_initial_data()
+        self.save_worker = SaveWorker()
+        get_event_bus().subscribe(EventType.SAVE_FAILED, self._on_save_failed)
+        # The Qt loop is running from here on: debounce search-as-you-type
+        get_event_bus().set_coalescing(EventType.MEMBER_SEARCH, SEARCH_COALESCE_MS)
         
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
@@ -32,7 +38,8 @@ class MainWindow(QMainWindow):
         self.dashboard_tab = DashboardTab(self.data)
         self.hui_list_tab = HuiListTab(self.data, self.save_state)
         
-        self.members_service = MembersService(self.data.members, self.data.groups, self.data.transactions)
+        self.members_service = MembersService(self.data.members, self.data.groups, self.data.transactions,
+                                              registry=self.data.registry, archives=self.data.archives)
         self.members_tab = MembersView(self.members_service, self.save_state)
         
         self.reports_tab = ReportsTab(self.data)
@@ -42,8 +49,18 @@ class MainWindow(QMainWindow):
         self.tabs.addTab(self.members_tab, "Thành Viên")
         self.tabs.addTab(self.reports_tab, "Báo Cáo & AIAT")
         
+    def closeEvent(self, event):
+        self.save_worker.stop()
+        flush_data(self.data)
+        self.members_service.close()
+        get_event_bus().unsubscribe(EventType.SAVE_FAILED, self._on_save_failed)
+        super().closeEvent(event)
+
+    def _on_save_failed(self, event: Event):
+        self.statusBar().showMessage(f"Lỗi lưu dữ liệu: {event.data['error']}")
+
     def save_state(self):
-        save_data(self.data)
+        self.save_worker.request_save(self.data)
         self.refresh_ui()
 
     def refresh_ui(self):
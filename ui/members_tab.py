@@ -270,6 +270,6 @@ class MembersTab(QWidget):
         ret = QMessageBox.question(self, "Xác nhận", f"Bạn có chắc muốn xóa thành viên {member.name}?",
                                  QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if ret == QMessageBox.StandardButton.Yes:
-            self.data.members.remove(member)
+            self.data.registry.remove(member)
             self.save_callback()
             self.refresh()
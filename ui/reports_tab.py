@@ -1,9 +1,13 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QTextEdit, QSplitter)
-from PyQt6.QtCore import Qt
+                             QPushButton, QTextEdit, QSplitter, QProgressBar, QFileDialog)
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
 from data_models import AppState
 from services.finance_service import FinanceService
+from services.portfolio_report import PortfolioReportService
+from services.export_service import ExportService
 import json
+import os
+import threading
 
 # Try importing matplotlib, fail gracefully if not present
 try:
@@ -13,6 +17,43 @@ try:
 except ImportError:
     HAS_MATPLOTLIB = False
 
+class PortfolioReportRunner(QObject):
+    """Runs PortfolioReportService on a background thread; signals are delivered on the UI thread."""
+
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def start(self, state: AppState, workers: int):
+        snapshot = state.snapshot()
+        threading.Thread(target=self._run, args=(snapshot, workers), name="PortfolioReport", daemon=True).start()
+
+    def _run(self, state: AppState, workers: int):
+        try:
+            report = PortfolioReportService.run(state, workers=workers, progress=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(report)
+
+class ExportRunner(QObject):
+    """Writes an Excel export from a snapshot of the state on a background thread."""
+
+    finished = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+
+    def start(self, export, state: AppState, path: str):
+        snapshot = state.snapshot()
+        threading.Thread(target=self._run, args=(export, snapshot, path), name="Export", daemon=True).start()
+
+    def _run(self, export, state: AppState, path: str):
+        try:
+            rows = export(state, path)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(path, rows)
+
 class ReportsTab(QWidget):
     def __init__(self, data: AppState):
         super().__init__()
@@ -39,6 +80,44 @@ class ReportsTab(QWidget):
             left_layout.addWidget(self.canvas)
         else:
             left_layout.addWidget(QLabel("Matplotlib not installed. Cannot show chart."))
+
+        # Portfolio report (computed in a process pool)
+        self.btn_portfolio = QPushButton("Báo Cáo Tổng Hợp")
+        self.btn_portfolio.clicked.connect(self.run_portfolio_report)
+        left_layout.addWidget(self.btn_portfolio)
+
+        self.portfolio_progress = QProgressBar()
+        self.portfolio_progress.setVisible(False)
+        left_layout.addWidget(self.portfolio_progress)
+
+        self.lbl_portfolio = QLabel("")
+        left_layout.addWidget(self.lbl_portfolio)
+
+        self.portfolio_runner = PortfolioReportRunner()
+        self.portfolio_runner.progress.connect(self.on_portfolio_progress)
+        self.portfolio_runner.finished.connect(self.on_portfolio_finished)
+        self.portfolio_runner.failed.connect(self.on_portfolio_failed)
+
+        # Excel exports (written in the background from a snapshot)
+        export_layout = QHBoxLayout()
+        self.export_buttons = []
+        for label, export, filename in (
+            ("Xuất Sổ Dây Hụi", ExportService.export_group_ledgers, "so_day_hui.xlsx"),
+            ("Xuất Sổ Nợ Thành Viên", ExportService.export_member_statements, "so_no_thanh_vien.xlsx"),
+            ("Xuất Báo Cáo Hoa Hồng", ExportService.export_commission_report, "bao_cao_hoa_hong.xlsx"),
+        ):
+            btn = QPushButton(label)
+            btn.clicked.connect(lambda _, e=export, f=filename: self.run_export(e, f))
+            export_layout.addWidget(btn)
+            self.export_buttons.append(btn)
+        left_layout.addLayout(export_layout)
+
+        self.lbl_export = QLabel("")
+        left_layout.addWidget(self.lbl_export)
+
+        self.export_runner = ExportRunner()
+        self.export_runner.finished.connect(self.on_export_finished)
+        self.export_runner.failed.connect(self.on_export_failed)
             
         splitter.addWidget(left_widget)
         
@@ -68,7 +147,7 @@ class ReportsTab(QWidget):
             self.figure.clear()
             ax = self.figure.add_subplot(111)
             
-            projection = FinanceService.calculate_cashflow_projection(self.data.groups)
+            projection = FinanceService.calculate_cashflow_projection(self.data.groups, self.data.ledger)
             names = [p['name'] for p in projection]
             ins = [p['in'] for p in projection]
             outs = [p['out'] for p in projection]
@@ -97,3 +176,51 @@ class ReportsTab(QWidget):
             logs_text = "// Chưa có log nào."
             
         self.log_viewer.setText(logs_text)
+
+    def run_portfolio_report(self):
+        self.btn_portfolio.setEnabled(False)
+        self.portfolio_progress.setRange(0, max(len(self.data.groups), 1))
+        self.portfolio_progress.setValue(0)
+        self.portfolio_progress.setVisible(True)
+        self.lbl_portfolio.setText("Đang tính...")
+        self.portfolio_runner.start(self.data, os.cpu_count() or 1)
+
+    def on_portfolio_progress(self, done: int, total: int):
+        self.portfolio_progress.setRange(0, max(total, 1))
+        self.portfolio_progress.setValue(done)
+
+    def on_portfolio_finished(self, report):
+        self.btn_portfolio.setEnabled(True)
+        self.portfolio_progress.setVisible(False)
+        lines = [
+            f"Tổng hoa hồng: {report.totalCommission:,} đ",
+            f"Tổng nợ xấu: {report.totalBadDebt:,} đ",
+        ]
+        for p in report.groups:
+            lines.append(f"• {p.name} (kỳ {p.currentPeriod}/{p.totalPeriods}): "
+                         f"hoa hồng {p.commissionEarned:,} đ, nợ {p.badDebt:,} đ")
+        self.lbl_portfolio.setText("\n".join(lines))
+
+    def on_portfolio_failed(self, error: str):
+        self.btn_portfolio.setEnabled(True)
+        self.portfolio_progress.setVisible(False)
+        self.lbl_portfolio.setText(f"Lỗi: {error}")
+
+    def run_export(self, export, filename: str):
+        path, _ = QFileDialog.getSaveFileName(self, "Xuất Excel", filename, "Excel (*.xlsx)")
+        if not path:
+            return
+        for btn in self.export_buttons:
+            btn.setEnabled(False)
+        self.lbl_export.setText("Đang xuất...")
+        self.export_runner.start(export, self.data, path)
+
+    def on_export_finished(self, path: str, rows: int):
+        for btn in self.export_buttons:
+            btn.setEnabled(True)
+        self.lbl_export.setText(f"Đã xuất {rows:,} dòng: {path}")
+
+    def on_export_failed(self, error: str):
+        for btn in self.export_buttons:
+            btn.setEnabled(True)
+        self.lbl_export.setText(f"Lỗi: {error}")